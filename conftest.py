@@ -0,0 +1,5 @@
+"""Root pytest configuration.
+
+Its presence makes pytest put the repository root on sys.path, so the
+``src`` package imports in serial runs and in opt-in xdist workers alike.
+"""
@@ -1,21 +1,19 @@
 """Fatigue analyzer for calculating cognitive fatigue scores"""
+import importlib.util
+import logging
 from datetime import datetime, timedelta
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 import numpy as np
 from src.models.fatigue_score import FatigueScore, FatigueHistory
 from src.models.activity_data import ActivityData
 from src.utils.helpers import get_time_of_day_factor, normalize_score
 from src.utils.logger import default_logger as logger
 
-# ML imports
-try:
-    from src.ml.ml_predictor import MLPredictor
-    from src.ml.feature_engineering import FeatureEngineer
-    from src.ml.personalization import PersonalizationEngine
-    ML_AVAILABLE = True
-except ImportError as e:
-    logger.warning(f"ML module not available: {e}")
-    ML_AVAILABLE = False
+# ML components pull in scikit-learn, so they are imported only when an
+# analyzer actually enables ML
+ML_AVAILABLE = importlib.util.find_spec('sklearn') is not None
+if not ML_AVAILABLE:
+    logger.warning("ML module not available: scikit-learn is not installed")
 
 
 class FatigueAnalyzer:
@@ -31,6 +29,7 @@ class FatigueAnalyzer:
         self.history = FatigueHistory()
         # Baseline tracking
         self.baseline_activity_samples = []
+        self._baseline_sum = 0.0  # running total of baseline_activity_samples
         self._initial_activity_rate: Optional[float] = None
         self.baseline_activity_rate = 20.0
         
@@ -42,6 +41,10 @@ class FatigueAnalyzer:
         self.use_ml = use_ml and ML_AVAILABLE
         if self.use_ml:
             try:
+                from src.ml.ml_predictor import MLPredictor
+                from src.ml.feature_engineering import FeatureEngineer
+                from src.ml.personalization import PersonalizationEngine
+
                 self.feature_engineer = FeatureEngineer()
                 self.ml_predictor = MLPredictor(feature_engineer=self.feature_engineer)
                 self.personalization = PersonalizationEngine()
@@ -60,6 +63,7 @@ class FatigueAnalyzer:
         self._session_start_time = datetime.now()
         self._initial_activity_rate = None
         self.baseline_activity_samples = []
+        self._baseline_sum = 0.0
         self._session_fatigue_scores = []
         self._session_features = []
         
@@ -81,72 +85,190 @@ class FatigueAnalyzer:
         """
         # --- 1. Baseline Calibration Phase ---
         is_in_grace_period = work_duration_minutes < self.GRACE_PERIOD_MINUTES
-        
+
         if activity_rate > 0:
             if is_in_grace_period:
                 # Accumulate samples during grace period
                 self.baseline_activity_samples.append(activity_rate)
+                self._baseline_sum += activity_rate
                 # Live update of baseline
-                self._initial_activity_rate = sum(self.baseline_activity_samples) / len(self.baseline_activity_samples)
-                logger.debug(f"Calibrating baseline: {self._initial_activity_rate:.1f} (samples: {len(self.baseline_activity_samples)})")
+                self._initial_activity_rate = (
+                    self._baseline_sum / len(self.baseline_activity_samples))
+                logger.debug("Calibrating baseline: %.1f (samples: %d)",
+                             self._initial_activity_rate, len(self.baseline_activity_samples))
             elif self._initial_activity_rate is None and self.baseline_activity_samples:
                 # Finalize if we just exited grace period
-                self._initial_activity_rate = sum(self.baseline_activity_samples) / len(self.baseline_activity_samples)
+                self._initial_activity_rate = (
+                    self._baseline_sum / len(self.baseline_activity_samples))
             elif self._initial_activity_rate is None:
                 # Fallback if starting late
                 self._initial_activity_rate = activity_rate
 
         # Use 20.0 as safe default if still calibrating with no data
         baseline = self._initial_activity_rate if self._initial_activity_rate else 20.0
-        
+
+        factors, final_score_rule = self._compute_score(
+            work_duration_minutes, activity_rate, time_since_break_minutes,
+            is_on_break, blink_rate, baseline)
+
+        # ML PREDICTION (if available)
+        ml_score = None
+        ml_confidence = 0.0
+        ml_weight = 0.0
+
+        if self.use_ml:
+            try:
+                # Extract features
+                features = self.feature_engineer.extract_features(
+                    current_time=datetime.now(),
+                    blink_rate=blink_rate,
+                    session_duration_minutes=work_duration_minutes,
+                    time_since_break_minutes=time_since_break_minutes
+                )
+
+                # Get ML prediction
+                # Note: ml_predictor returns (50.0, 0.0) if not initialized/confident
+                ml_score, ml_confidence = self.ml_predictor.predict(features)
+
+                # Only use ML if confidence is reasonable
+                factors['ml_score'] = ml_score
+                factors['ml_confidence'] = ml_confidence
+
+                # Get personalized weight
+                ml_weight = self.personalization.get_personalized_prediction_weight()
+
+                # Special startup logic for ML:
+                # If we have low confidence, ignore ML (it defaults to 50,
+                # which is too high for startup)
+                if ml_confidence < 0.2:
+                    ml_weight = 0.0
+
+                if ml_score is not None and ml_weight > 0:
+                    final_score = (
+                        ml_weight * ml_score +
+                        (1 - ml_weight) * final_score_rule
+                    )
+                    factors['prediction_method'] = 'hybrid'
+                    logger.debug("Hybrid prediction: ML=%.1f (w=%.2f), Rule=%.1f, Final=%.1f",
+                                 ml_score, ml_weight, final_score_rule, final_score)
+                else:
+                    final_score = final_score_rule
+                    factors['prediction_method'] = 'rule_based'
+
+            except Exception as e:
+                logger.error(f"Error in ML prediction: {e}")
+                final_score = final_score_rule
+                factors['prediction_method'] = 'rule_based'
+        else:
+            final_score = final_score_rule
+            factors['prediction_method'] = 'rule_based'
+
+        # --- 4. Startup Damping ---
+        if is_in_grace_period:
+            # During grace period, limit the maximum score to avoid false alarms
+            # Allow some growth but cap it (e.g. max 25) unless it's critical
+            original_score = final_score
+            final_score = min(final_score, 25.0)
+            logger.debug("Grace period damping: %.1f -> %.1f (Time: %.1fm)",
+                         original_score, final_score, work_duration_minutes)
+
+        # Clamp to 0-100
+        final_score = max(0, min(100, final_score))
+
+        # Create fatigue score object
+        fatigue_score = FatigueScore(
+            score=final_score,
+            timestamp=datetime.now(),
+            factors=factors
+        )
+
+        # Add to history
+        self.history.add_score(fatigue_score)
+
+        # Track for ML training
+        if self.use_ml:
+            self._session_fatigue_scores.append(final_score)
+            # Add fatigue score to feature engineer for historical features
+            self.feature_engineer.add_fatigue_score(final_score)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Calculated fatigue score: %.1f (%s)",
+                         final_score, fatigue_score.get_level())
+
+        return fatigue_score
+
+    def _compute_score(
+        self,
+        work_duration_minutes: float,
+        activity_rate: float,
+        time_since_break_minutes: float,
+        is_on_break: bool,
+        blink_rate: float,
+        baseline: float
+    ) -> Tuple[dict, float]:
+        """
+        Compute the rule-based fatigue score without touching analyzer state.
+
+        Args:
+            work_duration_minutes: Minutes worked this session
+            activity_rate: Current activity rate
+            time_since_break_minutes: Minutes since the last break
+            is_on_break: Whether the user is on a break
+            blink_rate: Blinks per minute
+            baseline: Baseline activity rate
+
+        Returns:
+            Tuple of (factors, score clamped to 0-100)
+        """
         factors = {}
-        
+
         # --- 2. RULE-BASED CALCULATION ---
-        
+
         # A. Time-based fatigue (0-35 points)
         time_factor = min(work_duration_minutes / 120, 1.0) * 35
         factors['time_based'] = time_factor
-        
+
         # B. Activity intensity (0-35 points)
         if baseline > 0:
             activity_ratio = activity_rate / baseline
-            
-            # Decline factor: fatigue increases when activity drops significantly below baseline (boredom/fatigue)
+
+            # Decline factor: fatigue increases when activity drops
+            # significantly below baseline (boredom/fatigue)
             decline_factor = max(0, (1.0 - min(activity_ratio, 1.0))) * 15
-            
+
             # Intensity factor: fatigue increases with sustained high activity
             if activity_ratio > 1.0:
                 intensity_excess = min((activity_ratio - 1.0), 2.0)
                 intensity_factor = (intensity_excess / 2.0) * 20
             else:
                 intensity_factor = 0
-            
+
             factors['activity_decline'] = decline_factor
             factors['activity_intensity'] = intensity_factor
         else:
             factors['activity_decline'] = 0
             factors['activity_intensity'] = 0
-        
+
         # 3. Break recency factor (0-20 points)
         break_factor = min(time_since_break_minutes / 60, 1.0) * 20
         factors['break_recency'] = break_factor
-        
+
         # 4. Time of day factor (multiplier 0.8-1.3)
         tod_factor = get_time_of_day_factor()
         factors['time_of_day_multiplier'] = tod_factor
-        
+
         # 5. Session duration factor (0-15 points)
         session_duration_hours = work_duration_minutes / 60
         duration_factor = min(session_duration_hours / 4, 1.0) * 15
         factors['session_duration'] = duration_factor
-        
+
         # 6. Blink rate factor (0-15 points) - Smoother penalty
         # 6. Blink rate factor (0-15 points) - Smoother penalty with Flow State logic
         if blink_rate > 0:
             # Penalties start below 12 blinks/min, max 15 points at 0 blinks/min
             if blink_rate < 12:
                 raw_blink_factor = min(15.0, (12.0 - blink_rate) * 1.25)
-                
+
                 # FLOW STATE CHECK:
                 # If activity is high (> 80% of baseline), low blink rate might indicate focus/flow
                 # Reduce penalty significantly in this case
@@ -154,25 +276,30 @@ class FatigueAnalyzer:
                     current_activity_ratio = activity_rate / baseline
                     if current_activity_ratio > 0.8:
                         # Damping factor: 1.0 at 0.8 ratio, dropping to 0.0 at 1.5 ratio
-                        # This means if you are working very hard (1.5x baseline), blink penalty is removed
+                        # This means if you are working very hard (1.5x
+                        # baseline), blink penalty is removed
                         flow_damping = max(0.0, 1.0 - (current_activity_ratio - 0.8) * 1.5)
                         blink_factor = raw_blink_factor * flow_damping
                         if flow_damping < 1.0:
-                            logger.debug(f"Flow state detected (ratio {current_activity_ratio:.2f}), damping blink penalty: {raw_blink_factor:.1f} -> {blink_factor:.1f}")
+                            logger.debug(
+                                "Flow state detected (ratio %.2f), damping "
+                                "blink penalty: %.1f -> %.1f",
+                                current_activity_ratio, raw_blink_factor,
+                                blink_factor)
                     else:
                         blink_factor = raw_blink_factor
                 else:
                     blink_factor = raw_blink_factor
             else:
                 blink_factor = 0
-            
+
             factors['blink_rate'] = blink_rate
             factors['eye_strain'] = blink_factor
         else:
             # If rate is 0 (sensor blocked or just started), don't penalize heavily immediately
             blink_factor = 0
             factors['eye_strain'] = 0
-        
+
         # Calculate rule-based score
         base_score = (
             time_factor +
@@ -183,95 +310,68 @@ class FatigueAnalyzer:
             blink_factor
         )
         final_score_rule = base_score * tod_factor
-        
+
         if is_on_break:
             final_score_rule *= 0.5
             factors['on_break_reduction'] = True
-        
+
         final_score_rule = max(0, min(100, final_score_rule))
-        
-        # ML PREDICTION (if available)
-        ml_score = None
-        ml_confidence = 0.0
-        ml_weight = 0.0
-        
-        if self.use_ml:
-            try:
-                # Extract features
-                features = self.feature_engineer.extract_features(
-                    current_time=datetime.now(),
-                    blink_rate=blink_rate,
-                    session_duration_minutes=work_duration_minutes,
-                    time_since_break_minutes=time_since_break_minutes
-                )
-                
-                # Get ML prediction
-                # Note: ml_predictor returns (50.0, 0.0) if not initialized/confident
-                ml_score, ml_confidence = self.ml_predictor.predict(features)
-                
-                # Only use ML if confidence is reasonable
-                factors['ml_score'] = ml_score
-                factors['ml_confidence'] = ml_confidence
-                
-                # Get personalized weight
-                ml_weight = self.personalization.get_personalized_prediction_weight()
-                
-                # Special startup logic for ML:
-                # If we have low confidence, ignore ML (it defaults to 50 which is too high for startup)
-                if ml_confidence < 0.2:
-                    ml_weight = 0.0
-                
-                if ml_score is not None and ml_weight > 0:
-                    final_score = (
-                        ml_weight * ml_score + 
-                        (1 - ml_weight) * final_score_rule
-                    )
-                    factors['prediction_method'] = 'hybrid'
-                    logger.debug(f"Hybrid prediction: ML={ml_score:.1f} (w={ml_weight:.2f}), Rule={final_score_rule:.1f}, Final={final_score:.1f}")
-                else:
-                    final_score = final_score_rule
-                    factors['prediction_method'] = 'rule_based'
-                    
-            except Exception as e:
-                logger.error(f"Error in ML prediction: {e}")
-                final_score = final_score_rule
-                factors['prediction_method'] = 'rule_based'
-        else:
-            final_score = final_score_rule
-            factors['prediction_method'] = 'rule_based'
-        
-        
-        # --- 4. Startup Damping ---
-        if is_in_grace_period:
-            # During grace period, limit the maximum score to avoid false alarms
-            # Allow some growth but cap it (e.g. max 25) unless it's critical
-            original_score = final_score
-            final_score = min(final_score, 25.0)
-            logger.debug(f"Grace period damping: {original_score:.1f} -> {final_score:.1f} (Time: {work_duration_minutes:.1f}m)")
 
-        # Clamp to 0-100
-        final_score = max(0, min(100, final_score))
-        
-        # Create fatigue score object
-        fatigue_score = FatigueScore(
-            score=final_score,
-            timestamp=datetime.now(),
-            factors=factors
-        )
-        
-        # Add to history
-        self.history.add_score(fatigue_score)
-        
-        # Track for ML training
-        if self.use_ml:
-            self._session_fatigue_scores.append(final_score)
-            # Add fatigue score to feature engineer for historical features
-            self.feature_engineer.add_fatigue_score(final_score)
-        
-        logger.debug(f"Calculated fatigue score: {final_score:.1f} ({fatigue_score.get_level()})")
-        
-        return fatigue_score
-    
+        return factors, final_score_rule
+
+    def calculate_scores_batch(
+        self,
+        work_duration_minutes,
+        activity_rate,
+        time_since_break_minutes,
+        blink_rate
+    ) -> np.ndarray:
+        """
+        Calculate rule-based fatigue scores for many samples at once.
+
+        Vectorized form of _compute_score (kept in step with it by
+        tests/test_fatigue_analyzer.py), applied against the current
+        baseline without calibration, ML blending or history.
+
+        Args:
+            work_duration_minutes: Array of work durations
+            activity_rate: Array of activity rates
+            time_since_break_minutes: Array of minutes since last break
+            blink_rate: Array of blink rates
+
+        Returns:
+            Array of scores (0-100)
+        """
+        work = np.asarray(work_duration_minutes, dtype=np.float64)
+        activity = np.asarray(activity_rate, dtype=np.float64)
+        since_break = np.asarray(time_since_break_minutes, dtype=np.float64)
+        blink = np.asarray(blink_rate, dtype=np.float64)
+
+        baseline = self._initial_activity_rate if self._initial_activity_rate else 20.0
+        ratio = activity / baseline
+
+        time_factor = np.minimum(work / 120, 1.0) * 35
+        decline_factor = (1.0 - np.minimum(ratio, 1.0)) * 15
+        intensity_factor = np.clip(ratio - 1.0, 0.0, 2.0) / 2.0 * 20
+        break_factor = np.minimum(since_break / 60, 1.0) * 20
+        duration_factor = np.minimum(work / 240, 1.0) * 15
+
+        # Eye strain below 12 blinks/min, damped in flow state (ratio > 0.8)
+        raw_blink = np.minimum(15.0, (12.0 - blink) * 1.25)
+        flow_damping = np.where(
+            ratio > 0.8, np.maximum(0.0, 1.0 - (ratio - 0.8) * 1.5), 1.0)
+        blink_factor = np.where((blink > 0) & (blink < 12),
+                                raw_blink * flow_damping, 0.0)
+
+        scores = (time_factor + decline_factor + intensity_factor +
+                  break_factor + duration_factor + blink_factor)
+        scores *= get_time_of_day_factor()
+        np.clip(scores, 0, 100, out=scores)
+
+        # Startup damping, as in calculate_score
+        return np.where(work < self.GRACE_PERIOD_MINUTES,
+                        np.minimum(scores, 25.0), scores)
+
     def get_recommendations(self, score: FatigueScore) -> list:
         """
         Get text-based advice based on fatigue score.
@@ -1,15 +1,73 @@
 """Statistics Manager for aggregating user data"""
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 import json
+import threading
+import numpy as np
 from src.storage.data_manager import DataManager
 from src.utils.logger import default_logger as logger
 
+# Row layout of get_weekly_summary_array()
+WEEKLY_DTYPE = np.dtype([
+    ('date', 'U10'),
+    ('full_date', 'U10'),
+    ('active_hours', 'f4'),
+    ('avg_fatigue', 'f4')
+])
+
+
 class StatisticsManager:
     """Aggregates data for statistics dashboard"""
     
     def __init__(self, data_manager: DataManager):
         self.data_manager = data_manager
+        # Per-tick memo of storage reads, one per thread so the stats
+        # worker and the Tk thread never share it; unset outside tick_cache()
+        self._local = threading.local()
+
+    @contextmanager
+    def tick_cache(self):
+        """
+        Memoize storage reads for the duration of the block.
+
+        The dashboard getters overlap heavily (several read the same
+        recent sessions and their fatigue scores); inside this block each
+        distinct query hits the DataManager once. The cache belongs to the
+        calling thread; a nested block reuses the outer one.
+        """
+        outer = getattr(self._local, 'cache', None)
+        if outer is None:
+            self._local.cache = {}
+        try:
+            yield self
+        finally:
+            if outer is None:
+                self._local.cache = None
+
+    def _cached(self, key: tuple, fetch):
+        """Return fetch() memoized under key while a tick cache is active"""
+        cache = getattr(self._local, 'cache', None)
+        if cache is None:
+            return fetch()
+        if key not in cache:
+            cache[key] = fetch()
+        return cache[key]
+
+    def _recent_sessions(self, days: int) -> list:
+        return self._cached(
+            ('sessions', days),
+            lambda: self.data_manager.get_recent_sessions(days=days))
+
+    def _fatigue_scores(self, session_id: str) -> list:
+        return self._cached(
+            ('scores', session_id),
+            lambda: self.data_manager.get_fatigue_scores(session_id))
+
+    def _activity_history(self, days: int) -> list:
+        return self._cached(
+            ('activities', days),
+            lambda: self.data_manager.get_activity_history(days=days))
 
     def get_weekly_summary(self, days: int = 7) -> List[Dict]:
         """
@@ -21,11 +79,11 @@ class StatisticsManager:
         start_date = end_date - timedelta(days=days-1)
         
         # Get all sessions in range
-        sessions = self.data_manager.get_recent_sessions(days=days)
+        sessions = self._recent_sessions(days)
         
         # Fallback: If no sessions in last 7 days, try 30 days to show *something*
         if not sessions and days < 30:
-            sessions = self.data_manager.get_recent_sessions(days=30)
+            sessions = self._recent_sessions(30)
             # Adjust start date to match the data we found, or keep it as is
             if sessions:
                  start_date = datetime.now() - timedelta(days=29)
@@ -48,7 +106,7 @@ class StatisticsManager:
                 total_seconds += duration
                 
                 # Get fatigue scores for this session
-                scores = self.data_manager.get_fatigue_scores(session.session_id)
+                scores = self._fatigue_scores(session.session_id)
                 if scores:
                     fatigue_sum += sum(s.score for s in scores)
                     fatigue_count += len(scores)
@@ -67,12 +125,26 @@ class StatisticsManager:
             
         return summary
 
+    def get_weekly_summary_array(self, days: int = 7) -> np.ndarray:
+        """
+        Get the weekly summary as a structured array (see WEEKLY_DTYPE).
+
+        Returns:
+            Array with one row per day; columns can be passed straight to
+            matplotlib without per-field list building
+        """
+        summary = self.get_weekly_summary(days)
+        return np.array(
+            [(d['date'], d['full_date'], d['active_hours'], d['avg_fatigue'])
+             for d in summary],
+            dtype=WEEKLY_DTYPE)
+
     def get_productivity_stats(self, days: int = 7) -> Dict:
         """
         Get productivity metrics.
         Returns: {'focus_score': float, 'peak_hour': str}
         """
-        sessions = self.data_manager.get_recent_sessions(days=days)
+        sessions = self._recent_sessions(days)
         
         total_actions = 0
         total_minutes = 0
@@ -111,7 +183,7 @@ class StatisticsManager:
         Get break effectiveness stats.
         Returns: {'recovery_rate': float, 'total_breaks': int}
         """
-        history = self.data_manager.get_activity_history(days=days)
+        history = self._activity_history(days)
         
         total_drop = 0
         count = 0
@@ -138,7 +210,7 @@ class StatisticsManager:
         Returns formatted string "Today: HH:MM" or "Last: HH:MM"
         """
         # Try today first
-        sessions = self.data_manager.get_recent_sessions(days=1)
+        sessions = self._recent_sessions(1)
         today_str = datetime.now().strftime("%Y-%m-%d")
         total_seconds = 0
         target_date = "Today"
@@ -151,7 +223,7 @@ class StatisticsManager:
         
         # If no time today, look back 7 days for last active
         if total_seconds == 0:
-            sessions = self.data_manager.get_recent_sessions(days=7)
+            sessions = self._recent_sessions(7)
             if sessions:
                 last_session = sessions[-1]
                 target_date_obj = last_session.start_time
@@ -173,7 +245,7 @@ class StatisticsManager:
         """
         Get total input events (keys + clicks) for the last 7 days.
         """
-        sessions = self.data_manager.get_recent_sessions(days=7)
+        sessions = self._recent_sessions(7)
         return sum(s.total_activity_count for s in sessions)
 
     def get_fatigue_distribution(self, days: int = 7) -> Dict[str, float]:
@@ -181,13 +253,13 @@ class StatisticsManager:
         Get distribution of time spent in each fatigue zone.
         Returns dict with percentage for 'Low', 'Medium', 'High', 'Critical'.
         """
-        sessions = self.data_manager.get_recent_sessions(days=days)
+        sessions = self._recent_sessions(days)
         
         counts = {'Low': 0, 'Medium': 0, 'High': 0, 'Critical': 0}
         total_samples = 0
         
         for session in sessions:
-            scores = self.data_manager.get_fatigue_scores(session.session_id)
+            scores = self._fatigue_scores(session.session_id)
             for s in scores:
                 level = s.get_level()
                 if level in counts:
@@ -205,7 +277,7 @@ class StatisticsManager:
         Returns list of dicts: {'name': str, 'icon': str, 'description': str}
         """
         badges = []
-        sessions = self.data_manager.get_recent_sessions(days=days)
+        sessions = self._recent_sessions(days)
         
         # 1. Consistency Badge (Sessions on >= 5 days)
         active_days = set()
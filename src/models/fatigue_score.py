@@ -1,6 +1,16 @@
 """Fatigue score model for tracking cognitive fatigue levels"""
 from datetime import datetime
 from typing import Optional, List
+from bisect import bisect_right
+
+# One entry per band between FatigueScore thresholds, lowest first
+_LEVELS = ("Low", "Moderate", "High", "Critical")
+_LEVEL_COLORS = (
+    "#4CAF50",  # Green
+    "#FFC107",  # Yellow
+    "#FF9800",  # Orange
+    "#F44336",  # Red
+)
 
 
 class FatigueScore:
@@ -10,6 +20,7 @@ class FatigueScore:
     LOW_THRESHOLD = 30
     MEDIUM_THRESHOLD = 60
     HIGH_THRESHOLD = 80
+    _THRESHOLDS = (LOW_THRESHOLD, MEDIUM_THRESHOLD, HIGH_THRESHOLD)
 
     def __init__(
         self,
@@ -29,27 +40,17 @@ class FatigueScore:
         self.timestamp = timestamp or datetime.now()
         self.factors = factors or {}
 
+    def _level_index(self) -> int:
+        """Index of the score's band in _THRESHOLDS order (0 = low)"""
+        return bisect_right(self._THRESHOLDS, self.score)
+
     def get_level(self) -> str:
         """Get fatigue level as a string"""
-        if self.score < self.LOW_THRESHOLD:
-            return "Low"
-        elif self.score < self.MEDIUM_THRESHOLD:
-            return "Moderate"
-        elif self.score < self.HIGH_THRESHOLD:
-            return "High"
-        else:
-            return "Critical"
+        return _LEVELS[self._level_index()]
 
     def get_color(self) -> str:
         """Get color representation for UI"""
-        if self.score < self.LOW_THRESHOLD:
-            return "#4CAF50"  # Green
-        elif self.score < self.MEDIUM_THRESHOLD:
-            return "#FFC107"  # Yellow
-        elif self.score < self.HIGH_THRESHOLD:
-            return "#FF9800"  # Orange
-        else:
-            return "#F44336"  # Red
+        return _LEVEL_COLORS[self._level_index()]
 
     def needs_break(self) -> bool:
         """Check if user needs a break"""
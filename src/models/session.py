@@ -2,10 +2,24 @@
 from datetime import datetime, timedelta
 from typing import Optional, List
 
+# Plain fields restored by Session.from_dict, with their defaults
+_SERIAL_DEFAULTS = (
+    ('is_active', True),
+    ('total_activity_count', 0),
+    ('keyboard_count', 0),
+    ('mouse_click_count', 0),
+)
+
 
 class Session:
     """Represents a work session with breaks"""
 
+    __slots__ = (
+        'session_id', 'start_time', 'end_time', 'breaks', 'is_active',
+        'total_activity_count', 'keyboard_count', 'mouse_click_count',
+        '_cached_stats'
+    )
+
     def __init__(
         self,
         session_id: Optional[str] = None,
@@ -26,6 +40,7 @@ class Session:
         self.total_activity_count = 0
         self.keyboard_count = 0
         self.mouse_click_count = 0
+        self._cached_stats: Optional[dict] = None
 
     @staticmethod
     def _generate_session_id() -> str:
@@ -40,11 +55,13 @@ class Session:
         break_data = {'start': start_time, 'end': end_time, 'duration': (
             end_time - start_time).total_seconds() if end_time else None}
         self.breaks.append(break_data)
+        self._cached_stats = None
 
     def end_session(self, end_time: Optional[datetime] = None):
         """End the current session"""
         self.end_time = end_time or datetime.now()
         self.is_active = False
+        self._cached_stats = None
 
     def get_duration(self) -> timedelta:
         """Get total session duration"""
@@ -60,11 +77,19 @@ class Session:
         return total_duration - timedelta(seconds=break_duration)
 
     def get_stats(self) -> dict:
-        """Get session statistics"""
+        """
+        Get session statistics.
+
+        Once the session has ended the result is cached until the session
+        is ended again or a break is added; callers get their own copy.
+        """
+        if self._cached_stats is not None:
+            return dict(self._cached_stats)
+
         duration = self.get_duration()
         work_duration = self.get_work_duration()
 
-        return {
+        stats = {
             'session_id': self.session_id,
             'start_time': self.start_time.isoformat(),
             'end_time': self.end_time.isoformat() if self.end_time else None,
@@ -76,6 +101,21 @@ class Session:
             'mouse_click_count': self.mouse_click_count,
             'is_active': self.is_active
         }
+        # Durations of an active session depend on the current time
+        if self.end_time is not None:
+            self._cached_stats = dict(stats)
+        return stats
+
+    def breaks_to_list(self) -> List[dict]:
+        """Convert breaks to their stored form (ISO timestamps)"""
+        return [
+            {
+                'start': b['start'].isoformat(),
+                'end': b['end'].isoformat() if b['end'] else None,
+                'duration': b['duration']
+            }
+            for b in self.breaks
+        ]
 
     def to_dict(self) -> dict:
         """Convert to dictionary for storage"""
@@ -83,14 +123,7 @@ class Session:
             'session_id': self.session_id,
             'start_time': self.start_time.isoformat(),
             'end_time': self.end_time.isoformat() if self.end_time else None,
-            'breaks': [
-                {
-                    'start': b['start'].isoformat(),
-                    'end': b['end'].isoformat() if b['end'] else None,
-                    'duration': b['duration']
-                }
-                for b in self.breaks
-            ],
+            'breaks': self.breaks_to_list(),
             'is_active': self.is_active,
             'total_activity_count': self.total_activity_count,
             'keyboard_count': self.keyboard_count,
@@ -100,23 +133,24 @@ class Session:
     @classmethod
     def from_dict(cls, data: dict) -> 'Session':
         """Create Session from dictionary"""
-        session = cls(
-            session_id=data['session_id'],
-            start_time=datetime.fromisoformat(data['start_time'])
-        )
-        if data.get('end_time'):
-            session.end_time = datetime.fromisoformat(data['end_time'])
-        session.is_active = data.get('is_active', True)
-        session.total_activity_count = data.get('total_activity_count', 0)
-        session.keyboard_count = data.get('keyboard_count', 0)
-        session.mouse_click_count = data.get('mouse_click_count', 0)
-
-        for b in data.get('breaks', []):
-            session.breaks.append({
+        # Fill the slots directly; __init__ defaults would only be
+        # overwritten here
+        session = cls.__new__(cls)
+        session.session_id = data['session_id']
+        session.start_time = datetime.fromisoformat(data['start_time'])
+        end_time = data.get('end_time')
+        session.end_time = datetime.fromisoformat(end_time) if end_time else None
+        session.breaks = [
+            {
                 'start': datetime.fromisoformat(b['start']),
                 'end': datetime.fromisoformat(b['end']) if b['end'] else None,
                 'duration': b['duration']
-            })
+            }
+            for b in data.get('breaks', [])
+        ]
+        for name, default in _SERIAL_DEFAULTS:
+            setattr(session, name, data.get(name, default))
+        session._cached_stats = None
 
         return session
 
@@ -107,6 +107,35 @@ class TimeTracker:
         remaining = self.work_interval - work_time
         return max(timedelta(), remaining)
 
+    def get_snapshot(self) -> dict:
+        """
+        Get current timing values in one pass.
+
+        Returns:
+            Dict with work_time, session_time, time_until_break (timedeltas)
+            and is_on_break; work time is computed once and reused
+        """
+        if not self.current_session:
+            return {
+                'work_time': timedelta(),
+                'session_time': timedelta(),
+                'time_until_break': timedelta(),
+                'is_on_break': self.is_on_break
+            }
+
+        work_time = self.current_session.get_work_duration()
+        if self.is_on_break:
+            time_until_break = timedelta()
+        else:
+            time_until_break = max(timedelta(), self.work_interval - work_time)
+
+        return {
+            'work_time': work_time,
+            'session_time': self.current_session.get_duration(),
+            'time_until_break': time_until_break,
+            'is_on_break': self.is_on_break
+        }
+
     def should_take_break(self) -> bool:
         """Check if it's time for a break"""
         if not self.current_session or self.is_on_break:
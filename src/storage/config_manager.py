@@ -70,10 +70,22 @@ class ConfigManager:
         Returns:
             Configuration value
         """
-        keys = key.split('.')
+        return self.get_path(tuple(key.split('.')), default)
+
+    def get_path(self, path: tuple, default: Any = None) -> Any:
+        """
+        Get configuration value by a pre-split key path.
+
+        Args:
+            path: Key components, e.g. ('ui', 'theme')
+            default: Default value if key not found
+
+        Returns:
+            Configuration value
+        """
         value = self._config
 
-        for k in keys:
+        for k in path:
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
@@ -102,12 +114,51 @@ class ConfigManager:
         config[keys[-1]] = value
         logger.debug(f"Set config {key} = {value}")
 
+    def update(self, values: dict):
+        """
+        Set several configuration values and save once.
+
+        Args:
+            values: Mapping of configuration keys (dot notation) to values
+        """
+        for key, value in values.items():
+            *parents, leaf = key.split('.')
+            config = self._config
+            for k in parents:
+                config = config.setdefault(k, {})
+            config[leaf] = value
+        logger.debug(f"Updated {len(values)} config values")
+        self.save()
+
+    def snapshot(self) -> dict:
+        """
+        Get a flat copy of the configuration keyed by dotted path.
+
+        Returns:
+            Dict mapping keys such as 'alerts.alert_cooldown_minutes' to
+            their values, for callers that read many settings at once
+        """
+        flat = {}
+        stack = [('', self._config)]
+        while stack:
+            prefix, node = stack.pop()
+            for k, v in node.items():
+                key = f"{prefix}{k}"
+                if isinstance(v, dict):
+                    stack.append((f"{key}.", v))
+                else:
+                    flat[key] = v
+        return flat
+
     def save(self):
         """Save current configuration to user config file"""
         try:
             self.config_dir.mkdir(parents=True, exist_ok=True)
-            with open(self.user_config_path, 'w') as f:
-                json.dump(self._config, f, indent=2)
+            # Encode in one pass and hand the file a single write; json.dump
+            # streams many small chunks through the pure-Python encoder
+            data = json.dumps(self._config, indent=2)
+            with open(self.user_config_path, 'w', buffering=65536) as f:
+                f.write(data)
             logger.info("Saved user configuration")
         except Exception as e:
             logger.error(f"Failed to save config: {e}")
@@ -3,36 +3,69 @@ import sqlite3
 import json
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from src.models.session import Session
 from src.models.activity_data import ActivityData
 from src.models.fatigue_score import FatigueScore
 from src.utils.logger import default_logger as logger
 
+_INSERT_SESSION_SQL = """
+    INSERT OR REPLACE INTO sessions
+    (session_id, start_time, end_time, breaks, is_active, total_activity_count)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+
+class _SharedConnection(sqlite3.Connection):
+    """Connection kept open across close() calls (backs in-memory databases)"""
+
+    def close(self):
+        pass
+
 
 class DataManager:
     """Manages data persistence using SQLite database"""
 
+    MEMORY = ":memory:"
+
     def __init__(self, db_path: Optional[Path] = None):
         """
         Initialize data manager.
 
         Args:
-            db_path: Path to database file
+            db_path: Path to database file, or ":memory:" for a private
+                in-memory database (e.g. in tests)
         """
         if db_path is None:
             db_path = Path(__file__).parent.parent.parent / \
                 "data" / "fatigue_tracker.db"
 
-        self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # An in-memory database lives only as long as its connection, so
+        # one connection is kept for the manager's lifetime
+        self._shared_conn: Optional[sqlite3.Connection] = None
+        if str(db_path) == self.MEMORY:
+            self.db_path = Path(self.MEMORY)
+            self._shared_conn = sqlite3.connect(
+                self.MEMORY, factory=_SharedConnection,
+                check_same_thread=False)
+            self._shared_conn.row_factory = sqlite3.Row
+        else:
+            self.db_path = Path(db_path)
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
         self._init_database()
 
     def _get_connection(self) -> sqlite3.Connection:
         """Get database connection"""
+        if self._shared_conn is not None:
+            return self._shared_conn
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
+        # With WAL (set once in _init_database), NORMAL only syncs at
+        # checkpoints instead of on every commit
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-20000")  # ~20 MB page cache
         return conn
 
     def _init_database(self):
@@ -40,6 +73,10 @@ class DataManager:
         conn = self._get_connection()
         cursor = conn.cursor()
 
+        # Write-ahead logging persists in the database file; appends to the
+        # WAL instead of rewriting pages through a rollback journal
+        cursor.execute("PRAGMA journal_mode=WAL")
+
         # Sessions table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS sessions (
@@ -111,29 +148,57 @@ class DataManager:
         logger.info("Database initialized")
 
     # Session operations
+    @staticmethod
+    def _session_params(session: Session) -> tuple:
+        """Row values for the sessions table"""
+        # Read the columns straight off the session; to_dict would also
+        # build the counters and a dict per call only to be unpacked here
+        end_time = session.end_time
+        return (
+            session.session_id,
+            session.start_time.isoformat(),
+            end_time.isoformat() if end_time else None,
+            json.dumps(session.breaks_to_list()) if session.breaks else '[]',
+            1 if session.is_active else 0,
+            session.total_activity_count
+        )
+
     def save_session(self, session: Session):
         """Save or update a session"""
         conn = self._get_connection()
         cursor = conn.cursor()
 
-        data = session.to_dict()
-        cursor.execute("""
-            INSERT OR REPLACE INTO sessions
-            (session_id, start_time, end_time, breaks, is_active, total_activity_count)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (
-            data['session_id'],
-            data['start_time'],
-            data['end_time'],
-            json.dumps(data['breaks']),
-            1 if data['is_active'] else 0,
-            data['total_activity_count']
-        ))
+        cursor.execute(_INSERT_SESSION_SQL, self._session_params(session))
 
         conn.commit()
         conn.close()
         logger.debug(f"Saved session {session.session_id}")
 
+    def save_sessions_bulk(self, sessions: Iterable[Session]):
+        """
+        Save or update many sessions in a single transaction.
+
+        Args:
+            sessions: Sessions to save (any iterable, consumed lazily);
+                either all are written or none
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        try:
+            # One prepared statement for every row; rows are built as
+            # SQLite consumes them
+            cursor.executemany(
+                _INSERT_SESSION_SQL, map(self._session_params, sessions))
+            saved = cursor.rowcount
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+        logger.debug(f"Saved {saved} sessions")
+
     def load_session(self, session_id: str) -> Optional[Session]:
         """Load a session by ID"""
         conn = self._get_connection()
@@ -156,6 +221,13 @@ class DataManager:
             return Session.from_dict(data)
         return None
 
+    def count_sessions(self) -> int:
+        """Get the number of stored sessions"""
+        conn = self._get_connection()
+        row = conn.execute("SELECT COUNT(*) FROM sessions").fetchone()
+        conn.close()
+        return int(row[0])
+
     def get_active_session(self) -> Optional[Session]:
         """Get the currently active session"""
         conn = self._get_connection()
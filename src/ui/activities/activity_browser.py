@@ -1,5 +1,6 @@
 """Activity browser widget for selecting and launching refresh activities"""
 import customtkinter as ctk
+from functools import partial
 from .activity_definitions import (
     Activity,
     ActivityCategory,
@@ -75,7 +76,7 @@ class ActivityBrowser(ctk.CTkFrame):
         for label, cat, color in categories:
             btn_config = {
                 "text": label,
-                "command": lambda c=cat: self._filter_by_category(c),
+                "command": partial(self._filter_by_category, cat),
                 "font": ctk.CTkFont(
                     size=12,
                     weight="bold"),
@@ -406,7 +407,7 @@ class ActivityBrowser(ctk.CTkFrame):
         try_btn = ctk.CTkButton(
             content,
             text="▶️ Try This Activity",
-            command=lambda a=activity: self._open_activity_demo(a),
+            command=partial(self._open_activity_demo, activity),
             font=ctk.CTkFont(size=14, weight="bold"),
             fg_color=activity.color,
             hover_color=self._darken_color(activity.color),
@@ -1,16 +1,29 @@
 """Chart widgets for visualizing fatigue and activity data"""
 import customtkinter as ctk
 from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from datetime import datetime, timedelta
-from typing import List, Tuple
+from typing import List, Optional, Sequence, Tuple
+import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
 
 
 class ActivityChart(ctk.CTkFrame):
     """Chart showing activity rate over time"""
 
-    def __init__(self, master, **kwargs):
+    SERIES_COLORS = ('#3b82f6', '#10b981', '#f59e0b', '#8b5cf6')
+
+    def __init__(self, master, labels: Optional[Sequence[str]] = None, **kwargs):
+        """
+        Initialize activity chart.
+
+        Args:
+            master: Parent widget
+            labels: Series labels; with more than one label the chart plots
+                (timestamp, rate, count1, count2, ...) rows, with the rate
+                on its own right-hand axis and the counts on the left
+        """
         super().__init__(master, **kwargs)
 
         # Configure matplotlib for dark theme
@@ -26,15 +39,22 @@ class ActivityChart(ctk.CTkFrame):
         self.canvas.get_tk_widget().pack(fill="both", expand=True)
 
         # Initialize empty data
-        self.timestamps = []
-        self.values = []
+        self.timestamps: List[datetime] = []
+        self.values: List[float] = []
+        self.labels = list(labels) if labels else []
+        self.series: List[List[float]] = []
+        self.lines: List[Line2D] = []
+        # The rate and the cumulative counts have different scales
+        self.rate_ax = self.ax.twinx() if len(self.labels) > 1 else None
 
         self._setup_chart()
 
     def _setup_chart(self):
         """Setup chart appearance"""
         self.ax.set_xlabel('Time', color='#94a3b8', fontsize=10)
-        self.ax.set_ylabel('Events/Min', color='#94a3b8', fontsize=10)
+        self.ax.set_ylabel(
+            'Count' if len(self.labels) > 1 else 'Events/Min',
+            color='#94a3b8', fontsize=10)
         self.ax.tick_params(colors='#94a3b8', labelsize=9)
         self.ax.grid(True, alpha=0.1, color='#475569', linestyle='--')
 
@@ -43,17 +63,30 @@ class ActivityChart(ctk.CTkFrame):
             spine.set_edgecolor('#334155')
             spine.set_linewidth(1)
 
-    def update_data(self, data: List[Tuple[datetime, float]]):
+        if self.rate_ax is not None:
+            self.rate_ax.set_ylabel('Events/Min', color='#94a3b8', fontsize=10)
+            self.rate_ax.tick_params(colors='#94a3b8', labelsize=9)
+            for spine in self.rate_ax.spines.values():
+                spine.set_edgecolor('#334155')
+                spine.set_linewidth(1)
+
+    def update_data(self, data: List[Tuple[datetime, float]], draw: bool = True):
         """
         Update chart with new data.
 
         Args:
-            data: List of (timestamp, value) tuples
+            data: List of (timestamp, value) tuples, or (timestamp, rate,
+                count1, ...) tuples when the chart has several series
+            draw: Redraw the canvas immediately (False lets the caller batch redraws)
         """
         if not data:
             return
 
         self.timestamps = [d[0] for d in data]
+        if len(self.labels) > 1:
+            self._update_series(data, draw)
+            return
+
         self.values = [d[1] for d in data]
 
         self.ax.clear()
@@ -76,7 +109,47 @@ class ActivityChart(ctk.CTkFrame):
         # Format x-axis for time
         self.ax.tick_params(axis='x', rotation=45, labelsize=8)
         self.figure.tight_layout()
-        self.canvas.draw()
+        if draw:
+            self.canvas.draw()
+
+    def _update_series(self, data, draw: bool):
+        """Update the series lines in place instead of replotting"""
+        rate_ax = self.rate_ax
+        if rate_ax is None:  # Only multi-series charts get here
+            return
+
+        self.series = [
+            [d[i + 1] for d in data] for i in range(len(self.labels))]
+
+        if not self.lines:
+            # Create one line per series once; later updates only move data
+            self.ax.xaxis_date()
+            for i, (label, color) in enumerate(
+                    zip(self.labels, self.SERIES_COLORS)):
+                ax = rate_ax if i == 0 else self.ax
+                line, = ax.plot([], [], color=color, linewidth=2,
+                                label=label)
+                self.lines.append(line)
+            # One legend for the lines on both axes
+            self.ax.legend(
+                handles=self.lines,
+                loc='upper left',
+                fontsize=8,
+                facecolor='#2b2b2b',
+                edgecolor='#334155',
+                labelcolor='#94a3b8')
+            self.ax.tick_params(axis='x', rotation=45, labelsize=8)
+            self.figure.tight_layout()
+
+        x = mdates.date2num(self.timestamps)
+        for line, values in zip(self.lines, self.series):
+            line.set_data(x, values)
+        for ax in (self.ax, rate_ax):
+            ax.relim()
+            ax.autoscale_view()
+
+        if draw:
+            self.canvas.draw()
 
 
 class FatigueChart(ctk.CTkFrame):
@@ -121,12 +194,13 @@ class FatigueChart(ctk.CTkFrame):
             spine.set_edgecolor('#334155')
             spine.set_linewidth(1)
 
-    def update_data(self, data: List[Tuple[datetime, float]]):
+    def update_data(self, data: List[Tuple[datetime, float]], draw: bool = True):
         """
         Update chart with new data.
 
         Args:
             data: List of (timestamp, score) tuples
+            draw: Redraw the canvas immediately (False lets the caller batch redraws)
         """
         if not data:
             return
@@ -165,7 +239,8 @@ class FatigueChart(ctk.CTkFrame):
         # Format x-axis for time
         self.ax.tick_params(axis='x', rotation=45, labelsize=8)
         self.figure.tight_layout()
-        self.canvas.draw()
+        if draw:
+            self.canvas.draw()
 
 
 class MiniGaugeChart(ctk.CTkFrame):
@@ -280,12 +355,13 @@ class BlinkRateChart(ctk.CTkFrame):
             spine.set_edgecolor('#00ff88')
             spine.set_linewidth(1.5)
 
-    def update_data(self, data: List[Tuple[datetime, float]]):
+    def update_data(self, data: List[Tuple[datetime, float]], draw: bool = True):
         """
         Update chart with new data.
 
         Args:
             data: List of (timestamp, blink_rate) tuples
+            draw: Redraw the canvas immediately (False lets the caller batch redraws)
         """
         if not data:
             return
@@ -321,4 +397,5 @@ class BlinkRateChart(ctk.CTkFrame):
             labelcolor='#ffffff',
             framealpha=0.8)
         self.figure.tight_layout()
-        self.canvas.draw()
+        if draw:
+            self.canvas.draw()
@@ -98,17 +98,17 @@ class KeyboardHandler:
         self.enabled = False
         logger.info("Keyboard shortcuts disabled")
 
-    def get_shortcuts_list(self) -> list:
+    def get_shortcuts_list(self) -> tuple:
         """
-        Get list of all registered shortcuts.
+        Get all registered shortcuts.
 
         Returns:
-            List of (key_combination, description) tuples
+            Tuple of (key_combination, description) tuples, sorted by key
         """
-        return [
+        return tuple(sorted(
             (key.upper(), info['description'])
             for key, info in self.shortcuts.items()
-        ]
+        ))
 
     def show_shortcuts_dialog(self):
         """Display a dialog with all keyboard shortcuts"""
@@ -1,8 +1,16 @@
 """Main application window"""
 import customtkinter as ctk
+import queue
 import threading
+import time
+import webbrowser
+from collections import deque
+from pathlib import Path
+from contextlib import contextmanager
+from functools import cached_property, partial
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Deque, Optional, Tuple, TypedDict
+import tkinter as tk
 from tkinter import messagebox
 
 from src.ui.dashboard import Dashboard
@@ -25,13 +33,81 @@ from src.analysis.alert_manager import AlertManager
 from src.analysis.activity_manager import ActivityManager
 from src.models.session import Session
 from src.models.activity_data import ActivityData
+from src.models.fatigue_score import FatigueScore
 from src.utils.logger import default_logger as logger
 from src.utils.sound_manager import SoundManager
 
+_ASSETS_DIR = Path(__file__).resolve().parents[2] / "assets"
+
+
+
+class _MetricsSample(TypedDict):
+    """Monitor readings taken by the metrics worker for one UI tick"""
+    activity_rate: float
+    blink_rate: float
+    camera_lost: bool
+    eye_error: Optional[str]
+
+
+# Shared fallback used when score calculation fails; treated as read-only
+# and never persisted (its timestamp is the import time)
+_SAFE_DEFAULT_FATIGUE = FatigueScore(score=0.0)
+
+# Static About-page content
+_FEATURES = (
+    "📊 Real-time cognitive fatigue monitoring",
+    "🖱️ Smart activity tracking (keyboard & mouse)",
+    "👁️ Optional eye tracking with blink rate analysis",
+    "🤖 Machine Learning predictions with personalization",
+    "📈 Beautiful data visualizations and analytics",
+    "⚠️ Intelligent break reminders and fatigue alerts",
+    "🔔 Desktop notifications with sound effects",
+    "💾 Session history and data export",
+    "⚙️ Fully customizable settings",
+    "🌙 Dark/Light theme support"
+)
+
+# Technology stack entries: (label, url)
+_TECH_LINKS = (
+    ("CustomTkinter - Modern UI framework", "https://github.com/TomSchimansky/CustomTkinter"),
+    ("MediaPipe - Eye tracking and facial landmarks", "https://google.github.io/mediapipe/"),
+    ("Scikit-learn - Machine learning models", "https://scikit-learn.org/"),
+    ("Matplotlib - Data visualization", "https://matplotlib.org/"),
+    ("SQLite - Data persistence", "https://www.sqlite.org/"),
+    ("Pynput - Input monitoring", "https://pynput.readthedocs.io/"),
+    ("Pystray - System tray integration", "https://pystray.readthedocs.io/")
+)
+
 
 class MainWindow(ctk.CTk):
     """Main application window"""
 
+    # Shared frame styles for settings/about sections and chart cards
+    _SECTION_KW = dict(
+        fg_color="#334155",
+        corner_radius=10,
+        border_width=1,
+        border_color="#475569")
+    _CHART_KW = dict(
+        fg_color="#1e293b",
+        corner_radius=14,
+        border_width=1,
+        border_color="#334155")
+
+    # Page title icon and accent color per page
+    _PAGE_ICONS = {
+        "Dashboard": "📊",
+        "Analytics": "📈",
+        "Statistics": "🎯",
+        "Settings": "⚙️",
+        "About": "ℹ️"}
+    _PAGE_COLORS = {
+        "Dashboard": "#3b82f6",
+        "Analytics": "#14b8a6",
+        "Statistics": "#8b5cf6",
+        "Settings": "#f97316",
+        "About": "#3b82f6"}
+
     def __init__(self):
         super().__init__()
 
@@ -52,43 +128,107 @@ class MainWindow(ctk.CTk):
         self.input_monitor: Optional[InputMonitor] = None
         self.time_tracker: Optional[TimeTracker] = None
         self.eye_tracker: Optional[EyeTracker] = None
-        self.fatigue_analyzer = FatigueAnalyzer()
-        self.alert_manager = AlertManager(
-            on_alert=self._show_alert,
-            recommendation_provider=self.fatigue_analyzer.get_smart_recommendations
-        )
-        self.activity_manager = ActivityManager(data_manager=self.data_manager)
+        # fatigue_analyzer, alert_manager and activity_manager are built
+        # lazily on first access (see the cached properties below)
         self.sound_manager = SoundManager()
 
         # Initialize keyboard shortcuts and system tray
         self.keyboard_handler: Optional[KeyboardHandler] = None
+        # No tray backend ships yet. A tray must be started on a daemon
+        # thread (pystray runs its own loop) and marshal its menu callbacks
+        # back to Tk with self.after(0, ...)
+        self.system_tray = None
 
         self.current_session: Optional[Session] = None
         self.is_monitoring = False
 
-        # Activity data for charts
-        self.activity_history = []
-        self.fatigue_history = []
-        self.blink_history = []
-        self.keystroke_history = []
-        self.mouse_history = []
+        # Activity data for charts (ring buffers sized to the history window).
+        # activity_history holds (time, rate, keystrokes, mouse clicks).
+        self.update_interval = self.config_manager.get(
+            'ui.update_interval_ms', 1000)
+        self._history_window = timedelta(
+            minutes=self.config_manager.get('ui.chart_history_minutes', 60))
+        history_len = max(
+            1,
+            int(self._history_window.total_seconds() * 1000) // self.update_interval)
+        self.activity_history: Deque[Tuple[datetime, float, int, int]] = \
+            deque(maxlen=history_len)
+        self.fatigue_history: Deque[Tuple[datetime, float]] = \
+            deque(maxlen=history_len)
+        self.blink_history: Deque[Tuple[datetime, float]] = \
+            deque(maxlen=history_len)
+
+        # Charts are redrawn roughly every 5 seconds, not on every tick
+        self._tick_counter = 0
+        self._chart_redraw_every = max(1, 5000 // self.update_interval)
+
+        # Metric snapshots produced by the worker thread, drained on the Tk thread
+        self._metrics_q: "queue.Queue[_MetricsSample]" = queue.Queue(maxsize=4)
+        self._metrics_stop: Optional[threading.Event] = None
+        # Held by the worker while sampling and by the Tk thread while
+        # stopping or swapping the monitors it samples
+        self._monitor_lock = threading.Lock()
+
+        # Periodic saves are written to SQLite by a background thread
+        self._save_queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._last_session_save = time.monotonic()
+        self._save_thread = threading.Thread(
+            target=self._save_worker, daemon=True, name="SaveWorker")
+        self._save_thread.start()
+
+        # Deferred chart redraws (coalesced into one frame per batch)
+        self._redraw_pending = False
+        self._redraw_batch_depth = 0
+        self._dirty_charts = []
+        # (length, newest timestamp) last pushed to each chart
+        self._last_chart_key = {}
+
+        # Shared CTkFont instances, keyed by (size, weight, underline)
+        self._fonts = {}
 
         # Create UI
         self._create_widgets()
 
-        # Setup keyboard shortcuts
-        self._setup_keyboard_shortcuts()
-
-        # Start update loop
-        self.update_interval = self.config_manager.get(
-            'ui.update_interval_ms', 1000)
-        self._start_update_loop()
+        # UI update loop runs only while monitoring (see _start_session)
+        self._update_job = None
 
         # Handle window close
         self.protocol("WM_DELETE_WINDOW", self._on_close)
 
+        # Setup secondary subsystems once the event loop is idle (after the
+        # first paint) instead of after a fixed delay
+        self.after_idle(self._deferred_setup)
+
         logger.info("Main window initialized")
 
+    @cached_property
+    def fatigue_analyzer(self) -> FatigueAnalyzer:
+        """Fatigue analyzer (loads ML components, so built on first use)"""
+        return FatigueAnalyzer()
+
+    @cached_property
+    def alert_manager(self) -> AlertManager:
+        """Alert manager, built on first use"""
+        return AlertManager(
+            on_alert=self._show_alert,
+            recommendation_provider=self.fatigue_analyzer.get_smart_recommendations
+        )
+
+    @cached_property
+    def activity_manager(self) -> ActivityManager:
+        """Activity manager, built on first use"""
+        return ActivityManager(data_manager=self.data_manager)
+
+    def _font(self, size: int, weight: str = "normal",
+              underline: bool = False) -> ctk.CTkFont:
+        """Return a shared CTkFont for the given style, creating it once"""
+        key = (size, weight, underline)
+        font = self._fonts.get(key)
+        if font is None:
+            font = ctk.CTkFont(size=size, weight=weight, underline=underline)
+            self._fonts[key] = font
+        return font
+
     def _create_widgets(self):
         """Create UI widgets with sidebar navigation"""
 
@@ -114,57 +254,16 @@ class MainWindow(ctk.CTk):
         logo_frame.pack(fill="x", padx=0, pady=0)
         logo_frame.pack_propagate(False)
 
-        # Load and display logo image
-        try:
-            logo_path = os.path.join(
-                os.path.dirname(
-                    os.path.dirname(
-                        os.path.dirname(__file__))),
-                "assets",
-                "logo.png")
-            if os.path.exists(logo_path):
-                logo_img = Image.open(logo_path)
-                logo_img = logo_img.resize((50, 50), Image.Resampling.LANCZOS)
-                
-                # Load placeholder for webcam
-                placeholder_path = os.path.join(
-                    os.path.dirname(
-                        os.path.dirname(
-                            os.path.dirname(__file__))),
-                    "assets",
-                    "webcam_placeholder.png")
-                
-                if os.path.exists(placeholder_path):
-                    self.webcam_photo = Image.open(placeholder_path)
-                else:
-                    # Create a blank image if not found
-                    self.webcam_photo = Image.new('RGB', (320, 240), color=(30, 30, 30))
-                
-                logo_photo = ImageTk.PhotoImage(logo_img)
-                logo_label = ctk.CTkLabel(
-                    logo_frame, image=logo_photo, text="")
-                logo_label.image = logo_photo  # Keep a reference
-                logo_label.pack(pady=(10, 5))
-            else:
-                # Fallback to emoji if logo not found
-                ctk.CTkLabel(
-                    logo_frame,
-                    text="🧠",
-                    font=ctk.CTkFont(size=32)
-                ).pack(pady=(10, 0))
-        except Exception as e:
-            logger.error(f"Failed to load logo: {e}")
-            # Fallback to emoji
-            ctk.CTkLabel(
-                logo_frame,
-                text="🧠",
-                font=ctk.CTkFont(size=32)
-            ).pack(pady=(10, 0))
+        # Reserve the logo slot; the image is loaded after the first paint
+        self.logo_label = ctk.CTkLabel(
+            logo_frame, text="", width=50, height=50)
+        self.logo_label.pack(pady=(10, 5))
+        self.after_idle(self._load_logo)
 
         ctk.CTkLabel(
             logo_frame,
             text="Fatigue Tracker",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self._font(size=16, weight="bold"),
             text_color="#3b82f6"
         ).pack(pady=(0, 5))
 
@@ -192,21 +291,21 @@ class MainWindow(ctk.CTk):
             btn = ctk.CTkButton(
                 sidebar,
                 text=f"{icon}  {name}",
-                command=lambda n=name: self._switch_page(n),
+                command=partial(self._switch_page, name),
                 width=180,
                 height=45,
                 corner_radius=10,
                 fg_color="transparent",
                 hover_color="#334155",
                 anchor="w",
-                font=ctk.CTkFont(size=14, weight="bold"),
+                font=self._font(size=14, weight="bold"),
                 text_color="#94a3b8"
             )
             btn.pack(padx=10, pady=5)
             self.nav_buttons[name] = btn
 
-        # Active page indicator
-        self.current_page = "Dashboard"
+        # Active page indicator (set by the initial _switch_page call)
+        self.current_page: Optional[str] = None
 
         # ===== MAIN CONTENT AREA =====
         main_container = ctk.CTkFrame(
@@ -230,7 +329,7 @@ class MainWindow(ctk.CTk):
         self.page_title = ctk.CTkLabel(
             top_bar,
             text="📊 Dashboard",
-            font=ctk.CTkFont(size=32, weight="bold"),
+            font=self._font(size=32, weight="bold"),
             text_color="#3b82f6"
         )
         self.page_title.pack(side="left", padx=30, pady=20)
@@ -249,7 +348,7 @@ class MainWindow(ctk.CTk):
             fg_color="#3b82f6",
             hover_color="#2563eb",
             text_color="#ffffff",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._font(size=14, weight="bold"),
             border_width=2,
             border_color="#60a5fa"
         )
@@ -266,7 +365,7 @@ class MainWindow(ctk.CTk):
             fg_color="#f97316",
             hover_color="#ea580c",
             text_color="#ffffff",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._font(size=14, weight="bold"),
             border_width=2,
             border_color="#fb923c"
         )
@@ -283,7 +382,7 @@ class MainWindow(ctk.CTk):
             fg_color="#dc2626",
             hover_color="#b91c1c",
             text_color="#ffffff",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._font(size=14, weight="bold"),
             border_width=2,
             border_color="#f87171"
         )
@@ -296,22 +395,18 @@ class MainWindow(ctk.CTk):
             corner_radius=0,
             fg_color="#1e293b")
         breadcrumb_bar.grid(row=1, column=0, sticky="ew", padx=0, pady=0)
-        breadcrumb_bar.grid_propagate(False)
-
-        # Breadcrumb path
-        self.breadcrumb_frame = ctk.CTkFrame(
-            breadcrumb_bar, fg_color="transparent")
-        self.breadcrumb_frame.pack(side="left", padx=15, pady=5)
+        # Labels are packed directly into the bar, so keep its fixed height
+        breadcrumb_bar.pack_propagate(False)
 
         # Clickable Home breadcrumb
         breadcrumb_home = ctk.CTkLabel(
-            self.breadcrumb_frame,
+            breadcrumb_bar,
             text="Home",
-            font=ctk.CTkFont(size=12, underline=True),
+            font=self._font(size=12, underline=True),
             text_color="#3b82f6",
             cursor="hand2"
         )
-        breadcrumb_home.pack(side="left")
+        breadcrumb_home.pack(side="left", padx=(15, 0), pady=5)
         breadcrumb_home.bind("<Button-1>",
                              lambda e: self._switch_page("Dashboard"))
         breadcrumb_home.bind(
@@ -325,20 +420,20 @@ class MainWindow(ctk.CTk):
 
         # Separator
         ctk.CTkLabel(
-            self.breadcrumb_frame,
+            breadcrumb_bar,
             text=" > ",
-            font=ctk.CTkFont(size=12),
+            font=self._font(size=12),
             text_color="#94a3b8"
-        ).pack(side="left")
+        ).pack(side="left", pady=5)
 
         # Current page label
         self.breadcrumb_current = ctk.CTkLabel(
-            self.breadcrumb_frame,
+            breadcrumb_bar,
             text="Dashboard",
-            font=ctk.CTkFont(size=12),
+            font=self._font(size=12),
             text_color="#94a3b8"
         )
-        self.breadcrumb_current.pack(side="left")
+        self.breadcrumb_current.pack(side="left", pady=5)
 
         # Content area with pages - fill all available space (no padding for
         # edge-to-edge design)
@@ -348,17 +443,63 @@ class MainWindow(ctk.CTk):
         self.content_frame.grid_columnconfigure(0, weight=1)
         self.content_frame.grid_rowconfigure(0, weight=1)
 
-        # Create all pages
+        # Create pages (builders in _page_builders run on first visit)
         self.pages = {}
+        self._page_builders = {
+            "Analytics": self._create_analytics_page,
+            "Activities": self._create_activities_page,
+            "Statistics": self._create_statistics_page,
+            "Settings": self._create_settings_page,
+            "About": self._build_about_page,
+        }
         self._create_dashboard_page()
-        self._create_analytics_page()
-        self._create_activities_page()
-        self._create_statistics_page()
-        self._create_settings_page()
 
         # Show initial page
         self._switch_page("Dashboard")
 
+    def _load_logo(self):
+        """Load the sidebar logo into its reserved label"""
+        logo_photo = None
+        try:
+            logo_path = self._resolve_logo_path()
+            if logo_path:
+                logo_img = Image.open(logo_path)
+                logo_img = logo_img.resize((50, 50), Image.Resampling.LANCZOS)
+                logo_photo = ImageTk.PhotoImage(logo_img)
+        except Exception as e:
+            logger.error(f"Failed to load logo: {e}")
+
+        if logo_photo:
+            self.logo_label.configure(image=logo_photo)
+            self.logo_label.image = logo_photo  # Keep a reference
+        else:
+            # Fallback to emoji if logo not found or failed to load
+            self.logo_label.configure(text="🧠", font=self._font(size=32))
+
+    def _resolve_logo_path(self) -> Optional[str]:
+        """
+        Resolve the sidebar logo path, reusing the result of earlier launches.
+
+        A found logo is remembered under 'ui._logo_resolved_path'. A missing
+        logo is not, so one added later is picked up on the next launch.
+
+        Returns:
+            Path to the logo image, or None to use the emoji fallback
+        """
+        cached = self.config_manager.get('ui._logo_resolved_path')
+        if cached and os.path.exists(cached):
+            return cached
+
+        logo_path = _ASSETS_DIR / "logo.png"
+        if not logo_path.exists():
+            return None
+
+        resolved = str(logo_path)
+        if resolved != cached:
+            self.config_manager.set('ui._logo_resolved_path', resolved)
+            self.config_manager.save()
+        return resolved
+
     def _create_dashboard_page(self):
         """Create Dashboard page"""
         page = ctk.CTkFrame(self.content_frame, fg_color="transparent")
@@ -367,26 +508,21 @@ class MainWindow(ctk.CTk):
 
         # Dashboard metrics with clickable cards that navigate to Analytics
         self.dashboard = Dashboard(
-            page, on_navigate=lambda: self._switch_page("Analytics"))
+            page, on_navigate=partial(self._switch_page, "Analytics"))
         self.dashboard.grid(row=0, column=0, sticky="nsew")
 
+        page.grid(row=0, column=0, sticky="nsew")
         self.pages["Dashboard"] = page
 
     def _create_analytics_page(self):
-        """Create Analytics page with charts - 2x2 grid + full-width blink chart"""
+        """Create Analytics page with charts - 1x2 grid + full-width blink chart"""
         page = ctk.CTkFrame(self.content_frame, fg_color="transparent")
         page.grid_columnconfigure((0, 1), weight=1)
         page.grid_rowconfigure(0, weight=1)  # Top row
-        page.grid_rowconfigure(1, weight=1)  # Middle row
-        page.grid_rowconfigure(2, weight=1)  # Bottom row for blink
+        page.grid_rowconfigure(1, weight=1)  # Bottom row for blink
 
-        # Activity chart (top left)
-        activity_container = ctk.CTkFrame(
-            page,
-            fg_color="#1e293b",
-            corner_radius=14,
-            border_width=1,
-            border_color="#334155")
+        # Activity chart with keystroke/mouse series on shared axes (top left)
+        activity_container = ctk.CTkFrame(page, **self._CHART_KW)
         activity_container.grid(
             row=0, column=0, sticky="nsew", padx=(
                 0, 4), pady=(
@@ -396,23 +532,19 @@ class MainWindow(ctk.CTk):
 
         ctk.CTkLabel(
             activity_container,
-            text="📊 Activity Rate Over Time",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            text="📊 Activity, Keystrokes & Clicks",
+            font=self._font(size=16, weight="bold"),
             text_color="#3b82f6"
         ).grid(row=0, column=0, sticky="w", padx=20, pady=(15, 5))
 
-        chart_frame = ctk.CTkFrame(activity_container, fg_color="transparent")
-        chart_frame.grid(row=1, column=0, sticky="nsew", padx=8, pady=(0, 8))
-        self.activity_chart = ActivityChart(chart_frame)
-        self.activity_chart.pack(fill="both", expand=True)
+        self.activity_chart = ActivityChart(
+            activity_container,
+            labels=("Activity/min", "Keystrokes", "Mouse Clicks"))
+        self.activity_chart.grid(
+            row=1, column=0, sticky="nsew", padx=8, pady=(0, 8))
 
         # Fatigue chart (top right)
-        fatigue_container = ctk.CTkFrame(
-            page,
-            fg_color="#1e293b",
-            corner_radius=14,
-            border_width=1,
-            border_color="#334155")
+        fatigue_container = ctk.CTkFrame(page, **self._CHART_KW)
         fatigue_container.grid(
             row=0, column=1, sticky="nsew", padx=(
                 4, 0), pady=(
@@ -423,76 +555,18 @@ class MainWindow(ctk.CTk):
         ctk.CTkLabel(
             fatigue_container,
             text="🎯 Fatigue Score Trend",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self._font(size=16, weight="bold"),
             text_color="#f97316"
         ).grid(row=0, column=0, sticky="w", padx=20, pady=(15, 5))
 
-        chart_frame = ctk.CTkFrame(fatigue_container, fg_color="transparent")
-        chart_frame.grid(row=1, column=0, sticky="nsew", padx=8, pady=(0, 8))
-        self.fatigue_chart = FatigueChart(chart_frame)
-        self.fatigue_chart.pack(fill="both", expand=True)
-
-        # Keystroke chart (bottom left)
-        keystroke_container = ctk.CTkFrame(
-            page,
-            fg_color="#1e293b",
-            corner_radius=14,
-            border_width=1,
-            border_color="#334155")
-        keystroke_container.grid(
-            row=1, column=0, sticky="nsew", padx=(
-                0, 4), pady=(
-                4, 0))
-        keystroke_container.grid_columnconfigure(0, weight=1)
-        keystroke_container.grid_rowconfigure(1, weight=1)
-
-        ctk.CTkLabel(
-            keystroke_container,
-            text="⌨️ Keystroke Activity",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color="#10b981"
-        ).grid(row=0, column=0, sticky="w", padx=20, pady=(15, 5))
-
-        chart_frame = ctk.CTkFrame(keystroke_container, fg_color="transparent")
-        chart_frame.grid(row=1, column=0, sticky="nsew", padx=8, pady=(0, 8))
-        self.keystroke_chart = ActivityChart(chart_frame)
-        self.keystroke_chart.pack(fill="both", expand=True)
-
-        # Mouse click chart (bottom right)
-        mouse_container = ctk.CTkFrame(
-            page,
-            fg_color="#1e293b",
-            corner_radius=14,
-            border_width=1,
-            border_color="#334155")
-        mouse_container.grid(
-            row=1, column=1, sticky="nsew", padx=(
-                4, 0), pady=(
-                4, 0))
-        mouse_container.grid_columnconfigure(0, weight=1)
-        mouse_container.grid_rowconfigure(1, weight=1)
-
-        ctk.CTkLabel(
-            mouse_container,
-            text="🖱️ Mouse Click Activity",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color="#10b981"
-        ).grid(row=0, column=0, sticky="w", padx=20, pady=(15, 5))
-
-        chart_frame = ctk.CTkFrame(mouse_container, fg_color="transparent")
-        chart_frame.grid(row=1, column=0, sticky="nsew", padx=8, pady=(0, 8))
-        self.mouse_chart = ActivityChart(chart_frame)
-        self.mouse_chart.pack(fill="both", expand=True)
+        self.fatigue_chart = FatigueChart(fatigue_container)
+        self.fatigue_chart.grid(
+            row=1, column=0, sticky="nsew", padx=8, pady=(0, 8))
 
         # Eye Blink Rate chart (bottom, spanning full width)
-        blink_container = ctk.CTkFrame(
-            page,
-            fg_color="#1e293b",
-            corner_radius=14,
-            border_width=1,
-            border_color="#334155")
+        blink_container = ctk.CTkFrame(page, **self._CHART_KW)
         blink_container.grid(
-            row=2,
+            row=1,
             column=0,
             columnspan=2,
             sticky="nsew",
@@ -505,18 +579,21 @@ class MainWindow(ctk.CTk):
         ctk.CTkLabel(
             blink_container,
             text="👁️ Eye Blink Rate (Eye Tracking)",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self._font(size=16, weight="bold"),
             text_color="#8b5cf6"
         ).grid(row=0, column=0, sticky="w", padx=20, pady=(15, 5))
 
-        chart_frame = ctk.CTkFrame(blink_container, fg_color="transparent")
-        chart_frame.grid(row=1, column=0, sticky="nsew", padx=8, pady=(0, 8))
-        self.blink_chart = BlinkRateChart(chart_frame)
-        self.blink_chart.pack(fill="both", expand=True)
+        self.blink_chart = BlinkRateChart(blink_container)
+        self.blink_chart.grid(
+            row=1, column=0, sticky="nsew", padx=8, pady=(0, 8))
         self.blink_chart_container = blink_container
 
         # Keep references
         self.pages["Analytics"] = page
+        page.grid(row=0, column=0, sticky="nsew")
+
+        # Show the history collected before the page was first opened
+        self._refresh_charts()
 
     def _create_activities_page(self):
         """Create Activities page with refresh activity browser"""
@@ -561,17 +638,12 @@ class MainWindow(ctk.CTk):
         ctk.CTkLabel(
             title_frame,
             text="⚙️ Settings",
-            font=ctk.CTkFont(size=26, weight="bold"),
+            font=self._font(size=26, weight="bold"),
             text_color="#f97316"
         ).pack(side="left", padx=10)
 
         # Work Interval Section (top left)
-        work_section = ctk.CTkFrame(
-            page,
-            fg_color="#334155",
-            corner_radius=10,
-            border_width=1,
-            border_color="#475569")
+        work_section = ctk.CTkFrame(page, **self._SECTION_KW)
         work_section.grid(
             row=1, column=0, sticky="nsew", padx=(
                 5, 3), pady=(
@@ -580,67 +652,49 @@ class MainWindow(ctk.CTk):
         ctk.CTkLabel(
             work_section,
             text="Work Interval",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._font(size=16, weight="bold")
         ).pack(anchor="w", padx=15, pady=(15, 5))
 
-        self.work_interval_var = ctk.StringVar(
-            value=str(
-                self.config_manager.get(
-                    'work_interval_minutes',
-                    50)))
         work_frame = ctk.CTkFrame(work_section, fg_color="transparent")
         work_frame.pack(fill="x", padx=15, pady=(0, 15))
 
         ctk.CTkLabel(work_frame, text="Minutes:").pack(side="left")
         self.work_entry = ctk.CTkEntry(
             work_frame,
-            textvariable=self.work_interval_var,
             width=100,
             state="normal",
             justify="center"
         )
+        self.work_entry.insert(
+            0, str(self.config_manager.get('work_interval_minutes', 50)))
         self.work_entry.pack(side="left", padx=(10, 0))
 
         # Break Interval Section (top middle)
-        break_section = ctk.CTkFrame(
-            page,
-            fg_color="#334155",
-            corner_radius=10,
-            border_width=1,
-            border_color="#475569")
+        break_section = ctk.CTkFrame(page, **self._SECTION_KW)
         break_section.grid(row=1, column=1, sticky="nsew", padx=3, pady=(2, 2))
 
         ctk.CTkLabel(
             break_section,
             text="Break Interval",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._font(size=16, weight="bold")
         ).pack(anchor="w", padx=15, pady=(15, 5))
 
-        self.break_interval_var = ctk.StringVar(
-            value=str(
-                self.config_manager.get(
-                    'break_interval_minutes',
-                    10)))
         break_frame = ctk.CTkFrame(break_section, fg_color="transparent")
         break_frame.pack(fill="x", padx=15, pady=(0, 15))
 
         ctk.CTkLabel(break_frame, text="Minutes:").pack(side="left")
         self.break_entry = ctk.CTkEntry(
             break_frame,
-            textvariable=self.break_interval_var,
             width=100,
             state="normal",
             justify="center"
         )
+        self.break_entry.insert(
+            0, str(self.config_manager.get('break_interval_minutes', 10)))
         self.break_entry.pack(side="left", padx=(10, 0))
 
         # Monitoring Section (top right)
-        monitor_section = ctk.CTkFrame(
-            page,
-            fg_color="#334155",
-            corner_radius=10,
-            border_width=1,
-            border_color="#475569")
+        monitor_section = ctk.CTkFrame(page, **self._SECTION_KW)
         monitor_section.grid(
             row=1, column=2, sticky="nsew", padx=(
                 3, 5), pady=(
@@ -649,7 +703,7 @@ class MainWindow(ctk.CTk):
         ctk.CTkLabel(
             monitor_section,
             text="Activity Monitoring",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._font(size=16, weight="bold")
         ).pack(anchor="w", padx=15, pady=(15, 5))
 
         self.track_keyboard_var = ctk.BooleanVar(
@@ -680,12 +734,7 @@ class MainWindow(ctk.CTk):
         ).pack(anchor="w", padx=15, pady=(5, 15))
 
         # Alerts Section (middle left)
-        alerts_section = ctk.CTkFrame(
-            page,
-            fg_color="#334155",
-            corner_radius=10,
-            border_width=1,
-            border_color="#475569")
+        alerts_section = ctk.CTkFrame(page, **self._SECTION_KW)
         alerts_section.grid(
             row=2,
             column=0,
@@ -698,7 +747,7 @@ class MainWindow(ctk.CTk):
         ctk.CTkLabel(
             alerts_section,
             text="Alerts & Notifications",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._font(size=16, weight="bold")
         ).pack(anchor="w", padx=15, pady=(15, 5))
 
         self.break_alerts_var = ctk.BooleanVar(
@@ -719,11 +768,6 @@ class MainWindow(ctk.CTk):
             variable=self.fatigue_alerts_var
         ).pack(anchor="w", padx=15, pady=5)
 
-        self.alert_cooldown_var = ctk.StringVar(
-            value=str(
-                self.config_manager.get(
-                    'alerts.alert_cooldown_minutes',
-                    10)))
         cooldown_frame = ctk.CTkFrame(alerts_section, fg_color="transparent")
         cooldown_frame.pack(fill="x", padx=15, pady=(5, 15))
 
@@ -733,33 +777,28 @@ class MainWindow(ctk.CTk):
             side="left")
         self.cooldown_entry = ctk.CTkEntry(
             cooldown_frame,
-            textvariable=self.alert_cooldown_var,
             width=100,
             state="normal",
             justify="center"
         )
+        self.cooldown_entry.insert(
+            0, str(self.config_manager.get('alerts.alert_cooldown_minutes', 10)))
         self.cooldown_entry.pack(side="left", padx=(10, 0))
 
         # Eye Tracking Section (middle middle)
-        eye_section = ctk.CTkFrame(
-            page,
-            fg_color="#334155",
-            corner_radius=10,
-            border_width=1,
-            border_color="#475569")
+        eye_section = ctk.CTkFrame(page, **self._SECTION_KW)
         eye_section.grid(row=2, column=1, sticky="nsew", padx=3, pady=2)
 
         ctk.CTkLabel(
             eye_section,
             text="👁️ Eye Tracking (Optional)",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._font(size=16, weight="bold")
         ).pack(anchor="w", padx=15, pady=(15, 5))
 
         privacy_label = ctk.CTkLabel(
             eye_section,
             text="⚠️ Privacy: Eye tracking uses your webcam to detect blinks.\nNo video is recorded or stored - only blink counts are tracked.",
-            font=ctk.CTkFont(
-                size=10),
+            font=self._font(size=10),
             text_color="#FFC107",
             justify="left")
         privacy_label.pack(anchor="w", padx=15, pady=5)
@@ -772,21 +811,25 @@ class MainWindow(ctk.CTk):
             text="Enable Eye Tracking (Blink Rate Monitoring)",
             variable=self.eye_tracking_var,
             command=self._on_eye_tracking_toggle
-        ).pack(anchor="w", padx=15, pady=(10, 15))
+        ).pack(anchor="w", padx=15, pady=(10, 5))
+
+        self.eye_consent_var = ctk.BooleanVar(
+            value=self.config_manager.get(
+                'eye_tracking.consent_granted', False))
+        ctk.CTkCheckBox(
+            eye_section,
+            text="Camera consent given (uncheck to revoke)",
+            variable=self.eye_consent_var
+        ).pack(anchor="w", padx=15, pady=(5, 15))
 
         # UI Theme Section (middle right)
-        theme_section = ctk.CTkFrame(
-            page,
-            fg_color="#334155",
-            corner_radius=10,
-            border_width=1,
-            border_color="#475569")
+        theme_section = ctk.CTkFrame(page, **self._SECTION_KW)
         theme_section.grid(row=2, column=2, sticky="nsew", padx=(3, 5), pady=2)
 
         ctk.CTkLabel(
             theme_section,
             text="Appearance",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._font(size=16, weight="bold")
         ).pack(anchor="w", padx=15, pady=(15, 5))
 
         self.theme_var = ctk.StringVar(
@@ -829,7 +872,7 @@ class MainWindow(ctk.CTk):
             fg_color="#00ff88",
             hover_color="#00cc6a",
             text_color="#000000",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._font(size=14, weight="bold")
         ).pack(side="left", padx=(0, 10))
 
         ctk.CTkButton(
@@ -844,12 +887,13 @@ class MainWindow(ctk.CTk):
             border_color="#ff4757",
             text_color="#ff4757",
             hover_color="#ff4757",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._font(size=14, weight="bold")
         ).pack(side="left")
 
+        page.grid(row=0, column=0, sticky="nsew")
         self.pages["Settings"] = page
 
-    def _create_about_page(self):
+    def _build_about_page(self):
         """Create modern About page with financial dashboard styling"""
         # Wrapper frame to force full width
         wrapper = ctk.CTkFrame(self.content_frame, fg_color="#2d2d2d")
@@ -878,20 +922,20 @@ class MainWindow(ctk.CTk):
         ctk.CTkLabel(
             header_frame,
             text="🧠",
-            font=ctk.CTkFont(size=60)
+            font=self._font(size=60)
         ).grid(row=0, column=0, pady=(30, 10))
 
         ctk.CTkLabel(
             header_frame,
             text="Cognitive Fatigue Tracker",
-            font=ctk.CTkFont(size=36, weight="bold"),
+            font=self._font(size=36, weight="bold"),
             text_color="#4ade80"  # Green accent like reference
         ).grid(row=1, column=0, pady=(0, 5))
 
         ctk.CTkLabel(
             header_frame,
             text="Advanced Real-Time Cognitive Performance Monitoring",
-            font=ctk.CTkFont(size=14),
+            font=self._font(size=14),
             text_color="#9ca3af"  # Muted gray
         ).grid(row=2, column=0, pady=(0, 30))
 
@@ -906,7 +950,7 @@ class MainWindow(ctk.CTk):
         ctk.CTkLabel(
             version_frame,
             text="📌 Version Information",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=self._font(size=18, weight="bold"),
             text_color="#4ade80",  # Green accent
             anchor="w"
         ).pack(anchor="w", padx=20, pady=(15, 10))
@@ -915,7 +959,7 @@ class MainWindow(ctk.CTk):
         ctk.CTkLabel(
             version_frame,
             text=version_text,
-            font=ctk.CTkFont(size=13),
+            font=self._font(size=13),
             anchor="w",
             justify="left"
         ).pack(anchor="w", padx=25, pady=(5, 20))
@@ -938,118 +982,74 @@ class MainWindow(ctk.CTk):
         ctk.CTkLabel(
             features_frame,
             text="✨ Key Features",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=self._font(size=18, weight="bold"),
             text_color="#4ade80",
             anchor="w"
         ).pack(anchor="w", padx=20, pady=(15, 10))
 
-        features = [
-            "📊 Real-time cognitive fatigue monitoring",
-            "🖱️ Smart activity tracking (keyboard & mouse)",
-            "👁️ Optional eye tracking with blink rate analysis",
-            "🤖 Machine Learning predictions with personalization",
-            "📈 Beautiful data visualizations and analytics",
-            "⚠️ Intelligent break reminders and fatigue alerts",
-            "🔔 Desktop notifications with sound effects",
-            "💾 Session history and data export",
-            "⚙️ Fully customizable settings",
-            "🌙 Dark/Light theme support"
-        ]
-
-        for feature in features:
-            ctk.CTkLabel(
-                features_frame,
-                text=feature,
-                font=ctk.CTkFont(size=13),
-                anchor="w"
-            ).pack(anchor="w", padx=25, pady=3)
+        # Rows are drawn on one canvas instead of one CTkLabel per feature
+        row_height = 24
+        body_font = self._font(size=13)
+        features_canvas = tk.Canvas(
+            features_frame,
+            height=row_height * len(_FEATURES),
+            bg="#2d3548",
+            highlightthickness=0)
+        features_canvas.pack(fill="x", padx=25, pady=3)
+        for i, feature in enumerate(_FEATURES):
+            features_canvas.create_text(
+                0, i * row_height + row_height // 2,
+                text=feature, anchor="w", font=body_font, fill="#DCE4EE")
 
         ctk.CTkLabel(features_frame, text="").pack(pady=5)  # Spacing
 
         # Technology stack
-        tech_frame = ctk.CTkFrame(
-            page,
-            fg_color="#334155",
-            corner_radius=10,
-            border_width=1,
-            border_color="#475569")
+        tech_frame = ctk.CTkFrame(page, **self._SECTION_KW)
         tech_frame.grid(row=3, column=0, sticky="ew", padx=20, pady=(0, 20))
 
         ctk.CTkLabel(
             tech_frame,
             text="🔧 Technology Stack",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=self._font(size=18, weight="bold"),
             anchor="w"
         ).pack(anchor="w", padx=20, pady=(15, 10))
 
-        # Technology stack with clickable links
-        import webbrowser
-
-        tech_links = [
-            ("CustomTkinter - Modern UI framework", "https://github.com/TomSchimansky/CustomTkinter"),
-            ("MediaPipe - Eye tracking and facial landmarks", "https://google.github.io/mediapipe/"),
-            ("Scikit-learn - Machine learning models", "https://scikit-learn.org/"),
-            ("Matplotlib - Data visualization", "https://matplotlib.org/"),
-            ("SQLite - Data persistence", "https://www.sqlite.org/"),
-            ("Pynput - Input monitoring", "https://pynput.readthedocs.io/"),
-            ("Pystray - System tray integration", "https://pystray.readthedocs.io/")
-        ]
-
-        for tech_name, url in tech_links:
-            link_frame = ctk.CTkFrame(tech_frame, fg_color="transparent")
-            link_frame.pack(anchor="w", padx=25, pady=2)
-
-            # Bullet point
-            ctk.CTkLabel(
-                link_frame,
-                text="•",
-                font=ctk.CTkFont(size=13),
-                anchor="w"
-            ).pack(side="left", padx=(0, 5))
-
-            # Clickable link
-            link_label = ctk.CTkLabel(
-                link_frame,
+        # Bullets and links share one canvas
+        link_font = self._font(size=13, underline=True)
+        tech_canvas = tk.Canvas(
+            tech_frame,
+            height=row_height * len(_TECH_LINKS),
+            bg="#334155",
+            highlightthickness=0)
+        tech_canvas.pack(fill="x", padx=25, pady=2)
+        self._about_link_urls = {}
+        for i, (tech_name, url) in enumerate(_TECH_LINKS):
+            y = i * row_height + row_height // 2
+            tech_canvas.create_text(
+                0, y, text="•", anchor="w", font=body_font, fill="#DCE4EE")
+            link_item = tech_canvas.create_text(
+                15, y,
                 text=tech_name,
-                font=ctk.CTkFont(size=13, underline=True),
-                text_color="#3b82f6",
                 anchor="w",
-                cursor="hand2"
-            )
-            link_label.pack(side="left")
-
-            # Make it clickable
-            link_label.bind(
-                "<Button-1>",
-                lambda e,
-                link=url: webbrowser.open(link))
-            # Hover effect
-            link_label.bind(
-                "<Enter>",
-                lambda e,
-                lbl=link_label: lbl.configure(
-                    text_color="#2563eb"))
-            link_label.bind(
-                "<Leave>",
-                lambda e,
-                lbl=link_label: lbl.configure(
-                    text_color="#3b82f6"))
+                font=link_font,
+                fill="#3b82f6",
+                tags=("link",))
+            self._about_link_urls[link_item] = url
+        # One binding per event on the shared "link" tag, not per link
+        tech_canvas.tag_bind("link", "<Button-1>", self._on_about_link_click)
+        tech_canvas.tag_bind("link", "<Enter>", self._on_about_link_enter)
+        tech_canvas.tag_bind("link", "<Leave>", self._on_about_link_leave)
 
         ctk.CTkLabel(tech_frame, text="").pack(pady=5)  # Spacing
 
         # Privacy & Data
-        privacy_frame = ctk.CTkFrame(
-            page,
-            fg_color="#334155",
-            corner_radius=10,
-            border_width=1,
-            border_color="#475569")
+        privacy_frame = ctk.CTkFrame(page, **self._SECTION_KW)
         privacy_frame.grid(row=4, column=0, sticky="ew", padx=20, pady=(0, 20))
 
         ctk.CTkLabel(
             privacy_frame,
             text="🔒 Privacy & Data",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=self._font(size=18, weight="bold"),
             anchor="w"
         ).pack(anchor="w", padx=20, pady=(15, 10))
 
@@ -1061,25 +1061,20 @@ class MainWindow(ctk.CTk):
         ctk.CTkLabel(
             privacy_frame,
             text=privacy_text,
-            font=ctk.CTkFont(size=12),
+            font=self._font(size=12),
             anchor="w",
             justify="left",
             wraplength=700
         ).pack(anchor="w", padx=25, pady=(0, 15))
 
         # Credits & License
-        credits_frame = ctk.CTkFrame(
-            page,
-            fg_color="#334155",
-            corner_radius=10,
-            border_width=1,
-            border_color="#475569")
+        credits_frame = ctk.CTkFrame(page, **self._SECTION_KW)
         credits_frame.grid(row=5, column=0, sticky="ew", padx=20, pady=(0, 20))
 
         ctk.CTkLabel(
             credits_frame,
             text="👥 Credits",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=self._font(size=18, weight="bold"),
             anchor="w"
         ).pack(anchor="w", padx=20, pady=(15, 10))
 
@@ -1090,7 +1085,7 @@ class MainWindow(ctk.CTk):
         ctk.CTkLabel(
             credits_frame,
             text=credits_text,
-            font=ctk.CTkFont(size=12),
+            font=self._font(size=12),
             anchor="w",
             justify="left",
             wraplength=700
@@ -1103,64 +1098,77 @@ class MainWindow(ctk.CTk):
         ctk.CTkLabel(
             footer_frame,
             text="Made to help you work smarter, not harder. 🚀",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._font(size=14, weight="bold"),
             text_color="#3b82f6"
         ).pack(pady=10)
 
+        wrapper.grid(row=0, column=0, sticky="nsew")
         self.pages["About"] = wrapper
 
+    def _on_about_link_click(self, event):
+        """Open the tech-stack link under the cursor"""
+        for item in event.widget.find_withtag("current"):
+            url = self._about_link_urls.get(item)
+            if url:
+                webbrowser.open(url)
+                return
+
+    def _on_about_link_enter(self, event):
+        """Highlight the hovered tech-stack link"""
+        event.widget.itemconfigure("current", fill="#2563eb")
+        event.widget.configure(cursor="hand2")
+
+    def _on_about_link_leave(self, event):
+        """Restore the tech-stack link color"""
+        event.widget.itemconfigure("current", fill="#3b82f6")
+        event.widget.configure(cursor="")
+
     def _switch_page(self, page_name):
         """Switch between pages"""
-        # Hide all pages
-        for page in self.pages.values():
-            page.grid_remove()
+        if page_name == self.current_page:
+            return
+
+        # Build lazily-created pages on first visit
+        if page_name not in self.pages and page_name in self._page_builders:
+            self._page_builders[page_name]()
 
         # Show selected page
         if page_name in self.pages:
+            # Pages stay gridded at row 0/column 0; grid_remove keeps their
+            # options so re-showing is a single map call
+            previous_page = self.current_page
+            if previous_page in self.pages:
+                self.pages[previous_page].grid_remove()
             self.pages[page_name].grid()
             self.current_page = page_name
-            
+
             # Refresh if it's statistics page
             if page_name == "Statistics" and hasattr(self.pages[page_name], "refresh"):
                 self.pages[page_name].refresh()
 
             # Update page title and colors
-            icons = {
-                "Dashboard": "📊",
-                "Analytics": "📈",
-                "Statistics": "🎯",
-                "Settings": "⚙️",
-                "About": "ℹ️"}
-            colors = {
-                "Dashboard": "#3b82f6",
-                "Analytics": "#14b8a6",
-                "Statistics": "#8b5cf6",
-                "Settings": "#f97316",
-                "About": "#3b82f6"}
-
             self.page_title.configure(
-                text=f"{icons.get(page_name, '📄')} {page_name}",
-                text_color=colors.get(page_name, "#ffffff")
+                text=f"{self._PAGE_ICONS.get(page_name, '📄')} {page_name}",
+                text_color=self._PAGE_COLORS.get(page_name, "#ffffff")
             )
 
             # Update breadcrumb current page
             self.breadcrumb_current.configure(text=page_name)
 
-            # Update nav button styles
-            for name, btn in self.nav_buttons.items():
-                if name == page_name:
-                    btn.configure(
-                        fg_color=colors.get(page_name, "#3b82f6"),
-                        text_color="#ffffff",
-                        border_width=2,
-                        border_color="#60a5fa"
-                    )
-                else:
-                    btn.configure(
-                        fg_color="transparent",
-                        text_color="#94a3b8",
-                        border_width=0
-                    )
+            # Update nav button styles (only the two that changed)
+            if previous_page in self.nav_buttons:
+                self.nav_buttons[previous_page].configure(
+                    fg_color="transparent",
+                    text_color="#94a3b8",
+                    border_width=0
+                )
+            if page_name in self.nav_buttons:
+                self.nav_buttons[page_name].configure(
+                    fg_color=self._PAGE_COLORS.get(page_name, "#3b82f6"),
+                    text_color="#ffffff",
+                    border_width=2,
+                    border_color="#60a5fa"
+                )
 
     def _start_session(self):
         """Start a new monitoring session"""
@@ -1172,7 +1180,7 @@ class MainWindow(ctk.CTk):
         self.fatigue_analyzer.start_session()
 
         # Initialize monitors
-        config = self.config_manager
+        config = self.config_manager.snapshot()
         self.input_monitor = InputMonitor(
             on_activity=self._on_activity, track_keyboard=config.get(
                 'monitoring.track_keyboard', True), track_mouse_clicks=config.get(
@@ -1208,9 +1216,13 @@ class MainWindow(ctk.CTk):
                 logger.error(f"Failed to initialize eye tracker: {e}")
                 self.eye_tracker = None
 
-        # Start monitoring
+        # Start monitoring (the session is saved below; next auto-save in 60 s)
+        self._last_session_save = time.monotonic()
         self.input_monitor.start()
         self.is_monitoring = True
+        self._start_metrics_worker()
+        if self._update_job is None:
+            self._update_job = self.after_idle(self._start_update_loop)
 
         # Update UI
         self.start_button.configure(state="disabled")
@@ -1228,14 +1240,14 @@ class MainWindow(ctk.CTk):
         if not self.is_monitoring:
             return
 
-        # Stop monitoring
-        if self.input_monitor:
-            self.input_monitor.stop()
-            self.input_monitor = None
+        self._stop_metrics_worker()
 
-        if self.eye_tracker:
-            self.eye_tracker.stop()
-            self.eye_tracker = None
+        # Stop monitoring
+        with self._monitor_lock:
+            if self.input_monitor:
+                self.input_monitor.stop()
+                self.input_monitor = None
+        self._stop_eye_tracker()
 
         if self.time_tracker:
             self.time_tracker.end_session()
@@ -1244,6 +1256,8 @@ class MainWindow(ctk.CTk):
         # End session
         if self.current_session:
             self.current_session.end_session()
+            # Queued autosaves hold older snapshots; write them first
+            self._flush_saves()
             self.data_manager.save_session(self.current_session)
             logger.info(f"Ended session {self.current_session.session_id}")
             self.current_session = None
@@ -1308,55 +1322,182 @@ class MainWindow(ctk.CTk):
             # Optionally save to database (batched for performance)
             # self.data_manager.save_activity(activity, self.current_session.session_id)
 
-    def _update_ui(self):
-        """Update UI with current data"""
-        if not self.is_monitoring or not self.time_tracker:
-            return
+    def _start_metrics_worker(self):
+        """Start the background thread that samples monitor metrics"""
+        self._stop_metrics_worker()
+        self._metrics_stop = threading.Event()
+        threading.Thread(
+            target=self._metrics_worker,
+            args=(self._metrics_stop,),
+            daemon=True,
+            name="MetricsWorker"
+        ).start()
+
+    def _stop_metrics_worker(self):
+        """Signal the metrics worker to exit and drop pending samples"""
+        if self._metrics_stop:
+            self._metrics_stop.set()
+            self._metrics_stop = None
+        while True:
+            try:
+                self._metrics_q.get_nowait()
+            except queue.Empty:
+                break
+
+    def _metrics_worker(self, stop_event: threading.Event):
+        """Produce metric snapshots every update interval until stopped"""
+        interval = self.update_interval / 1000
+        next_tick = time.monotonic()
+        while not stop_event.is_set():
+            sample = self._sample_metrics()
+            try:
+                self._metrics_q.put_nowait(sample)
+            except queue.Full:
+                # UI is behind - drop the oldest snapshot, keep the newest
+                try:
+                    self._metrics_q.get_nowait()
+                except queue.Empty:
+                    pass
+                self._metrics_q.put_nowait(sample)
+
+            # Drift-corrected: wait until the next tick deadline, skipping
+            # ticks that were missed instead of bursting to catch up
+            next_tick += interval
+            delay = next_tick - time.monotonic()
+            if delay < 0:
+                next_tick = time.monotonic()
+                delay = 0
+            stop_event.wait(delay)
+
+    def _save_worker(self):
+        """Run queued (save_fn, args) writes so SQLite I/O never blocks the UI"""
+        while True:
+            item = self._save_queue.get()
+            try:
+                if item is None:  # Shutdown sentinel
+                    return
+                save_fn, args = item
+                save_fn(*args)
+            except Exception as e:
+                logger.error(f"Error in background save: {e}")
+            finally:
+                self._save_queue.task_done()
+
+    def _flush_saves(self):
+        """Block until every queued background save has been written"""
+        if self._save_thread.is_alive():
+            self._save_queue.join()
+
+    def _shutdown_saves(self):
+        """Write any queued saves and stop the save worker"""
+        if self._save_thread.is_alive():
+            self._save_queue.put(None)
+            self._save_thread.join()
+
+    def _sample_metrics(self) -> _MetricsSample:
+        """
+        Read metrics from the monitors (runs on the worker thread).
 
-        try:
-            # Get current metrics with error handling
+        Returns:
+            Snapshot with activity_rate, blink_rate, camera_lost and
+            eye_error; widget updates are left to the Tk thread.
+        """
+        sample: _MetricsSample = {
+            'activity_rate': 0.0,
+            'blink_rate': 0.0,
+            'camera_lost': False,
+            'eye_error': None
+        }
+
+        # The lock keeps the Tk thread from stopping a monitor mid-read
+        with self._monitor_lock:
             try:
-                activity_rate = self.input_monitor.get_activity_rate() if self.input_monitor else 0
+                if self.input_monitor:
+                    sample['activity_rate'] = \
+                        self.input_monitor.get_activity_rate()
             except Exception as e:
                 logger.error(f"Error getting activity rate: {e}")
-                activity_rate = 0
-
-            work_time = self.time_tracker.get_work_time()
-            session_time = self.time_tracker.get_session_time()
-            time_until_break = self.time_tracker.get_time_until_break()
-            is_on_break = self.time_tracker.is_on_break
 
-            # Get blink rate if eye tracking is enabled - with error handling
-            blink_rate = 0.0
-            if self.eye_tracker:
+            eye_tracker = self.eye_tracker
+            if eye_tracker:
                 try:
-                    # Check if camera is still available
-                    if not self.eye_tracker.is_camera_available():
-                        logger.warning(
-                            "Camera became unavailable, disabling eye tracker")
-                        self.eye_tracker.stop()
-                        self.eye_tracker = None
-                        # Show notification to user
-                        self.after(
-                            0,
-                            lambda: messagebox.showwarning(
-                                "Camera Disconnected",
-                                "Eye tracking stopped: Camera is no longer available."))
+                    if not eye_tracker.is_camera_available():
+                        sample['camera_lost'] = True
                     else:
-                        blink_rate = self.eye_tracker.get_blink_rate()
+                        sample['blink_rate'] = eye_tracker.get_blink_rate()
                 except Exception as e:
-                    logger.error(f"Error getting blink rate: {e}")
+                    sample['eye_error'] = str(e)
+
+        return sample
+
+    def _stop_eye_tracker(self):
+        """Stop the eye tracker (if any) without racing the metrics worker"""
+        with self._monitor_lock:
+            if self.eye_tracker:
+                self.eye_tracker.stop()
+                self.eye_tracker = None
+
+    def _drain_queue(self):
+        """Apply the latest queued metric snapshot, discarding older ones"""
+        latest = None
+        while True:
+            try:
+                latest = self._metrics_q.get_nowait()
+            except queue.Empty:
+                break
+        if latest is not None:
+            self._update_ui(latest)
+
+    def _update_ui(self, sample: _MetricsSample):
+        """
+        Update UI with a metric snapshot.
+
+        Args:
+            sample: Snapshot produced by _sample_metrics
+        """
+        if not self.is_monitoring or not self.time_tracker:
+            return
+
+        try:
+            now = datetime.now()
+            activity_rate = sample['activity_rate']
+
+            # One timing snapshot per tick (work time is computed once)
+            timing = self.time_tracker.get_snapshot()
+            work_time = timing['work_time']
+            session_time = timing['session_time']
+            time_until_break = timing['time_until_break']
+            is_on_break = timing['is_on_break']
+            work_minutes = work_time.total_seconds() / 60
+
+            # Blink rate if eye tracking is enabled - with error handling
+            blink_rate = 0.0
+            if self.eye_tracker:
+                if sample['camera_lost']:
+                    logger.warning(
+                        "Camera became unavailable, disabling eye tracker")
+                    self._stop_eye_tracker()
+                    # Show notification to user
+                    self.after(
+                        0,
+                        lambda: messagebox.showwarning(
+                            "Camera Disconnected",
+                            "Eye tracking stopped: Camera is no longer available."))
+                elif sample['eye_error'] is not None:
+                    logger.error(
+                        f"Error getting blink rate: {sample['eye_error']}")
                     # Disable eye tracker if it keeps failing
-                    self.eye_tracker.stop()
-                    self.eye_tracker = None
+                    self._stop_eye_tracker()
+                else:
+                    blink_rate = sample['blink_rate']
 
             # Calculate fatigue score
             try:
                 fatigue_score = self.fatigue_analyzer.calculate_score(
-                    work_duration_minutes=work_time.total_seconds() / 60,
+                    work_duration_minutes=work_minutes,
                     activity_rate=activity_rate,
                     time_since_break_minutes=(
-                        work_time.total_seconds() / 60) if not is_on_break else 0,
+                        work_minutes if not is_on_break else 0),
                     is_on_break=is_on_break,
                     blink_rate=blink_rate)
             except Exception as e:
@@ -1364,24 +1505,23 @@ class MainWindow(ctk.CTk):
                     f"Error calculating fatigue score: {e}",
                     exc_info=True)
                 # Use a safe default score
-                from src.models.fatigue_score import FatigueScore
-                fatigue_score = FatigueScore(score=0.0)
+                fatigue_score = _SAFE_DEFAULT_FATIGUE
 
             # Save fatigue score periodically
+            if (self.current_session
+                    and fatigue_score is not _SAFE_DEFAULT_FATIGUE
+                    and len(self.fatigue_analyzer.history) % 10 == 0):
+                self._save_queue.put((
+                    self.data_manager.save_fatigue_score,
+                    (fatigue_score, self.current_session.session_id)))
+
+            # Get keystroke and mouse counts (cumulative)
+            keystroke_count = self.current_session.keyboard_count if self.current_session else 0
+            mouse_count = self.current_session.mouse_click_count if self.current_session else 0
+
+            # Display: dashboard + chart samples. A rendering failure must not
+            # stop the alert checks below, so it gets its own handler.
             try:
-                if self.current_session and len(
-                        self.fatigue_analyzer.history) % 10 == 0:
-                    self.data_manager.save_fatigue_score(
-                        fatigue_score, self.current_session.session_id)
-            except Exception as e:
-                logger.error(f"Error saving fatigue score: {e}")
-
-            # Update dashboard with error handling
-            try:
-                # Get keystroke and mouse counts (cumulative)
-                keystroke_count = self.current_session.keyboard_count if self.current_session else 0
-                mouse_count = self.current_session.mouse_click_count if self.current_session else 0
-
                 self.dashboard.update_stats(
                     fatigue_score=fatigue_score.score,
                     fatigue_level=fatigue_score.get_level(),
@@ -1397,99 +1537,145 @@ class MainWindow(ctk.CTk):
                     mouse_count=mouse_count
                 )
 
-            except Exception as e:
-                logger.error(f"Error updating dashboard: {e}")
+                # Record chart samples every tick, but only push them to the
+                # charts every _chart_redraw_every ticks (one redraw batch)
+                self._tick_counter += 1
+                cutoff = now - self._history_window
 
-            # Update charts with error handling
-            try:
-                now = datetime.now()
-
-                # Activity chart - last hour
-                self.activity_history.append((now, activity_rate))
-                cutoff = now - timedelta(minutes=60)
-                self.activity_history = [
-                    (t, v) for t, v in self.activity_history if t >= cutoff]
-                self.activity_chart.update_data(self.activity_history)
-            except Exception as e:
-                logger.error(f"Error updating activity chart: {e}")
+                # Activity/keystroke/mouse
+                self.activity_history.append(
+                    (now, activity_rate, keystroke_count, mouse_count))
+                self._prune(self.activity_history, cutoff)
 
-            # Fatigue chart - last hour
-            try:
+                # Fatigue
                 self.fatigue_history.append((now, fatigue_score.score))
-                self.fatigue_history = [
-                    (t, v) for t, v in self.fatigue_history if t >= cutoff]
-                self.fatigue_chart.update_data(self.fatigue_history)
-
-                # Keystroke chart - last hour
-                self.keystroke_history.append((now, keystroke_count))
-                self.keystroke_history = [
-                    (t, v) for t, v in self.keystroke_history if t >= cutoff]
-                self.keystroke_chart.update_data(self.keystroke_history)
-
-                # Mouse click chart - last hour
-                self.mouse_history.append((now, mouse_count))
-                self.mouse_history = [
-                    (t, v) for t, v in self.mouse_history if t >= cutoff]
-                self.mouse_chart.update_data(self.mouse_history)
-            except Exception as e:
-                logger.error(f"Error updating fatigue chart: {e}")
+                self._prune(self.fatigue_history, cutoff)
 
-            # Blink rate chart (if eye tracking enabled)
-            try:
+                # Blink rate (if eye tracking enabled)
                 if self.eye_tracker and blink_rate > 0:
                     self.blink_history.append((now, blink_rate))
-                    self.blink_history = [
-                        (t, v) for t, v in self.blink_history if t >= cutoff]
-                    # Create chart if not exists
-                    if self.blink_chart is None:
-                        self._create_blink_chart()
-                    if self.blink_chart:
-                        self.blink_chart.update_data(self.blink_history)
+                    self._prune(self.blink_history, cutoff)
+
+                if self._tick_counter % self._chart_redraw_every == 0:
+                    self._refresh_charts()
             except Exception as e:
-                logger.error(f"Error updating blink chart: {e}")
+                logger.error(f"Error updating dashboard/charts: {e}")
 
-            # Check alerts with error handling
+            # Check alerts
             try:
                 self.alert_manager.check_break_reminder(
                     time_until_break, is_on_break, fatigue_score)
-            except Exception as e:
-                logger.error(f"Error checking break reminder: {e}")
-
-            try:
                 self.alert_manager.check_fatigue_level(fatigue_score)
-            except Exception as e:
-                logger.error(f"Error checking fatigue level: {e}")
-
-            try:
                 if self.eye_tracker and blink_rate > 0:
                     self.alert_manager.check_eye_strain(blink_rate)
             except Exception as e:
-                logger.error(f"Error checking eye strain: {e}")
-
-            # Auto-save session periodically
-            if self.current_session:
-                seconds_elapsed = session_time.total_seconds()
-                
-                # Save every minute
-                if seconds_elapsed % 60 == 0:
-                    self.data_manager.save_session(self.current_session)
-                    
-                    # Heartbeat log (every minute)
-                    logger.info(
-                        f"HEARTBEAT | Session: {self.current_session.session_id} | "
-                        f"Work: {work_time.total_seconds()/60:.1f}m | "
-                        f"Fatigue: {fatigue_score.score:.1f} | "
-                        f"Status: {'Break' if is_on_break else 'Working'}"
-                    )
-
+                logger.error(f"Error checking alerts: {e}")
+
+            # Auto-save session once a minute (monotonic, off the Tk thread)
+            now_m = time.monotonic()
+            if self.current_session and now_m - self._last_session_save >= 60:
+                self._last_session_save = now_m
+                # Hand the worker a detached copy, not the live session
+                snapshot = Session.from_dict(self.current_session.to_dict())
+                self._save_queue.put(
+                    (self.data_manager.save_session, (snapshot,)))
+
+                # Heartbeat log (every minute)
+                logger.info(
+                    f"HEARTBEAT | Session: {self.current_session.session_id} | "
+                    f"Work: {work_minutes:.1f}m | "
+                    f"Fatigue: {fatigue_score.score:.1f} | "
+                    f"Status: {'Break' if is_on_break else 'Working'}"
+                )
 
         except Exception as e:
             logger.error(f"Error updating UI: {e}", exc_info=True)
 
+    def _refresh_charts(self):
+        """Push the chart histories to the Analytics charts in one redraw batch"""
+        # Charts only exist once the Analytics page has been built
+        if "Analytics" not in self.pages:
+            return
+
+        with self._batched_redraw():
+            if self.activity_history:
+                self._push_chart_data(
+                    self.activity_chart, self.activity_history)
+            if self.fatigue_history:
+                self._push_chart_data(
+                    self.fatigue_chart, self.fatigue_history)
+            if self.eye_tracker and self.blink_history:
+                # Create chart if not exists
+                if self.blink_chart is None:
+                    self._create_blink_chart()
+                if self.blink_chart:
+                    self._push_chart_data(
+                        self.blink_chart, self.blink_history)
+
+    @staticmethod
+    def _prune(history: deque, cutoff: datetime):
+        """Drop samples older than cutoff from the left of a history deque"""
+        while history and history[0][0] < cutoff:
+            history.popleft()
+
+    @contextmanager
+    def _batched_redraw(self):
+        """Defer chart redraws requested inside the block into a single flush"""
+        self._redraw_batch_depth += 1
+        try:
+            yield
+        finally:
+            self._redraw_batch_depth -= 1
+            if self._redraw_batch_depth == 0 and self._dirty_charts:
+                self._request_redraw()
+
+    def _push_chart_data(self, chart, data):
+        """Update chart data and queue its canvas for the next redraw"""
+        # Skip charts whose history has not changed since the last push.
+        # Histories are pruned from the left, so the length alone can stay
+        # constant while the data moves; the newest timestamp catches that.
+        key = (len(data), data[-1][0] if data else None)
+        if self._last_chart_key.get(chart) == key:
+            return
+        self._last_chart_key[chart] = key
+
+        chart.update_data(data, draw=False)
+        if chart not in self._dirty_charts:
+            self._dirty_charts.append(chart)
+        if self._redraw_batch_depth == 0:
+            self._request_redraw()
+
+    def _request_redraw(self):
+        """Schedule a redraw of dirty charts in 50 ms if none is pending"""
+        if self._redraw_pending:
+            return
+        self._redraw_pending = True
+        self.after(50, self._flush_redraw)
+
+    def _flush_redraw(self):
+        """Redraw all charts that received data since the last flush"""
+        self._redraw_pending = False
+        charts, self._dirty_charts = self._dirty_charts, []
+        for chart in charts:
+            try:
+                chart.canvas.draw_idle()
+            except Exception as e:
+                logger.error(f"Error redrawing chart: {e}")
+
     def _start_update_loop(self):
-        """Start the UI update loop"""
-        self._update_ui()
-        self.after(self.update_interval, self._start_update_loop)
+        """
+        Drain worker snapshots every 50 ms while monitoring.
+
+        The next poll is scheduled relative to when this one started, so
+        time spent updating widgets does not stretch the period.
+        """
+        self._update_job = None
+        started = time.monotonic()
+        self._drain_queue()
+        if self.is_monitoring:
+            elapsed_ms = int((time.monotonic() - started) * 1000)
+            self._update_job = self.after(
+                max(1, 50 - elapsed_ms), self._start_update_loop)
 
     def _create_blink_chart(self):
         """Create blink rate chart dynamically"""
@@ -1545,7 +1731,7 @@ class MainWindow(ctk.CTk):
                 self.deiconify()
             self.lift()
             self.attributes('-topmost', True)
-            self.after(500, lambda: self.attributes('-topmost', False))
+            self.after(500, partial(self.attributes, '-topmost', False))
         except Exception as e:
             logger.error(f"Error bringing window to front: {e}", exc_info=True)
 
@@ -1559,7 +1745,8 @@ class MainWindow(ctk.CTk):
             # Start activity
             if hasattr(self, 'activity_browser'):
                 # Short delay to ensure page is visible
-                self.after(100, lambda: self.activity_browser.start_activity(activity))
+                self.after(100, partial(
+                    self.activity_browser.start_activity, activity))
                 
         except Exception as e:
             logger.error(f"Failed to start activity from alert: {e}")
@@ -1595,42 +1782,43 @@ Great work! Remember to take regular breaks.
     def _on_settings_saved(self):
         """Handle settings save"""
         try:
+            config = self.config_manager.snapshot()
+
             # Apply theme change
-            theme = self.config_manager.get('ui.theme', 'dark')
+            theme = config.get('ui.theme', 'dark')
             ctk.set_appearance_mode(theme)
 
             # Handle eye tracking setting change
-            eye_tracking_enabled = self.config_manager.get(
-                'eye_tracking.enabled', False)
+            eye_tracking_enabled = config.get('eye_tracking.enabled', False)
 
             # If monitoring is active, dynamically start/stop eye tracking
             if self.is_monitoring:
                 if eye_tracking_enabled and not self.eye_tracker:
                     # User enabled eye tracking - start it
                     try:
-                        self.eye_tracker = EyeTracker(
-                            camera_index=self.config_manager.get(
+                        # Publish the tracker to the worker only once started
+                        eye_tracker = EyeTracker(
+                            camera_index=config.get(
                                 'eye_tracking.camera_index', 0))
-                        if self.eye_tracker.start():
+                        if eye_tracker.start():
+                            with self._monitor_lock:
+                                self.eye_tracker = eye_tracker
                             logger.info("Eye tracking enabled during session")
                             messagebox.showinfo(
                                 "Eye Tracking", "Eye tracking enabled! Camera is now active.")
                         else:
                             logger.warning("Eye tracking failed to start")
-                            self.eye_tracker = None
                             messagebox.showwarning(
                                 "Eye Tracking", "Could not start eye tracking. Check camera availability.")
                     except Exception as e:
                         logger.error(f"Failed to enable eye tracker: {e}")
-                        self.eye_tracker = None
                         messagebox.showerror(
                             "Eye Tracking", f"Error enabling eye tracking: {str(e)}")
 
                 elif not eye_tracking_enabled and self.eye_tracker:
                     # User disabled eye tracking - stop it
                     try:
-                        self.eye_tracker.stop()
-                        self.eye_tracker = None
+                        self._stop_eye_tracker()
                         logger.info("Eye tracking disabled during session")
                         messagebox.showinfo(
                             "Eye Tracking", "Eye tracking disabled. Camera stopped.")
@@ -1640,17 +1828,17 @@ Great work! Remember to take regular breaks.
             # Update components if monitoring
             if self.is_monitoring and self.time_tracker:
                 self.time_tracker.update_intervals(
-                    self.config_manager.get('work_interval_minutes', 50),
-                    self.config_manager.get('break_interval_minutes', 10)
+                    config.get('work_interval_minutes', 50),
+                    config.get('break_interval_minutes', 10)
                 )
 
                 self.alert_manager.enable_alerts(
-                    break_alerts=self.config_manager.get(
-                        'alerts.enable_break_reminders', True), fatigue_alerts=self.config_manager.get(
+                    break_alerts=config.get(
+                        'alerts.enable_break_reminders', True),
+                    fatigue_alerts=config.get(
                         'alerts.enable_fatigue_alerts', True))
                 self.alert_manager.update_cooldown(
-                    self.config_manager.get(
-                        'alerts.alert_cooldown_minutes', 10))
+                    config.get('alerts.alert_cooldown_minutes', 10))
 
             logger.info("Settings updated")
             if not self.is_monitoring:
@@ -1665,45 +1853,29 @@ Great work! Remember to take regular breaks.
         """Save settings from inline settings page"""
         try:
             # Parse and validate inputs
-            work_minutes = int(self.work_interval_var.get())
-            break_minutes = int(self.break_interval_var.get())
-            cooldown_minutes = int(self.alert_cooldown_var.get())
+            work_minutes = int(self.work_entry.get())
+            break_minutes = int(self.break_entry.get())
+            cooldown_minutes = int(self.cooldown_entry.get())
 
             if work_minutes < 1 or break_minutes < 1 or cooldown_minutes < 1:
                 raise ValueError("Values must be positive")
 
-            # Update config
-            self.config_manager.set('work_interval_minutes', work_minutes)
-            self.config_manager.set('break_interval_minutes', break_minutes)
-
-            self.config_manager.set(
-                'monitoring.track_keyboard',
-                self.track_keyboard_var.get())
-            self.config_manager.set(
-                'monitoring.track_mouse_clicks',
-                self.track_mouse_clicks_var.get())
-            self.config_manager.set(
-                'monitoring.track_mouse_movement',
-                self.track_mouse_movement_var.get())
-
-            self.config_manager.set(
-                'alerts.enable_break_reminders',
-                self.break_alerts_var.get())
-            self.config_manager.set(
-                'alerts.enable_fatigue_alerts',
-                self.fatigue_alerts_var.get())
-            self.config_manager.set(
-                'alerts.alert_cooldown_minutes',
-                cooldown_minutes)
-
-            self.config_manager.set('ui.theme', self.theme_var.get())
-
-            self.config_manager.set(
-                'eye_tracking.enabled',
-                self.eye_tracking_var.get())
-
-            # Save to file
-            self.config_manager.save()
+            # Update and save config in one pass
+            self.config_manager.update({
+                'work_interval_minutes': work_minutes,
+                'break_interval_minutes': break_minutes,
+                'monitoring.track_keyboard': self.track_keyboard_var.get(),
+                'monitoring.track_mouse_clicks': self.track_mouse_clicks_var.get(),
+                'monitoring.track_mouse_movement': self.track_mouse_movement_var.get(),
+                'alerts.enable_break_reminders': self.break_alerts_var.get(),
+                'alerts.enable_fatigue_alerts': self.fatigue_alerts_var.get(),
+                'alerts.alert_cooldown_minutes': cooldown_minutes,
+                'ui.theme': self.theme_var.get(),
+                # Revoking consent also turns eye tracking off
+                'eye_tracking.enabled': (
+                    self.eye_tracking_var.get() and self.eye_consent_var.get()),
+                'eye_tracking.consent_granted': self.eye_consent_var.get(),
+            })
 
             # Apply settings
             self._on_settings_saved()
@@ -1723,15 +1895,16 @@ Great work! Remember to take regular breaks.
                 "Are you sure you want to reset all settings to defaults?"):
             try:
                 # Reset to defaults
-                self.work_interval_var.set("50")
-                self.break_interval_var.set("10")
+                self._set_entry_text(self.work_entry, "50")
+                self._set_entry_text(self.break_entry, "10")
                 self.track_keyboard_var.set(True)
                 self.track_mouse_clicks_var.set(True)
                 self.track_mouse_movement_var.set(False)
                 self.break_alerts_var.set(True)
                 self.fatigue_alerts_var.set(True)
-                self.alert_cooldown_var.set("10")
+                self._set_entry_text(self.cooldown_entry, "10")
                 self.eye_tracking_var.set(False)
+                self.eye_consent_var.set(False)
                 self.theme_var.set("dark")
 
                 messagebox.showinfo(
@@ -1742,9 +1915,19 @@ Great work! Remember to take regular breaks.
                 messagebox.showerror(
                     "Error", f"Error resetting settings: {str(e)}")
 
+    @staticmethod
+    def _set_entry_text(entry: ctk.CTkEntry, text: str):
+        """Replace the contents of an entry"""
+        entry.delete(0, "end")
+        entry.insert(0, text)
+
     def _on_eye_tracking_toggle(self):
         """Handle eye tracking toggle with consent"""
         if self.eye_tracking_var.get():
+            # Consent was already given; don't ask again
+            if self.eye_consent_var.get():
+                return
+
             # Show consent dialog
             consent = messagebox.askyesno(
                 "Eye Tracking Privacy",
@@ -1757,9 +1940,22 @@ Great work! Remember to take regular breaks.
                 "Do you consent to enable eye tracking?",
                 icon='warning'
             )
-            if not consent:
+            if consent:
+                # Save now so consent survives leaving the page unsaved
+                self.config_manager.update(
+                    {'eye_tracking.consent_granted': True})
+                self.eye_consent_var.set(True)
+            else:
                 self.eye_tracking_var.set(False)
 
+    def _deferred_setup(self):
+        """Initialize subsystems that are not needed for the first paint"""
+        try:
+            # Key bindings must be created on the Tk thread
+            self._setup_keyboard_shortcuts()
+        except Exception as e:
+            logger.error(f"Failed to setup keyboard shortcuts: {e}")
+
     def _setup_keyboard_shortcuts(self):
         """Setup keyboard shortcuts"""
         self.keyboard_handler = KeyboardHandler(self)
@@ -1828,6 +2024,7 @@ Great work! Remember to take regular breaks.
 
     def _quit_app(self):
         """Quit the application"""
+        self._shutdown_saves()
         self.destroy()
 
     def _on_close(self):
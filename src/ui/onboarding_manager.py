@@ -1,40 +1,68 @@
 """Onboarding tutorial system"""
 from pathlib import Path
-from typing import Optional, List, Dict
-import json
+from typing import Optional, Dict, Mapping, Tuple
+import os
+from types import MappingProxyType
+
+from src.utils.helpers import json_dumps, json_loads
+
+
+# Tutorial steps are shared, read-only mappings built once at import.
+# The keys and ids are identifier-like literals, which CPython already
+# interns, so all steps share the same four key objects.
+_STEPS = tuple(MappingProxyType(step) for step in (
+    {
+        'id': 'welcome',
+        'title': 'Welcome to Cognitive Fatigue Tracker! 🧠',
+        'content': 'This app helps you maintain productivity while preventing burnout by tracking your work patterns and reminding you to take breaks.',
+        'action': 'Get Started'
+    },
+    {
+        'id': 'start_session',
+        'title': 'Starting a Session',
+        'content': 'Click "Start Session" to begin tracking your work. The app will monitor your activity and calculate fatigue levels in real-time.',
+        'action': 'Next'
+    },
+    {
+        'id': 'breaks',
+        'title': 'Taking Breaks',
+        'content': 'Regular breaks are essential! The app will remind you when it\'s time for a break. Click "Take Break" to pause tracking.',
+        'action': 'Next'
+    },
+    {
+        'id': 'dashboard',
+        'title': 'Understanding Your Dashboard',
+        'content': 'Monitor your fatigue score, work time, activity rate, and other metrics in real-time. Charts show your trends over time.',
+        'action': 'Next'
+    },
+    {
+        'id': 'keyboard',
+        'title': 'Keyboard Shortcuts ⌨️',
+        'content': 'Use shortcuts for quick actions:\n• Ctrl+B: Take Break\n• Ctrl+S: Settings\n• Ctrl+Q: Quit\n• F1: Show all shortcuts',
+        'action': 'Next'
+    },
+    {
+        'id': 'settings',
+        'title': 'Customize Your Experience',
+        'content': 'Visit Settings to adjust work intervals, break durations, alert preferences, and enable features like eye tracking.',
+        'action': 'Next'
+    },
+    {
+        'id': 'complete',
+        'title': "You're Ready! 🎉",
+        'content': 'Start your first session and build healthy work habits. Remember: productivity is a marathon, not a sprint!',
+        'action': 'Start First Session'
+    }
+))
+_LAST_STEP_INDEX = len(_STEPS) - 1
 
 
 class OnboardingManager:
     """Manages first-time user onboarding"""
 
-    TUTORIAL_STEPS = [{'id': 'welcome',
-                       'title': 'Welcome to Cognitive Fatigue Tracker! 🧠',
-                       'content': 'This app helps you maintain productivity while preventing burnout by tracking your work patterns and reminding you to take breaks.',
-                       'action': 'Get Started'},
-                      {'id': 'start_session',
-                       'title': 'Starting a Session',
-                       'content': 'Click "Start Session" to begin tracking your work. The app will monitor your activity and calculate fatigue levels in real-time.',
-                       'action': 'Next'},
-                      {'id': 'breaks',
-                       'title': 'Taking Breaks',
-                       'content': 'Regular breaks are essential! The app will remind you when it\'s time for a break. Click "Take Break" to pause tracking.',
-                       'action': 'Next'},
-                      {'id': 'dashboard',
-                       'title': 'Understanding Your Dashboard',
-                       'content': 'Monitor your fatigue score, work time, activity rate, and other metrics in real-time. Charts show your trends over time.',
-                       'action': 'Next'},
-                      {'id': 'keyboard',
-                       'title': 'Keyboard Shortcuts ⌨️',
-                       'content': 'Use shortcuts for quick actions:\n• Ctrl+B: Take Break\n• Ctrl+S: Settings\n• Ctrl+Q: Quit\n• F1: Show all shortcuts',
-                       'action': 'Next'},
-                      {'id': 'settings',
-                       'title': 'Customize Your Experience',
-                       'content': 'Visit Settings to adjust work intervals, break durations, alert preferences, and enable features like eye tracking.',
-                       'action': 'Next'},
-                      {'id': 'complete',
-                       'title': 'You\'re Ready! 🎉',
-                       'content': 'Start your first session and build healthy work habits. Remember: productivity is a marathon, not a sprint!',
-                       'action': 'Start First Session'}]
+    __slots__ = ('onboarding_file', '_status')
+
+    TUTORIAL_STEPS = _STEPS
 
     def __init__(self, onboarding_file: Optional[Path] = None):
         """
@@ -48,16 +76,26 @@ class OnboardingManager:
                 __file__).parent.parent.parent / "data" / "onboarding.json"
 
         self.onboarding_file = Path(onboarding_file)
-        self.onboarding_file.parent.mkdir(parents=True, exist_ok=True)
+        # Read on first access to self.status
+        self._status: Optional[Dict] = None
+
+    @property
+    def status(self) -> Dict:
+        """Onboarding status, loaded from disk on first access"""
+        if self._status is None:
+            self._status = self._load_status()
+        return self._status
 
-        self.status = self._load_status()
+    @status.setter
+    def status(self, value: Dict):
+        self._status = value
 
     def _load_status(self) -> Dict:
         """Load onboarding status"""
         if self.onboarding_file.exists():
             try:
-                with open(self.onboarding_file, 'r') as f:
-                    return json.load(f)
+                status: Dict = json_loads(self.onboarding_file.read_bytes())
+                return status
             except Exception:
                 pass
 
@@ -68,23 +106,23 @@ class OnboardingManager:
         }
 
     def _save_status(self):
-        """Save onboarding status"""
+        """Save onboarding status (atomically, via a temp file)"""
+        tmp_file = self.onboarding_file.with_suffix('.json.tmp')
         try:
-            with open(self.onboarding_file, 'w') as f:
-                json.dump(self.status, f, indent=2)
+            self.onboarding_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_bytes(json_dumps(self.status))
+            os.replace(tmp_file, self.onboarding_file)
         except Exception:
             pass
 
     def should_show_onboarding(self) -> bool:
         """Check if onboarding should be shown"""
-        return not self.status['completed'] and not self.status['skipped']
+        return not (self.status['completed'] or self.status['skipped'])
 
-    def get_current_step(self) -> Dict:
+    def get_current_step(self) -> Mapping:
         """Get current tutorial step"""
-        step_index = self.status['current_step']
-        if step_index < len(self.TUTORIAL_STEPS):
-            return self.TUTORIAL_STEPS[step_index]
-        return self.TUTORIAL_STEPS[-1]
+        return self.TUTORIAL_STEPS[
+            min(self.status['current_step'], _LAST_STEP_INDEX)]
 
     def next_step(self):
         """Move to next tutorial step"""
@@ -113,6 +151,6 @@ class OnboardingManager:
         }
         self._save_status()
 
-    def get_all_steps(self) -> List[Dict]:
+    def get_all_steps(self) -> Tuple[Mapping, ...]:
         """Get all tutorial steps"""
         return self.TUTORIAL_STEPS
@@ -1,6 +1,80 @@
 """Settings dialog for configuration"""
 import customtkinter as ctk
-from typing import Callable, Optional
+import tkinter as tk
+from tkinter import messagebox
+from typing import Callable, NamedTuple, Optional, Tuple, Union
+from src.utils.logger import default_logger as logger
+
+
+class _SettingField(NamedTuple):
+    """Dialog variable bound to a pre-split config key path"""
+    attr: str
+    path: Tuple[str, ...]
+    default: Union[bool, int, str]
+
+
+class _SettingRow(NamedTuple):
+    """One section row; notes have no variable"""
+    kind: str
+    attr: Optional[str]
+    text: str
+    options: Tuple[str, ...] = ()
+
+
+_SETTING_FIELDS: Tuple[_SettingField, ...] = (
+    _SettingField('work_interval_var', ('work_interval_minutes',), 50),
+    _SettingField('break_interval_var', ('break_interval_minutes',), 10),
+    _SettingField('track_keyboard_var', ('monitoring', 'track_keyboard'), True),
+    _SettingField('track_mouse_clicks_var', ('monitoring', 'track_mouse_clicks'), True),
+    _SettingField('track_mouse_movement_var', ('monitoring', 'track_mouse_movement'), False),
+    _SettingField('break_alerts_var', ('alerts', 'enable_break_reminders'), True),
+    _SettingField('fatigue_alerts_var', ('alerts', 'enable_fatigue_alerts'), True),
+    _SettingField('alert_cooldown_var', ('alerts', 'alert_cooldown_minutes'), 10),
+    _SettingField('theme_var', ('ui', 'theme'), 'dark'),
+    _SettingField('eye_tracking_var', ('eye_tracking', 'enabled'), False),
+    _SettingField('eye_consent_var', ('eye_tracking', 'consent_granted'), False),
+    _SettingField('minimize_to_tray_var', ('ui', 'minimize_to_tray'), False),
+)
+
+# Section title -> rows
+_SECTIONS: Tuple[Tuple[str, Tuple[_SettingRow, ...]], ...] = (
+    ("Work Interval", (
+        _SettingRow("entry", "work_interval_var", "Minutes:"),
+    )),
+    ("Break Interval", (
+        _SettingRow("entry", "break_interval_var", "Minutes:"),
+    )),
+    ("Activity Monitoring", (
+        _SettingRow("check", "track_keyboard_var", "Track Keyboard"),
+        _SettingRow("check", "track_mouse_clicks_var", "Track Mouse Clicks"),
+        _SettingRow("check", "track_mouse_movement_var", "Track Mouse Movement"),
+    )),
+    ("Alerts & Notifications", (
+        _SettingRow("check", "break_alerts_var", "Enable Break Reminders"),
+        _SettingRow("check", "fatigue_alerts_var", "Enable Fatigue Alerts"),
+        _SettingRow("entry", "alert_cooldown_var", "Alert Cooldown (minutes):"),
+    )),
+    ("👁️ Eye Tracking (Optional)", (
+        _SettingRow("note", None,
+                    "⚠️ Privacy: Eye tracking uses your webcam to detect blinks.\n"
+                    "No video is recorded or stored - only blink counts are tracked."),
+        _SettingRow("check", "eye_tracking_var",
+                    "Enable Eye Tracking (Blink Rate Monitoring)"),
+        _SettingRow("check", "eye_consent_var",
+                    "Camera consent given (uncheck to revoke)"),
+    )),
+    ("System", (
+        _SettingRow("check", "minimize_to_tray_var", "Minimize to Tray on Close"),
+    )),
+    ("Appearance", (
+        _SettingRow("option", "theme_var", "Theme:", ("dark", "light")),
+    )),
+)
+
+
+def _is_positive_int(proposed: str) -> bool:
+    """Entry validator: allow only digits (empty while editing)"""
+    return proposed == "" or proposed.isdigit()
 
 
 class SettingsDialog(ctk.CTkToplevel):
@@ -30,187 +104,70 @@ class SettingsDialog(ctk.CTkToplevel):
 
     def _create_widgets(self):
         """Create settings widgets"""
+        validate_int = (self.register(_is_positive_int), '%P')
+        # One font object shared by every section header
+        header_font = ctk.CTkFont(size=16, weight="bold")
+        defaults = {attr: default for attr, _, default in _SETTING_FIELDS}
+        commands = {'eye_tracking_var': self._on_eye_tracking_toggle}
 
         # Main container
         container = ctk.CTkScrollableFrame(self)
         container.pack(fill="both", expand=True, padx=20, pady=20)
 
-        # Work Interval Section
-        work_section = ctk.CTkFrame(container)
-        work_section.pack(fill="x", pady=(0, 15))
-
-        ctk.CTkLabel(
-            work_section,
-            text="Work Interval",
-            font=ctk.CTkFont(size=16, weight="bold")
-        ).pack(anchor="w", padx=15, pady=(15, 5))
-
-        self.work_interval_var = ctk.StringVar(value="50")
-        work_frame = ctk.CTkFrame(work_section, fg_color="transparent")
-        work_frame.pack(fill="x", padx=15, pady=(0, 15))
-
-        ctk.CTkLabel(work_frame, text="Minutes:").pack(side="left")
-        ctk.CTkEntry(
-            work_frame,
-            textvariable=self.work_interval_var,
-            width=100
-        ).pack(side="left", padx=(10, 0))
-
-        # Break Interval Section
-        break_section = ctk.CTkFrame(container)
-        break_section.pack(fill="x", pady=(0, 15))
-
-        ctk.CTkLabel(
-            break_section,
-            text="Break Interval",
-            font=ctk.CTkFont(size=16, weight="bold")
-        ).pack(anchor="w", padx=15, pady=(15, 5))
-
-        self.break_interval_var = ctk.StringVar(value="10")
-        break_frame = ctk.CTkFrame(break_section, fg_color="transparent")
-        break_frame.pack(fill="x", padx=15, pady=(0, 15))
-
-        ctk.CTkLabel(break_frame, text="Minutes:").pack(side="left")
-        ctk.CTkEntry(
-            break_frame,
-            textvariable=self.break_interval_var,
-            width=100
-        ).pack(side="left", padx=(10, 0))
-
-        # Monitoring Section
-        monitor_section = ctk.CTkFrame(container)
-        monitor_section.pack(fill="x", pady=(0, 15))
-
-        ctk.CTkLabel(
-            monitor_section,
-            text="Activity Monitoring",
-            font=ctk.CTkFont(size=16, weight="bold")
-        ).pack(anchor="w", padx=15, pady=(15, 5))
-
-        self.track_keyboard_var = ctk.BooleanVar(value=True)
-        ctk.CTkCheckBox(
-            monitor_section,
-            text="Track Keyboard",
-            variable=self.track_keyboard_var
-        ).pack(anchor="w", padx=15, pady=5)
-
-        self.track_mouse_clicks_var = ctk.BooleanVar(value=True)
-        ctk.CTkCheckBox(
-            monitor_section,
-            text="Track Mouse Clicks",
-            variable=self.track_mouse_clicks_var
-        ).pack(anchor="w", padx=15, pady=5)
-
-        self.track_mouse_movement_var = ctk.BooleanVar(value=False)
-        ctk.CTkCheckBox(
-            monitor_section,
-            text="Track Mouse Movement",
-            variable=self.track_mouse_movement_var
-        ).pack(anchor="w", padx=15, pady=(5, 15))
-
-        # Alerts Section
-        alerts_section = ctk.CTkFrame(container)
-        alerts_section.pack(fill="x", pady=(0, 15))
-
-        ctk.CTkLabel(
-            alerts_section,
-            text="Alerts & Notifications",
-            font=ctk.CTkFont(size=16, weight="bold")
-        ).pack(anchor="w", padx=15, pady=(15, 5))
-
-        self.break_alerts_var = ctk.BooleanVar(value=True)
-        ctk.CTkCheckBox(
-            alerts_section,
-            text="Enable Break Reminders",
-            variable=self.break_alerts_var
-        ).pack(anchor="w", padx=15, pady=5)
-
-        self.fatigue_alerts_var = ctk.BooleanVar(value=True)
-        ctk.CTkCheckBox(
-            alerts_section,
-            text="Enable Fatigue Alerts",
-            variable=self.fatigue_alerts_var
-        ).pack(anchor="w", padx=15, pady=5)
-
-        self.alert_cooldown_var = ctk.StringVar(value="10")
-        cooldown_frame = ctk.CTkFrame(alerts_section, fg_color="transparent")
-        cooldown_frame.pack(fill="x", padx=15, pady=(5, 15))
-
-        ctk.CTkLabel(
-            cooldown_frame,
-            text="Alert Cooldown (minutes):").pack(
-            side="left")
-        ctk.CTkEntry(
-            cooldown_frame,
-            textvariable=self.alert_cooldown_var,
-            width=100
-        ).pack(side="left", padx=(10, 0))
-
-        # Eye Tracking Section (NEW)
-        eye_section = ctk.CTkFrame(container)
-        eye_section.pack(fill="x", pady=(0, 15))
-
-        ctk.CTkLabel(
-            eye_section,
-            text="👁️ Eye Tracking (Optional)",
-            font=ctk.CTkFont(size=16, weight="bold")
-        ).pack(anchor="w", padx=15, pady=(15, 5))
-
-        # Privacy notice
-        privacy_label = ctk.CTkLabel(
-            eye_section,
-            text="⚠️ Privacy: Eye tracking uses your webcam to detect blinks.\nNo video is recorded or stored - only blink counts are tracked.",
-            font=ctk.CTkFont(
-                size=10),
-            text_color="#FFC107",
-            justify="left")
-        privacy_label.pack(anchor="w", padx=15, pady=5)
-
-        self.eye_tracking_var = ctk.BooleanVar(value=False)
-        ctk.CTkCheckBox(
-            eye_section,
-            text="Enable Eye Tracking (Blink Rate Monitoring)",
-            variable=self.eye_tracking_var,
-            command=self._on_eye_tracking_toggle
-        ).pack(anchor="w", padx=15, pady=(10, 15))
-
-        # System Section
-        system_section = ctk.CTkFrame(container)
-        system_section.pack(fill="x", pady=(0, 15))
-
-        ctk.CTkLabel(
-            system_section,
-            text="System",
-            font=ctk.CTkFont(size=16, weight="bold")
-        ).pack(anchor="w", padx=15, pady=(15, 5))
-
-        self.minimize_to_tray_var = ctk.BooleanVar(value=False)
-        ctk.CTkCheckBox(
-            system_section,
-            text="Minimize to Tray on Close",
-            variable=self.minimize_to_tray_var
-        ).pack(anchor="w", padx=15, pady=10)
-
-        # UI Theme Section
-        theme_section = ctk.CTkFrame(container)
-        theme_section.pack(fill="x", pady=(0, 15))
-
-        ctk.CTkLabel(
-            theme_section,
-            text="Appearance",
-            font=ctk.CTkFont(size=16, weight="bold")
-        ).pack(anchor="w", padx=15, pady=(15, 5))
-
-        self.theme_var = ctk.StringVar(value="dark")
-        theme_frame = ctk.CTkFrame(theme_section, fg_color="transparent")
-        theme_frame.pack(fill="x", padx=15, pady=(0, 15))
-
-        ctk.CTkLabel(theme_frame, text="Theme:").pack(side="left")
-        ctk.CTkOptionMenu(
-            theme_frame,
-            variable=self.theme_var,
-            values=["dark", "light"]
-        ).pack(side="left", padx=(10, 0))
+        for title, rows in _SECTIONS:
+            section = ctk.CTkFrame(container)
+            section.pack(fill="x", pady=(0, 15))
+
+            ctk.CTkLabel(
+                section,
+                text=title,
+                font=header_font
+            ).pack(anchor="w", padx=15, pady=(15, 5))
+
+            for i, (kind, attr, text, options) in enumerate(rows):
+                pady = (5, 15) if i == len(rows) - 1 else 5
+
+                if attr is None:  # note
+                    ctk.CTkLabel(
+                        section,
+                        text=text,
+                        font=ctk.CTkFont(size=10),
+                        text_color="#FFC107",
+                        justify="left"
+                    ).pack(anchor="w", padx=15, pady=pady)
+                    continue
+
+                if kind == "check":
+                    var = ctk.BooleanVar(value=defaults[attr])
+                    ctk.CTkCheckBox(
+                        section,
+                        text=text,
+                        variable=var,
+                        command=commands.get(attr)
+                    ).pack(anchor="w", padx=15, pady=pady)
+                else:
+                    row = ctk.CTkFrame(section, fg_color="transparent")
+                    row.pack(fill="x", padx=15, pady=pady)
+                    ctk.CTkLabel(row, text=text).pack(side="left")
+
+                    if kind == "entry":
+                        var = ctk.IntVar(value=defaults[attr])
+                        ctk.CTkEntry(
+                            row,
+                            textvariable=var,
+                            width=100,
+                            validate="key",
+                            validatecommand=validate_int
+                        ).pack(side="left", padx=(10, 0))
+                    else:  # option
+                        var = ctk.StringVar(value=defaults[attr])
+                        ctk.CTkOptionMenu(
+                            row,
+                            variable=var,
+                            values=list(options)
+                        ).pack(side="left", padx=(10, 0))
+
+                setattr(self, attr, var)
 
         # Buttons
         button_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -232,45 +189,19 @@ class SettingsDialog(ctk.CTkToplevel):
 
     def _load_current_settings(self):
         """Load current settings from config manager"""
-        self.work_interval_var.set(
-            str(self.config_manager.get('work_interval_minutes', 50)))
-        self.break_interval_var.set(
-            str(self.config_manager.get('break_interval_minutes', 10)))
-
-        self.track_keyboard_var.set(
-            self.config_manager.get(
-                'monitoring.track_keyboard', True))
-        self.track_mouse_clicks_var.set(
-            self.config_manager.get(
-                'monitoring.track_mouse_clicks', True))
-        self.track_mouse_movement_var.set(
-            self.config_manager.get(
-                'monitoring.track_mouse_movement', False))
-
-        self.break_alerts_var.set(
-            self.config_manager.get(
-                'alerts.enable_break_reminders', True))
-        self.fatigue_alerts_var.set(
-            self.config_manager.get(
-                'alerts.enable_fatigue_alerts', True))
-        self.alert_cooldown_var.set(
-            str(self.config_manager.get('alerts.alert_cooldown_minutes', 10)))
-
-        self.theme_var.set(self.config_manager.get('ui.theme', 'dark'))
-
-        self.eye_tracking_var.set(
-            self.config_manager.get(
-                'eye_tracking.enabled', False))
-
-        self.minimize_to_tray_var.set(
-            self.config_manager.get('ui.minimize_to_tray', False))
+        for attr, path, default in _SETTING_FIELDS:
+            getattr(self, attr).set(
+                self.config_manager.get_path(path, default))
 
     def _on_eye_tracking_toggle(self):
         """Handle eye tracking toggle with consent"""
         if self.eye_tracking_var.get():
+            # Consent was already given; don't ask again
+            if self.eye_consent_var.get():
+                return
+
             # Show consent dialog
             try:
-                from tkinter import messagebox
                 consent = messagebox.askyesno(
                     "Eye Tracking Privacy",
                     "Eye tracking will use your webcam to monitor blink rate.\n\n"
@@ -281,87 +212,60 @@ class SettingsDialog(ctk.CTkToplevel):
                     "• You can disable this anytime\n\n"
                     "Do you consent to enable eye tracking?",
                     icon='warning')
-                if not consent:
+                if consent:
+                    # Save now so consent survives a cancelled dialog
+                    self.config_manager.update(
+                        {'eye_tracking.consent_granted': True})
+                    self.eye_consent_var.set(True)
+                else:
                     self.eye_tracking_var.set(False)
             except Exception as e:
                 # If dialog fails, disable and continue
-                print(f"Eye tracking consent error: {e}")
+                logger.error(f"Eye tracking consent error: {e}")
                 self.eye_tracking_var.set(False)
 
     def _save_settings(self):
         """Save settings to config manager"""
+        # Entries only accept digits, so the only invalid states left are
+        # an empty entry (TclError on get) or zero
         try:
-            # Parse and validate inputs
-            work_minutes = int(self.work_interval_var.get())
-            break_minutes = int(self.break_interval_var.get())
-            cooldown_minutes = int(self.alert_cooldown_var.get())
-
-            if work_minutes < 1 or break_minutes < 1 or cooldown_minutes < 1:
-                raise ValueError("Values must be positive")
-
-            # Update config
-            self.config_manager.set('work_interval_minutes', work_minutes)
-            self.config_manager.set('break_interval_minutes', break_minutes)
-
-            self.config_manager.set(
-                'monitoring.track_keyboard',
-                self.track_keyboard_var.get())
-            self.config_manager.set(
-                'monitoring.track_mouse_clicks',
-                self.track_mouse_clicks_var.get())
-            self.config_manager.set(
-                'monitoring.track_mouse_movement',
-                self.track_mouse_movement_var.get())
-
-            self.config_manager.set(
-                'alerts.enable_break_reminders',
-                self.break_alerts_var.get())
-            self.config_manager.set(
-                'alerts.enable_fatigue_alerts',
-                self.fatigue_alerts_var.get())
-            self.config_manager.set(
-                'alerts.alert_cooldown_minutes',
-                cooldown_minutes)
-
-            self.config_manager.set('ui.theme', self.theme_var.get())
-
-            self.config_manager.set(
-                'eye_tracking.enabled',
-                self.eye_tracking_var.get())
-
-            self.config_manager.set(
-                'ui.minimize_to_tray',
-                self.minimize_to_tray_var.get())
-
-            # Save to file
-            self.config_manager.save()
-
-            # Call callback
-            if self.on_save:
-                try:
-                    self.on_save()
-                except Exception as e:
-                    print(f"Error in settings save callback: {e}")
-                    import traceback
-                    traceback.print_exc()
-
-            # Close dialog
-            self.destroy()
-
-        except ValueError as e:
-            # Show error
-            error_dialog = ctk.CTkToplevel(self)
-            error_dialog.title("Invalid Input")
-            error_dialog.geometry("300x150")
+            work_minutes = self.work_interval_var.get()
+            break_minutes = self.break_interval_var.get()
+            cooldown_minutes = self.alert_cooldown_var.get()
+        except tk.TclError:
+            work_minutes = break_minutes = cooldown_minutes = 0
+
+        if work_minutes < 1 or break_minutes < 1 or cooldown_minutes < 1:
+            messagebox.showerror(
+                "Invalid Input",
+                "Please enter valid positive numbers",
+                parent=self)
+            return
+
+        # Update and save config in one pass
+        self.config_manager.update({
+            'work_interval_minutes': work_minutes,
+            'break_interval_minutes': break_minutes,
+            'monitoring.track_keyboard': self.track_keyboard_var.get(),
+            'monitoring.track_mouse_clicks': self.track_mouse_clicks_var.get(),
+            'monitoring.track_mouse_movement': self.track_mouse_movement_var.get(),
+            'alerts.enable_break_reminders': self.break_alerts_var.get(),
+            'alerts.enable_fatigue_alerts': self.fatigue_alerts_var.get(),
+            'alerts.alert_cooldown_minutes': cooldown_minutes,
+            'ui.theme': self.theme_var.get(),
+            # Revoking consent also turns eye tracking off
+            'eye_tracking.enabled': (
+                self.eye_tracking_var.get() and self.eye_consent_var.get()),
+            'eye_tracking.consent_granted': self.eye_consent_var.get(),
+            'ui.minimize_to_tray': self.minimize_to_tray_var.get(),
+        })
+
+        # Call callback
+        if self.on_save:
+            try:
+                self.on_save()
+            except Exception:
+                logger.exception("Error in settings save callback")
 
-            ctk.CTkLabel(
-                error_dialog,
-                text="Please enter valid positive numbers",
-                wraplength=250
-            ).pack(expand=True, padx=20, pady=20)
-
-            ctk.CTkButton(
-                error_dialog,
-                text="OK",
-                command=error_dialog.destroy
-            ).pack(pady=(0, 20))
+        # Close dialog
+        self.destroy()
@@ -11,7 +11,7 @@ class ShortcutsHelpDialog(ctk.CTkToplevel):
 
         Args:
             parent: Parent window
-            shortcuts_list: List of (key_combination, description) tuples
+            shortcuts_list: Sorted (key_combination, description) tuples
         """
         super().__init__(parent)
 
@@ -42,9 +42,22 @@ class ShortcutsHelpDialog(ctk.CTkToplevel):
         )
         scroll_frame.pack(pady=10, padx=20, fill="both", expand=True)
 
-        # Display shortcuts
-        for key, description in shortcuts_list:
-            self._create_shortcut_row(scroll_frame, key, description)
+        # Display shortcuts as a two-column grid (no per-row frames)
+        scroll_frame.grid_columnconfigure(1, weight=1)
+        for i, (key, description) in enumerate(shortcuts_list):
+            ctk.CTkLabel(
+                scroll_frame,
+                text=key,
+                font=("Consolas", 12, "bold"),
+                width=180,
+                anchor="w"
+            ).grid(row=i, column=0, sticky="w", padx=(10, 20), pady=5)
+            ctk.CTkLabel(
+                scroll_frame,
+                text=description,
+                font=("Segoe UI", 11),
+                anchor="w"
+            ).grid(row=i, column=1, sticky="ew", padx=(0, 10), pady=5)
 
         # Close button
         close_btn = ctk.CTkButton(
@@ -54,27 +67,3 @@ class ShortcutsHelpDialog(ctk.CTkToplevel):
             width=100
         )
         close_btn.pack(pady=20)
-
-    def _create_shortcut_row(self, parent, key, description):
-        """Create a row showing a shortcut"""
-        row = ctk.CTkFrame(parent, fg_color="transparent")
-        row.pack(fill="x", pady=5, padx=10)
-
-        # Key combination (left)
-        key_label = ctk.CTkLabel(
-            row,
-            text=key,
-            font=("Consolas", 12, "bold"),
-            width=180,
-            anchor="w"
-        )
-        key_label.pack(side="left", padx=(0, 20))
-
-        # Description (right)
-        desc_label = ctk.CTkLabel(
-            row,
-            text=description,
-            font=("Segoe UI", 11),
-            anchor="w"
-        )
-        desc_label.pack(side="left", fill="x", expand=True)
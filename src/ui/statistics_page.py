@@ -3,7 +3,10 @@ import customtkinter as ctk
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+import tkinter as tk
 from tkinter import filedialog, messagebox
 
 from src.analysis.statistics import StatisticsManager
@@ -11,12 +14,33 @@ from src.utils.logger import default_logger as logger
 
 class StatisticsPage(ctk.CTkFrame):
     """Statistics Dashboard Page"""
+
+    PIE_COLORS = {
+        'Low': '#22c55e',      # Green
+        'Medium': '#eab308',   # Yellow
+        'High': '#f97316',     # Orange
+        'Critical': '#ef4444'  # Red
+    }
     
     def __init__(self, parent, data_manager):
         super().__init__(parent, fg_color="transparent")
         
         self.stats_manager = StatisticsManager(data_manager)
+
+        # Refresh requests are coalesced into one idle callback
+        self._dirty = False
+        self._refresh_scheduled = False
+        self._batch_depth = 0
+
+        # Statistics queries run on a worker; results are applied on Tk
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="StatsFetch")
+        self._pending_fetch = None
+
         self._create_widgets()
+
+        # Refreshes requested while the page is hidden wait until it is shown
+        self.bind("<Map>", self._on_map)
         self.refresh()
         
     def _create_widgets(self):
@@ -99,12 +123,43 @@ class StatisticsPage(ctk.CTkFrame):
         
         self.figure = Figure(figsize=(5, 4), dpi=100)
         self.figure.patch.set_facecolor('#1e293b')
-        self.ax = self.figure.add_subplot(111)
-        self.ax.set_facecolor('#1e293b')
+        self.ax1 = self.figure.add_subplot(111)
+        self.ax1.set_facecolor('#1e293b')
         
         self.canvas = FigureCanvasTkAgg(self.figure, master=self.chart_container)
         self.canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
 
+        # Dual-axis artists are created once; refreshes only update their
+        # data and blit them over a cached background
+        self.ax2 = self.ax1.twinx()
+        self.ax1.set_ylabel('Active Hours', color='#3b82f6')
+        self.ax2.set_ylabel('Fatigue Score', color='#f97316')
+        self.ax1.tick_params(axis='y', colors='#94a3b8')
+        self.ax2.tick_params(axis='y', colors='#94a3b8')
+        self.ax1.tick_params(axis='x', colors='#94a3b8')
+        for ax in (self.ax1, self.ax2):
+            ax.spines['bottom'].set_color('#334155')
+            ax.spines['top'].set_visible(False)
+            ax.spines['left'].set_color('#334155')
+            ax.spines['right'].set_visible(False)
+
+        # Data is bounded (hours per day, 0-100 fatigue), so fix the limits
+        # and margins up front; draws then skip autoscale and layout passes
+        self.figure.set_tight_layout(False)
+        self.figure.subplots_adjust(left=0.12, right=0.88, top=0.95, bottom=0.1)
+        self.ax1.set_autoscale_on(False)
+        self.ax2.set_autoscale_on(False)
+        self.ax1.set_ylim(0, 24)
+        self.ax2.set_ylim(0, 100)
+
+        self._bars = None
+        self._fatigue_line, = self.ax2.plot(
+            [], [], label='Avg Fatigue', color='#f97316', marker='o',
+            linewidth=2, animated=True)
+        self._chart_dates = None
+        self._chart_bg = None
+        self.canvas.mpl_connect('draw_event', self._on_chart_draw)
+
         # Right Panel: Badges & Fatigue Zones
         right_panel = ctk.CTkFrame(charts_frame, fg_color="transparent")
         right_panel.grid(row=0, column=1, sticky="nsew")
@@ -125,8 +180,16 @@ class StatisticsPage(ctk.CTkFrame):
             font=ctk.CTkFont(size=18, weight="bold"), text_color="#facc15"
         ).pack(anchor="w", padx=20, pady=15)
         
-        self.badges_frame = ctk.CTkFrame(self.badges_container, fg_color="transparent")
-        self.badges_frame.pack(fill="both", expand=True, padx=10, pady=5)
+        # Badges render as tagged text in one read-only textbox rather than
+        # a frame and three labels per badge
+        self._badges_text = ctk.CTkTextbox(
+            self.badges_container, wrap='word', fg_color="transparent",
+            text_color="white", activate_scrollbars=False,
+            font=ctk.CTkFont(size=13))
+        self._badges_text.pack(fill="both", expand=True, padx=10, pady=5)
+        self._badges_text.tag_config('desc', foreground='#94a3b8')
+        self._badge_color_tags = set()
+        self._badges_text.configure(state='disabled')
 
         # 2. Fatigue Zones
         self.pie_container = ctk.CTkFrame(
@@ -141,12 +204,13 @@ class StatisticsPage(ctk.CTkFrame):
             font=ctk.CTkFont(size=18, weight="bold"), text_color="#f97316"
         ).pack(anchor="w", padx=20, pady=10)
 
-        self.pie_figure = Figure(figsize=(4, 3), dpi=100)
-        self.pie_figure.patch.set_facecolor('#1e293b')
-        self.pie_ax = self.pie_figure.add_subplot(111)
-        
-        self.pie_canvas = FigureCanvasTkAgg(self.pie_figure, master=self.pie_container)
-        self.pie_canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
+        # Donut is drawn with native canvas arcs (no matplotlib figure)
+        self.pie_canvas = tk.Canvas(
+            self.pie_container, bg='#1e293b', highlightthickness=0,
+            width=300, height=220)
+        self.pie_canvas.pack(fill="both", expand=True, padx=10, pady=10)
+        self._pie_slices = []  # (label, size, color)
+        self.pie_canvas.bind("<Configure>", lambda e: self._draw_pie())
         
     def _create_metric_card(self, parent, title, label1, val1, label2, val2):
         """Create a standardized metric card"""
@@ -181,162 +245,229 @@ class StatisticsPage(ctk.CTkFrame):
         return card
 
     def refresh(self):
-        """Refresh all data"""
+        """Request a refresh; requests in the same event-loop pass run once"""
+        self._dirty = True
+        if self._batch_depth == 0:
+            self._schedule_refresh()
+
+    @contextmanager
+    def batch_updates(self):
+        """Defer refresh requests made inside the block to a single refresh"""
+        self._batch_depth += 1
         try:
-            # 1. Update Productivity
-            prod_stats = self.stats_manager.get_productivity_stats()
-            self.prod_card.labels["Focus Score"].configure(text=f"{prod_stats['focus_score']}/min")
-            self.prod_card.labels["Peak Hour"].configure(text=prod_stats['peak_hour'])
-            
-            # 2. Update Effectiveness
-            eff_stats = self.stats_manager.get_break_effectiveness()
-            self.effect_card.labels["Recovery"].configure(text=f"-{eff_stats['recovery_rate']}")
-            self.effect_card.labels["Breaks"].configure(text=str(eff_stats['total_breaks']))
-            
-            # 3. Update Screen Time
-            screen_time = self.stats_manager.get_daily_screen_time()
-            self.time_card.labels["Today"].configure(text=screen_time)
-            
-            # 4. Badges
-            self._update_badges()
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._schedule_refresh()
 
-            # 5. Update Charts
-            self._update_chart()
-            self._update_pie_chart()
-            
+    def _schedule_refresh(self):
+        """Queue _run_refresh on the idle queue if not already queued"""
+        if self._refresh_scheduled:
+            return
+        self._refresh_scheduled = True
+        self.after_idle(self._run_refresh)
+
+    def _run_refresh(self):
+        """Start fetching statistics in the background, if still wanted"""
+        self._refresh_scheduled = False
+        if not self._dirty or self._pending_fetch is not None:
+            # A fetch in flight re-checks _dirty when it is applied
+            return
+        if not self.winfo_ismapped():
+            # Hidden behind another page; _on_map picks this up
+            return
+        self._dirty = False
+        self._pending_fetch = self._executor.submit(self._fetch_all)
+        self.after(50, self._poll_fetch)
+
+    def _on_map(self, event):
+        """Run a refresh that was deferred while the page was hidden"""
+        # CTkFrame.bind attaches to the frame's internal canvas, so the
+        # event comes from that widget rather than self
+        if self._dirty:
+            self._schedule_refresh()
+
+    def _poll_fetch(self):
+        """Apply the background fetch once done (runs on the Tk thread)"""
+        fut = self._pending_fetch
+        if fut is None:
+            return
+        if not fut.done():
+            self.after(50, self._poll_fetch)
+            return
+        self._pending_fetch = None
+        try:
+            self._apply(fut.result())
         except Exception as e:
             logger.error(f"Error refreshing statistics: {e}")
+        if self._dirty:
+            self._schedule_refresh()
+
+    def _fetch_all(self) -> dict:
+        """Run all statistics queries (worker thread; no widget access)"""
+        with self.stats_manager.tick_cache() as stats:
+            return {
+                'productivity': stats.get_productivity_stats(),
+                'effectiveness': stats.get_break_effectiveness(),
+                'screen_time': stats.get_daily_screen_time(),
+                'badges': stats.get_weekly_badges(),
+                'summary': stats.get_weekly_summary_array(),
+                'distribution': stats.get_fatigue_distribution()
+            }
+
+    def _apply(self, data: dict):
+        """Update cards, badges and charts from fetched statistics"""
+        # 1. Update Productivity
+        prod_stats = data['productivity']
+        self.prod_card.labels["Focus Score"].configure(text=f"{prod_stats['focus_score']}/min")
+        self.prod_card.labels["Peak Hour"].configure(text=prod_stats['peak_hour'])
+
+        # 2. Update Effectiveness
+        eff_stats = data['effectiveness']
+        self.effect_card.labels["Recovery"].configure(text=f"-{eff_stats['recovery_rate']}")
+        self.effect_card.labels["Breaks"].configure(text=str(eff_stats['total_breaks']))
+
+        # 3. Update Screen Time
+        self.time_card.labels["Today"].configure(text=data['screen_time'])
 
-    def _update_badges(self):
+        # 4. Badges
+        self._update_badges(data['badges'])
+
+        # 5. Update Charts
+        self._update_chart(data['summary'])
+        self._update_pie_chart(data['distribution'])
+
+    def destroy(self):
+        """Stop the fetch worker along with the page"""
+        self._executor.shutdown(wait=False)
+        super().destroy()
+
+    def _update_badges(self, badges):
         """Update achievements/badges"""
-        # Clear existing
-        for widget in self.badges_frame.winfo_children():
-            widget.destroy()
-            
-        badges = self.stats_manager.get_weekly_badges()
-        
+        tb = self._badges_text
+        tb.configure(state='normal')
+        tb.delete('1.0', 'end')
         for badge in badges:
-            b_frame = ctk.CTkFrame(self.badges_frame, fg_color="transparent")
-            b_frame.pack(fill="x", pady=5)
-            
-            # Icon
-            ctk.CTkLabel(
-                b_frame, text=badge['icon'], 
-                font=ctk.CTkFont(size=24)
-            ).pack(side="left", padx=10)
-            
-            # Text
-            text_frame = ctk.CTkFrame(b_frame, fg_color="transparent")
-            text_frame.pack(side="left", fill="x", expand=True)
-            
-            ctk.CTkLabel(
-                text_frame, text=badge['name'],
-                font=ctk.CTkFont(size=14, weight="bold"),
-                text_color=badge.get('color', 'white')
-            ).pack(anchor="w")
-            
-            ctk.CTkLabel(
-                text_frame, text=badge['description'],
-                font=ctk.CTkFont(size=11),
-                text_color="#94a3b8"
-            ).pack(anchor="w")
+            color = badge.get('color', 'white')
+            color_tag = f"color{color}"
+            if color_tag not in self._badge_color_tags:
+                tb.tag_config(color_tag, foreground=color)
+                self._badge_color_tags.add(color_tag)
+            tb.insert('end', f"{badge['icon']} {badge['name']}\n", color_tag)
+            tb.insert('end', badge['description'] + '\n\n', 'desc')
+        tb.configure(state='disabled')
+
+    def _on_chart_draw(self, event):
+        """Cache the static chart background after a full draw"""
+        self._chart_bg = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_chart_artists()
 
-    def _update_chart(self):
+    def _draw_chart_artists(self):
+        """Draw the animated bars and fatigue line onto the canvas"""
+        if self._bars is not None:
+            for rect in self._bars:
+                self.ax1.draw_artist(rect)
+        self.ax2.draw_artist(self._fatigue_line)
+
+    def _update_chart(self, summary):
         """Draw weekly overview chart"""
-        self.ax.clear()
-        
-        summary = self.stats_manager.get_weekly_summary()
-        if not summary:
+        if not len(summary):
             return
-            
-        dates = [d['date'] for d in summary]
-        hours = [d['active_hours'] for d in summary]
-        fatigue = [d['avg_fatigue'] for d in summary]
-        
-        # Dual axis
-        ax1 = self.ax
-        ax2 = ax1.twinx()
-        
-        # Bar Chart (Hours)
+
+        dates = tuple(summary['date'])
+        hours = summary['active_hours']
+        fatigue = summary['avg_fatigue']
         x = np.arange(len(dates))
-        width = 0.5
-        bars = ax1.bar(x, hours, width, label='Active Hours', color='#3b82f6', alpha=0.7)
-        
+
+        # Axes layout (ticks, x limits) only changes when the set of days
+        # does; y limits are fixed, so anything else can be blitted
+        layout_changed = False
+
+        # Bar Chart (Hours)
+        if self._bars is None or len(self._bars) != len(dates):
+            if self._bars is not None:
+                self._bars.remove()
+            self._bars = self.ax1.bar(
+                x, hours, 0.5, label='Active Hours', color='#3b82f6',
+                alpha=0.7, animated=True)
+            self.ax1.set_xticks(x)
+            layout_changed = True
+        else:
+            for rect, h in zip(self._bars, hours):
+                rect.set_height(h)
+
+        if dates != self._chart_dates:
+            self.ax1.set_xticklabels(dates)
+            self._chart_dates = dates
+            layout_changed = True
+
         # Line Chart (Fatigue)
-        line = ax2.plot(x, fatigue, label='Avg Fatigue', color='#f97316', marker='o', linewidth=2)
-        
-        # Styling
-        ax1.set_ylabel('Active Hours', color='#3b82f6')
-        ax2.set_ylabel('Fatigue Score', color='#f97316')
-        
-        ax1.tick_params(axis='y', colors='#94a3b8')
-        ax2.tick_params(axis='y', colors='#94a3b8')
-        ax1.tick_params(axis='x', colors='#94a3b8')
-        
-        ax1.set_xticks(x)
-        ax1.set_xticklabels(dates)
-        
-        # Spines
-        for ax in [ax1, ax2]:
-            ax.spines['bottom'].set_color('#334155')
-            ax.spines['top'].set_visible(False)
-            ax.spines['left'].set_color('#334155')
-            ax.spines['right'].set_visible(False)
-            
-        self.canvas.draw()
-            
-    def _update_pie_chart(self):
-        """Draw fatigue distribution pie chart"""
-        self.pie_ax.clear()
-        
-        dist = self.stats_manager.get_fatigue_distribution()
+        self._fatigue_line.set_data(x, fatigue)
+
+        if layout_changed:
+            self.ax1.set_xlim(-0.5, len(dates) - 0.5)
+
+        if layout_changed or self._chart_bg is None:
+            self.figure.canvas.draw_idle()
+        else:
+            self.canvas.restore_region(self._chart_bg)
+            self._draw_chart_artists()
+            self.canvas.blit(self.figure.bbox)
+
+    def _update_pie_chart(self, dist):
+        """Update fatigue distribution donut chart"""
         if not dist or sum(dist.values()) == 0:
-            self.pie_ax.text(0.5, 0.5, "No Data", ha='center', va='center', color='gray')
-            self.pie_canvas.draw()
+            self._pie_slices = []
+        else:
+            self._pie_slices = [
+                (k, v, self.PIE_COLORS.get(k, 'gray'))
+                for k, v in dist.items() if v > 0
+            ]
+        self._draw_pie()
+
+    def _draw_pie(self):
+        """Draw the donut and legend for the current slices"""
+        canvas = self.pie_canvas
+        canvas.delete("all")
+        w = max(canvas.winfo_width(), int(canvas['width']))
+        h = max(canvas.winfo_height(), int(canvas['height']))
+
+        if not self._pie_slices:
+            canvas.create_text(w / 2, h / 2, text="No Data", fill="gray")
             return
-            
-        # Data
-        labels = []
-        sizes = []
-        colors = []
-        color_map = {
-            'Low': '#22c55e',      # Green
-            'Medium': '#eab308',   # Yellow
-            'High': '#f97316',     # Orange
-            'Critical': '#ef4444'  # Red
-        }
-        
-        for k, v in dist.items():
-            if v > 0:
-                labels.append(k)
-                sizes.append(v)
-                colors.append(color_map.get(k, 'gray'))
-                
-        # Draw Pie
-        wedges, _ = self.pie_ax.pie(
-            sizes, 
-            labels=None, # Hide labels on chart to reduce clutter
-            colors=colors,
-            startangle=90,
-            wedgeprops=dict(width=0.4, edgecolor='#1e293b') # Donut style
-        )
-        
+
+        # Legend: two columns under the donut
+        legend_rows = (len(self._pie_slices) + 1) // 2
+        legend_h = legend_rows * 16 + 8
+        diameter = max(min(w, h - legend_h) - 20, 20)
+        ring = diameter * 0.2  # same as a 0.4-radius wedge width
+        cx, cy = w / 2, (h - legend_h) / 2
+        r = (diameter - ring) / 2  # arc stroke is centred on the bbox
+
+        total = sum(size for _, size, _ in self._pie_slices)
+        start = 90
+        for _, size, color in self._pie_slices:
+            extent = -min(size / total * 360, 359.99)
+            canvas.create_arc(
+                cx - r, cy - r, cx + r, cy + r,
+                start=start, extent=extent, style='arc',
+                outline=color, width=ring)
+            start += extent
+
         # Center Text
-        self.pie_ax.text(0, 0, f"{len(sizes)}\nZones", ha='center', va='center', color='white', fontweight='bold')
-        
-        # Legend (Custom using matplotlib)
-        self.pie_ax.legend(
-            wedges, 
-            [f"{l}: {s}%" for l, s in zip(labels, sizes)],
-            loc="center",
-            bbox_to_anchor=(0.5, -0.1),
-            frameon=False,
-            labelcolor='white',
-            ncol=2,
-            fontsize=8
-        )
-        
-        self.pie_canvas.draw()
+        canvas.create_text(
+            cx, cy, text=f"{len(self._pie_slices)}\nZones",
+            fill="white", font=("Segoe UI", 10, "bold"), justify="center")
+
+        col_w = w / 2
+        for i, (label, size, color) in enumerate(self._pie_slices):
+            x = (i % 2) * col_w + col_w / 2 - 40
+            y = h - legend_h + 8 + (i // 2) * 16
+            canvas.create_rectangle(x, y - 4, x + 8, y + 4, fill=color, outline="")
+            canvas.create_text(
+                x + 14, y, text=f"{label}: {size}%", anchor="w",
+                fill="white", font=("Segoe UI", 8))
 
     def export_report(self):
         """Export statistics to CSV"""
@@ -1,7 +1,11 @@
 """Theme customization manager"""
 from pathlib import Path
 from typing import Optional, Dict
-import json
+import atexit
+import os
+import threading
+
+from src.utils.helpers import json_dumps, json_loads
 from src.utils.logger import default_logger as logger
 
 
@@ -83,24 +87,49 @@ class ThemeManager:
         self.custom_themes = self._load_themes()
         self.active_theme = 'default_dark'
 
+        # Merged preset + custom themes, rebuilt after custom themes change
+        self._all_themes_cache: Optional[Dict] = None
+
+        # Saves are debounced: edits within 0.5 s share one write
+        self._save_lock = threading.Lock()
+        self._save_timer: Optional[threading.Timer] = None
+        atexit.register(self._flush_themes)
+
         logger.info("Theme manager initialized")
 
     def _load_themes(self) -> Dict:
         """Load custom themes"""
         if self.themes_file.exists():
             try:
-                with open(self.themes_file, 'r') as f:
-                    return json.load(f)
+                themes: Dict = json_loads(self.themes_file.read_bytes())
+                return themes
             except Exception as e:
                 logger.error(f"Error loading themes: {e}")
 
         return {}
 
     def _save_themes(self):
-        """Save custom themes"""
+        """Schedule a save of custom themes (debounced)"""
+        with self._save_lock:
+            if self._save_timer is not None:
+                return
+            self._save_timer = threading.Timer(0.5, self._flush_themes)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _flush_themes(self):
+        """Write custom themes now, if a save is pending"""
+        with self._save_lock:
+            if self._save_timer is None:
+                return
+            self._save_timer.cancel()
+            self._save_timer = None
+            data = dict(self.custom_themes)
+
+        tmp_file = self.themes_file.with_suffix('.tmp')
         try:
-            with open(self.themes_file, 'w') as f:
-                json.dump(self.custom_themes, f, indent=2)
+            tmp_file.write_bytes(json_dumps(data))
+            os.replace(tmp_file, self.themes_file)
         except Exception as e:
             logger.error(f"Error saving themes: {e}")
 
@@ -112,9 +141,12 @@ class ThemeManager:
 
     def get_all_themes(self) -> Dict:
         """Get all available themes"""
-        all_themes = self.PRESET_THEMES.copy()
-        all_themes.update(self.custom_themes)
-        return all_themes
+        if self._all_themes_cache is None:
+            all_themes = self.PRESET_THEMES.copy()
+            all_themes.update(self.custom_themes)
+            self._all_themes_cache = all_themes
+        # Callers get their own dict; the cache is rebuilt on change
+        return dict(self._all_themes_cache)
 
     def create_custom_theme(self, theme_id: str, theme_data: Dict) -> bool:
         """
@@ -131,6 +163,7 @@ class ThemeManager:
             return False
 
         self.custom_themes[theme_id] = theme_data
+        self._all_themes_cache = None
         self._save_themes()
         return True
 
@@ -138,6 +171,7 @@ class ThemeManager:
         """Delete a custom theme"""
         if theme_id in self.custom_themes:
             del self.custom_themes[theme_id]
+            self._all_themes_cache = None
             self._save_themes()
             return True
         return False
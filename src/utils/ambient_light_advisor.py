@@ -1,13 +1,13 @@
 """Ambient light recommendations for eye health"""
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from src.utils.logger import default_logger as logger
 
 
 class AmbientLightAdvisor:
     """Provides recommendations for ambient lighting based on time and conditions"""
 
-    RECOMMENDATIONS = {
+    RECOMMENDATIONS: Dict[str, Dict[str, Any]] = {
         'morning': {
             'time_range': (6, 12),
             'title': '🌅 Morning Light Recommendations',
@@ -59,71 +59,99 @@ class AmbientLightAdvisor:
         """Initialize ambient light advisor"""
         logger.info("Ambient light advisor initialized")
 
+    def snapshot(self, hour: Optional[float] = None) -> dict:
+        """
+        Get all lighting advice for one hour in a single call.
+
+        Args:
+            hour: Hour of day (0-23), or None for the current hour
+
+        Returns:
+            Dict with period, brightness, color_temp, glare_risk and
+            night_mode
+        """
+        h = _hour_index(hour)
+        return {
+            'period': _HOUR_TO_PERIOD[h],
+            'brightness': _HOUR_TO_BRIGHTNESS[h],
+            'color_temp': _HOUR_TO_COLOR_TEMP[h],
+            'glare_risk': _HOUR_GLARE_RISK[h],
+            'night_mode': _HOUR_NIGHT_MODE[h]
+        }
+
     def get_current_recommendation(self) -> dict:
         """Get lighting recommendation for current time"""
-        current_hour = datetime.now().hour
-
-        for period, data in self.RECOMMENDATIONS.items():
-            start, end = data['time_range']
-
-            # Handle overnight period (21-6)
-            if start > end:
-                if current_hour >= start or current_hour < end:
-                    return data
-            else:
-                if start <= current_hour < end:
-                    return data
+        return _HOUR_TO_PERIOD[_hour_index()]
 
-        # Default to afternoon
-        return self.RECOMMENDATIONS['afternoon']
-
-    def get_recommendation_for_time(self, hour: int) -> dict:
+    def get_recommendation_for_time(self, hour: float) -> dict:
         """Get recommendation for specific hour"""
-        for period, data in self.RECOMMENDATIONS.items():
-            start, end = data['time_range']
-
-            if start > end:
-                if hour >= start or hour < end:
-                    return data
-            else:
-                if start <= hour < end:
-                    return data
-
-        return self.RECOMMENDATIONS['afternoon']
+        return _HOUR_TO_PERIOD[_hour_index(hour)]
 
     def get_screen_brightness_suggestion(self) -> str:
         """Get screen brightness suggestion for current time"""
-        hour = datetime.now().hour
-
-        if 6 <= hour < 12:
-            return "Medium-High (60-80%)"
-        elif 12 <= hour < 17:
-            return "High (70-90%)"
-        elif 17 <= hour < 21:
-            return "Medium (50-70%)"
-        else:
-            return "Low-Medium (30-50%)"
+        return _HOUR_TO_BRIGHTNESS[_hour_index()]
 
     def get_color_temperature_suggestion(self) -> str:
         """Get color temperature suggestion"""
-        hour = datetime.now().hour
-
-        if 6 <= hour < 12:
-            return "Cool (5000-6500K) - Daylight"
-        elif 12 <= hour < 17:
-            return "Neutral (4000-5000K) - Bright White"
-        elif 17 <= hour < 21:
-            return "Warm (3000-4000K) - Soft White"
-        else:
-            return "Very Warm (2700-3000K) - Warm White/Amber"
+        return _HOUR_TO_COLOR_TEMP[_hour_index()]
 
     def check_for_glare_risk(self) -> bool:
         """Check if current time has high glare risk"""
-        hour = datetime.now().hour
-        # Peak glare risk during mid-afternoon
-        return 12 <= hour < 17
+        return _HOUR_GLARE_RISK[_hour_index()]
 
     def should_enable_night_mode(self) -> bool:
         """Check if night mode should be enabled"""
-        hour = datetime.now().hour
-        return hour >= 21 or hour < 6
+        return _HOUR_NIGHT_MODE[_hour_index()]
+
+
+def _hour_index(hour: Optional[float] = None) -> int:
+    """Table index for an hour of day (fractions truncated), or now"""
+    if hour is None:
+        return datetime.now().hour
+    return int(hour) % 24
+
+
+# Per-period screen suggestions
+_BRIGHTNESS = {
+    'morning': "Medium-High (60-80%)",
+    'afternoon': "High (70-90%)",
+    'evening': "Medium (50-70%)",
+    'night': "Low-Medium (30-50%)",
+}
+_COLOR_TEMP = {
+    'morning': "Cool (5000-6500K) - Daylight",
+    'afternoon': "Neutral (4000-5000K) - Bright White",
+    'evening': "Warm (3000-4000K) - Soft White",
+    'night': "Very Warm (2700-3000K) - Warm White/Amber",
+}
+
+
+def _build_hour_tables() -> Tuple[
+        Tuple[dict, ...], Tuple[str, ...], Tuple[str, ...],
+        Tuple[bool, ...], Tuple[bool, ...]]:
+    """Map each hour of the day to its period, once at import"""
+    periods: List[str] = ['afternoon'] * 24  # default for uncovered hours
+    for period, data in AmbientLightAdvisor.RECOMMENDATIONS.items():
+        start: int
+        end: int
+        start, end = data['time_range']
+        hours: Sequence[int]
+        if start < end:
+            hours = range(start, end)
+        else:  # overnight period (21-6)
+            hours = list(range(start, 24)) + list(range(0, end))
+        for h in hours:
+            periods[h] = period
+    recs = AmbientLightAdvisor.RECOMMENDATIONS
+    return (
+        tuple(recs[p] for p in periods),
+        tuple(_BRIGHTNESS[p] for p in periods),
+        tuple(_COLOR_TEMP[p] for p in periods),
+        # Peak glare risk during mid-afternoon
+        tuple(p == 'afternoon' for p in periods),
+        tuple(p == 'night' for p in periods),
+    )
+
+
+(_HOUR_TO_PERIOD, _HOUR_TO_BRIGHTNESS, _HOUR_TO_COLOR_TEMP,
+ _HOUR_GLARE_RISK, _HOUR_NIGHT_MODE) = _build_hour_tables()
@@ -1,6 +1,44 @@
 """Helper utility functions"""
+import json
+import time
+from bisect import bisect_right
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Union
+from functools import lru_cache
+from typing import Any, Callable, Deque, Optional, Union
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# JSON for small state files: orjson when installed, else the json module.
+# Both produce compact UTF-8 bytes and accept non-string dict keys.
+try:
+    import orjson
+
+    def json_loads(data: bytes) -> Any:
+        """Parse JSON bytes"""
+        return orjson.loads(data)
+
+    def json_dumps(obj: Any,
+                   default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        """Serialize to compact JSON bytes"""
+        return orjson.dumps(
+            obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def json_loads(data: bytes) -> Any:
+        """Parse JSON bytes"""
+        return json.loads(data)
+
+    def json_dumps(obj: Any,
+                   default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        """Serialize to compact JSON bytes"""
+        return json.dumps(
+            obj, default=default, separators=(',', ':')).encode('utf-8')
+
+_FMT_DATETIME = "%Y-%m-%d %H:%M:%S"
 
 
 def format_duration(seconds: Union[int, float]) -> str:
@@ -13,10 +51,23 @@ def format_duration(seconds: Union[int, float]) -> str:
     Returns:
         Formatted string (e.g., "1h 23m", "45m", "23s")
     """
+    seconds = int(seconds)
+    if 0 <= seconds < 60:
+        return _SECONDS_STRINGS[seconds]
+    return _format_duration_int(seconds)
+
+
+# "0s".."59s", the most common case for short timers
+_SECONDS_STRINGS = tuple(f"{s}s" for s in range(60))
+
+
+@lru_cache(maxsize=4096)
+def _format_duration_int(seconds: int) -> str:
+    # Called every UI tick with the same few thousand values per hour
     if seconds < 60:
-        return f"{int(seconds)}s"
+        return f"{seconds}s"
 
-    minutes = int(seconds // 60)
+    minutes = seconds // 60
     if minutes < 60:
         return f"{minutes}m"
 
@@ -38,7 +89,14 @@ def format_time(dt: datetime) -> str:
     Returns:
         Formatted time string (HH:MM:SS)
     """
-    return dt.strftime("%H:%M:%S")
+    return _format_time_sec(dt.hour, dt.minute, dt.second)
+
+
+@lru_cache(maxsize=256)
+def _format_time_sec(hour: int, minute: int, second: int) -> str:
+    # UI timers format the same second repeatedly; strftime re-parses the
+    # format on every call, so memoize per wall-clock second
+    return f"{hour:02d}:{minute:02d}:{second:02d}"
 
 
 def format_datetime(dt: datetime) -> str:
@@ -51,7 +109,12 @@ def format_datetime(dt: datetime) -> str:
     Returns:
         Formatted datetime string
     """
-    return dt.strftime("%Y-%m-%d %H:%M:%S")
+    return _format_datetime_sec(dt.replace(microsecond=0, tzinfo=None))
+
+
+@lru_cache(maxsize=256)
+def _format_datetime_sec(dt: datetime) -> str:
+    return dt.strftime(_FMT_DATETIME)
 
 
 def normalize_score(value: float, min_val: float, max_val: float) -> float:
@@ -73,24 +136,64 @@ def normalize_score(value: float, min_val: float, max_val: float) -> float:
     return max(0.0, min(100.0, normalized))
 
 
-def calculate_moving_average(values: list, window: int = 5) -> float:
+def calculate_moving_average(values, window: int = 5) -> float:
     """
     Calculate moving average of recent values.
 
     Args:
-        values: List of numeric values
+        values: List or NumPy array of numeric values
         window: Window size for moving average
 
     Returns:
         Moving average
     """
-    if not values:
+    if len(values) == 0:
         return 0.0
 
     recent_values = values[-window:]
+    if NUMPY_AVAILABLE and isinstance(recent_values, np.ndarray):
+        # One C loop over the slice instead of boxing each element
+        return float(recent_values.mean())
     return sum(recent_values) / len(recent_values)
 
 
+class RollingMean:
+    """
+    Moving average over the last `window` values, updated in O(1).
+
+    Use this instead of calculate_moving_average() when values arrive one
+    at a time, so each update does not re-sum the window.
+    """
+
+    __slots__ = ('buf', 'sum')
+
+    def __init__(self, window: int = 5):
+        self.buf: Deque[float] = deque(maxlen=window)
+        self.sum = 0.0
+
+    def push(self, value: float) -> float:
+        """
+        Add a value and return the updated average.
+
+        Args:
+            value: New sample
+
+        Returns:
+            Mean of the values currently in the window
+        """
+        buf = self.buf
+        if len(buf) == buf.maxlen:
+            self.sum -= buf[0]
+        buf.append(value)
+        self.sum += value
+        return self.sum / len(buf)
+
+    @property
+    def value(self) -> float:
+        """Current average (0.0 before any value is pushed)"""
+        return self.sum / len(self.buf) if self.buf else 0.0
+
+
 def time_since(dt: datetime) -> str:
     """
     Get human-readable time since a datetime.
@@ -101,11 +204,23 @@ def time_since(dt: datetime) -> str:
     Returns:
         Human-readable string (e.g., "5 minutes ago")
     """
-    now = datetime.now()
-    diff = now - dt
+    return _format_ago((datetime.now() - dt).total_seconds())
 
-    seconds = diff.total_seconds()
 
+def time_since_monotonic(timestamp: float) -> str:
+    """
+    Get human-readable time since a time.monotonic() timestamp.
+
+    Args:
+        timestamp: Past time.monotonic() value (not time.time())
+
+    Returns:
+        Human-readable string (e.g., "5 minutes ago")
+    """
+    return _format_ago(time.monotonic() - timestamp)
+
+
+def _format_ago(seconds: float) -> str:
     if seconds < 60:
         return "just now"
 
@@ -134,29 +249,38 @@ def validate_percentage(value: float) -> float:
     return max(0.0, min(100.0, value))
 
 
+# Fatigue factor for each hour of the day (0-23); higher in late
+# afternoon/evening
+_TOD_FACTORS = (
+    (1.3,) * 6     # Night (00-06)
+    + (0.9,) * 3   # Early morning
+    + (0.8,) * 3   # Mid morning
+    + (1.0,) * 2   # Lunch time
+    + (1.1,) * 2   # Early afternoon (post-lunch dip)
+    + (1.2,) * 4   # Late afternoon/evening
+    + (1.3,) * 4   # Night (20-24)
+)
+
+# (epoch minute, local hour) of the last lookup; the hour can only change
+# on a minute boundary
+_tod_hour_cache = (-1, 0)
+
+
 def get_time_of_day_factor() -> float:
     """
     Get fatigue factor based on time of day.
     Higher values in late afternoon/evening.
 
     Returns:
-        Factor value (0.8-1.2)
+        Factor value (0.8-1.3)
     """
-    hour = datetime.now().hour
-
-    # Time-based fatigue curve
-    if 6 <= hour < 9:  # Early morning
-        return 0.9
-    elif 9 <= hour < 12:  # Mid morning
-        return 0.8
-    elif 12 <= hour < 14:  # Lunch time
-        return 1.0
-    elif 14 <= hour < 16:  # Early afternoon (post-lunch dip)
-        return 1.1
-    elif 16 <= hour < 20:  # Late afternoon/evening
-        return 1.2
-    else:  # Night
-        return 1.3
+    global _tod_hour_cache
+    minute = int(time.time() // 60)
+    cached_minute, hour = _tod_hour_cache
+    if minute != cached_minute:
+        hour = datetime.now().hour
+        _tod_hour_cache = (minute, hour)
+    return _TOD_FACTORS[hour]
 
 
 def calculate_work_intensity(
@@ -176,12 +300,9 @@ def calculate_work_intensity(
         return "Low"
 
     activity_per_minute = activity_count / duration_minutes
+    return _INTENSITY_LEVELS[bisect_right(_INTENSITY_BOUNDS, activity_per_minute)]
 
-    if activity_per_minute < 5:
-        return "Low"
-    elif activity_per_minute < 15:
-        return "Medium"
-    elif activity_per_minute < 30:
-        return "High"
-    else:
-        return "Very High"
+
+# Activities/minute at which each next intensity level starts
+_INTENSITY_BOUNDS = (5, 15, 30)
+_INTENSITY_LEVELS = ("Low", "Medium", "High", "Very High")
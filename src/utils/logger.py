@@ -1,9 +1,18 @@
 """Enhanced logger with state tracking for debugging"""
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
+import time
+from collections import deque
 from pathlib import Path
 from datetime import datetime
-import json
+from types import MappingProxyType
+from typing import Optional
+
+from src.utils.helpers import json_dumps
 
 
 # Create logs directory if it doesn't exist
@@ -14,6 +23,49 @@ log_dir.mkdir(exist_ok=True)
 debug_log_dir = log_dir / "debug"
 debug_log_dir.mkdir(exist_ok=True)
 
+# Log files are named by the date the process started
+_LOG_DATE = datetime.now().strftime('%Y%m%d')
+
+
+# Records are handed to a queue and written by one listener thread shared
+# by all loggers, so logging calls never block on disk or console I/O
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue()
+_log_listener: Optional[logging.handlers.QueueListener] = None
+_listener_lock = threading.Lock()
+
+
+def _get_queue_handler() -> logging.Handler:
+    """Start the shared listener on first use and return a queue handler"""
+    global _log_listener
+    with _listener_lock:
+        if _log_listener is None:
+            # Formatter
+            formatter = logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                datefmt='%Y-%m-%d %H:%M:%S'
+            )
+
+            # File handler; written per record so the log can be tailed live
+            log_file = log_dir / f"app_{_LOG_DATE}.log"
+            file_handler = logging.FileHandler(log_file, encoding='utf-8')
+            file_handler.setLevel(logging.DEBUG)
+            file_handler.setFormatter(formatter)
+
+            # Console handler
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setLevel(logging.INFO)
+            console_handler.setFormatter(formatter)
+
+            _log_listener = logging.handlers.QueueListener(
+                _log_queue, file_handler, console_handler,
+                respect_handler_level=True)
+            _log_listener.start()
+            # Runs before logging's own shutdown hook (atexit is LIFO), so
+            # queued records are written before the handlers are closed
+            atexit.register(_log_listener.stop)
+
+    return logging.handlers.QueueHandler(_log_queue)
+
 
 def setup_logger(name: str, debug_mode: bool = False) -> logging.Logger:
     """
@@ -33,38 +85,65 @@ def setup_logger(name: str, debug_mode: bool = False) -> logging.Logger:
     if logger.handlers:
         return logger
 
-    # File handler
-    log_file = log_dir / f"app_{datetime.now().strftime('%Y%m%d')}.log"
-    file_handler = logging.FileHandler(log_file, encoding='utf-8')
-    file_handler.setLevel(logging.DEBUG)
+    logger.addHandler(_get_queue_handler())
 
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.INFO)
+    return logger
 
-    # Formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
 
-    file_handler.setFormatter(formatter)
-    console_handler.setFormatter(formatter)
+class _StateEntry:
+    """One state change record (slots: far smaller than a dict per entry)"""
 
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    __slots__ = ('timestamp', 'component', 'action', 'state')
 
-    return logger
+    def __init__(self, timestamp: str, component: str, action: str, state):
+        self.timestamp = timestamp
+        self.component = component
+        self.action = action
+        self.state = state
+
+    def to_dict(self) -> dict:
+        return {
+            "timestamp": self.timestamp,
+            "component": self.component,
+            "action": self.action,
+            "state": self.state
+        }
+
+
+def _encode_default(obj):
+    """JSON fallback for state entries, read-only state views and others"""
+    if isinstance(obj, _StateEntry):
+        return obj.to_dict()
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    return str(obj)
 
 
 class StateLogger:
     """Logger for tracking application state changes"""
 
+    # Flush the file buffer after this many queued entries or this long idle
+    FLUSH_EVERY = 64
+    FLUSH_INTERVAL_SECONDS = 0.25
+    # Recent entries kept in memory for introspection
+    MAX_STATES = 10_000
+
     def __init__(self, name: str):
         self.logger = setup_logger(f"{name}.state", debug_mode=True)
         self.state_file = debug_log_dir / \
-            f"state_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        self.states = []
+            f"state_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+        self.states = deque(maxlen=self.MAX_STATES)
+        self._total_count = 0
+
+        # Entries are appended as JSON lines by a background flusher so
+        # callers never wait on serialization or disk I/O
+        self._queue: "queue.Queue[Optional[_StateEntry]]" = queue.Queue()
+        self._flusher: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+        # ISO timestamp prefix of the last logged second (bursts of entries
+        # share it)
+        self._last_ts = (-1, '')
 
     def log_state(self, component: str, action: str, state: dict):
         """
@@ -73,29 +152,91 @@ class StateLogger:
         Args:
             component: Component name (e.g., "EyeTracker", "Dashboard")
             action: Action being performed
-            state: State dictionary
+            state: State dictionary; it is kept by reference (behind a
+                read-only view) until written, so don't mutate it afterwards
         """
-        entry = {
-            "timestamp": datetime.now().isoformat(),
-            "component": component,
-            "action": action,
-            "state": state
-        }
-
+        entry = _StateEntry(
+            self._timestamp(), component, action, MappingProxyType(state))
         self.states.append(entry)
-        self.logger.debug(f"{component}.{action}: {state}")
+        self._total_count += 1
 
-        # Save to file periodically
-        if len(self.states) % 10 == 0:
-            self._save_states()
+        self.logger.debug(f"{component}.{action}: {state}")
 
-    def _save_states(self):
-        """Save states to JSON file"""
+        if self._flusher is None:
+            self._start_flusher()
+        self._queue.put_nowait(entry)
+
+    @property
+    def total_count(self) -> int:
+        """Number of entries logged, including ones rotated out of states"""
+        return self._total_count
+
+    def _timestamp(self) -> str:
+        """Current local time in ISO format, reusing the per-second prefix"""
+        ts = time.time()
+        sec = int(ts)
+        # (second, prefix) is swapped as one tuple so callers on other
+        # threads never pair a prefix with the wrong second
+        last_sec, iso = self._last_ts
+        if sec != last_sec:
+            iso = datetime.fromtimestamp(sec).isoformat()
+            self._last_ts = (sec, iso)
+        return f"{iso}.{int((ts - sec) * 1e6):06d}"
+
+    def _start_flusher(self):
+        """Start the writer thread on first use"""
+        with self._start_lock:
+            if self._flusher is not None:
+                return
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name="StateLoggerFlusher",
+                daemon=True)
+            self._flusher.start()
+            atexit.register(self.close)
+
+    def _flush_loop(self):
+        """Drain the queue into the state file (writer thread)"""
         try:
-            with open(self.state_file, 'w', encoding='utf-8') as f:
-                json.dump(self.states, f, indent=2, default=str)
+            f = open(self.state_file, 'ab', buffering=1 << 16)
         except Exception as e:
-            self.logger.error(f"Failed to save states: {e}")
+            self.logger.error(f"Failed to open state file: {e}")
+            return
+
+        with f:
+            pending = 0
+            while True:
+                try:
+                    entry = self._queue.get(
+                        timeout=self.FLUSH_INTERVAL_SECONDS)
+                except queue.Empty:
+                    if pending:
+                        f.flush()
+                        pending = 0
+                    continue
+
+                if entry is None:  # close() sentinel
+                    break
+                try:
+                    f.write(self._encode(entry))
+                    pending += 1
+                    if pending >= self.FLUSH_EVERY:
+                        f.flush()
+                        pending = 0
+                except Exception as e:
+                    self.logger.error(f"Failed to save state: {e}")
+
+    @staticmethod
+    def _encode(entry: _StateEntry) -> bytes:
+        """Serialize one entry as a JSON line"""
+        return json_dumps(entry, default=_encode_default) + b"\n"
+
+    def close(self):
+        """Flush queued entries and stop the writer thread"""
+        flusher = self._flusher
+        if flusher is None or not flusher.is_alive():
+            return
+        self._queue.put(None)
+        flusher.join(timeout=2.0)
 
 
 # Default logger
@@ -6,7 +6,7 @@ from typing import List
 class MotivationalQuotes:
     """Provides motivational quotes for breaks and achievements"""
 
-    BREAK_QUOTES = [
+    BREAK_QUOTES = (
         "Take a break - your mind will thank you! 🧠",
         "Rest is not idleness - it's essential for productivity.",
         "A short break now prevents burnout later.",
@@ -22,9 +22,9 @@ class MotivationalQuotes:
         "Walking away brings fresh perspectives.",
         "Rest is progress in disguise.",
         "Better work awaits after a good break."
-    ]
+    )
 
-    ACHIEVEMENT_QUOTES = [
+    ACHIEVEMENT_QUOTES = (
         "Outstanding achievement! Keep up the great work! 🎉",
         "You're building excellent work habits!",
         "Consistency is the key to success - well done!",
@@ -35,9 +35,9 @@ class MotivationalQuotes:
         "Your progress speaks volumes!",
         "Remarkable commitment to your wellbeing!",
         "You're crushing your goals!"
-    ]
+    )
 
-    FATIGUE_QUOTES = [
+    FATIGUE_QUOTES = (
         "Listen to your body - it's asking for rest.",
         "Pushing through fatigue reduces quality.",
         "Smart workers know when to pause.",
@@ -46,9 +46,9 @@ class MotivationalQuotes:
         "Fatigue is a signal, not a weakness.",
         "Take care of yourself first.",
         "Quality over quantity - rest matters."
-    ]
+    )
 
-    SESSION_START_QUOTES = [
+    SESSION_START_QUOTES = (
         "Ready to do great work! Let's go! 🚀",
         "Focus mode: activated!",
         "Your best session starts now.",
@@ -57,7 +57,10 @@ class MotivationalQuotes:
         "Let's create something amazing!",
         "New session, new possibilities.",
         "Your productivity journey continues!"
-    ]
+    )
+
+    _ALL_QUOTES = (BREAK_QUOTES + ACHIEVEMENT_QUOTES +
+                   FATIGUE_QUOTES + SESSION_START_QUOTES)
 
     @classmethod
     def get_break_quote(cls) -> str:
@@ -82,6 +85,4 @@ class MotivationalQuotes:
     @classmethod
     def get_random_quote(cls) -> str:
         """Get any random quote"""
-        all_quotes = (cls.BREAK_QUOTES + cls.ACHIEVEMENT_QUOTES +
-                      cls.FATIGUE_QUOTES + cls.SESSION_START_QUOTES)
-        return random.choice(all_quotes)
+        return random.choice(cls._ALL_QUOTES)
@@ -1,9 +1,8 @@
 """Screenshot manager for capturing charts and dashboard"""
+import os
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
-import io
-from PIL import Image
 
 from src.utils.logger import default_logger as logger
 
@@ -24,6 +23,8 @@ class ScreenshotManager:
 
         self.screenshots_dir = Path(screenshots_dir)
         self.screenshots_dir.mkdir(parents=True, exist_ok=True)
+        # Prefix for building output paths by string concatenation
+        self._screenshots_dir_str = os.fspath(self.screenshots_dir) + os.sep
 
         logger.info(f"Screenshot manager initialized: {self.screenshots_dir}")
 
@@ -32,7 +33,8 @@ class ScreenshotManager:
         figure,
         filename: Optional[str] = None,
         format: str = 'png',
-        dpi: int = 300
+        dpi: int = 150,
+        tight: bool = True
     ) -> Optional[Path]:
         """
         Save matplotlib figure as image.
@@ -40,8 +42,9 @@ class ScreenshotManager:
         Args:
             figure: Matplotlib figure object
             filename: Output filename (auto-generated if None)
-            format: Image format (png, jpg, svg)
+            format: Image format (png, webp, jpg, svg)
             dpi: DPI resolution
+            tight: Crop to the drawn content (costs an extra layout pass)
 
         Returns:
             Path to saved screenshot
@@ -54,16 +57,24 @@ class ScreenshotManager:
             if not filename.endswith(f'.{format}'):
                 filename += f'.{format}'
 
-            output_path = self.screenshots_dir / filename
+            output_str = self._screenshots_dir_str + filename
+
+            extra = {}
+            if format == 'png':
+                # PNG encoding dominates at the default zlib level; level 1
+                # is much faster for a slightly larger file
+                extra['pil_kwargs'] = {'compress_level': 1}
 
             # Save figure
             figure.savefig(
-                output_path,
+                output_str,
                 format=format,
                 dpi=dpi,
-                bbox_inches='tight',
-                facecolor='white'
+                bbox_inches='tight' if tight else None,
+                facecolor='white',
+                **extra
             )
+            output_path = Path(output_str)
 
             logger.info(f"Saved chart screenshot: {output_path}")
             return output_path
@@ -112,4 +123,4 @@ class ScreenshotManager:
 
     def get_screenshot_path(self, filename: str) -> Path:
         """Get full path for a screenshot filename"""
-        return self.screenshots_dir / filename
+        return Path(self._screenshots_dir_str + filename)
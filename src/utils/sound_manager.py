@@ -1,21 +1,32 @@
 """Sound notification manager for the Cognitive Fatigue Tracker"""
+import importlib
+import importlib.util
 import os
+import queue
 from pathlib import Path
 from typing import Optional
 import threading
 from src.utils.logger import default_logger as logger
 
-# Try to import playsound, with fallback
-try:
-    from playsound3 import playsound
-    SOUND_AVAILABLE = True
-except ImportError:
-    try:
-        from playsound import playsound
-        SOUND_AVAILABLE = True
-    except ImportError:
-        SOUND_AVAILABLE = False
-        logger.warning("playsound not available, sound notifications disabled")
+# Look for playsound (with fallback) without importing it; the audio
+# backend is only loaded when the first sound is played
+_PLAYSOUND_MODULE = next(
+    (m for m in ('playsound3', 'playsound')
+     if importlib.util.find_spec(m) is not None),
+    None)
+SOUND_AVAILABLE = _PLAYSOUND_MODULE is not None
+if not SOUND_AVAILABLE:
+    logger.warning("playsound not available, sound notifications disabled")
+
+_playsound = None
+
+
+def _load_playsound():
+    """Import the playsound function on first use"""
+    global _playsound
+    if _playsound is None:
+        _playsound = importlib.import_module(_PLAYSOUND_MODULE).playsound
+    return _playsound
 
 
 class SoundManager:
@@ -47,6 +58,12 @@ class SoundManager:
             'achievement': self.sounds_dir / 'achievement.wav'
         }
 
+        # Async playback is serialized through one worker thread, started
+        # on first use; overlapping alerts beyond the queue size are dropped
+        self._play_queue = queue.Queue(maxsize=8)
+        self._player: Optional[threading.Thread] = None
+        self._player_lock = threading.Lock()
+
         # Create placeholder sounds if they don't exist
         self._ensure_sounds_exist()
 
@@ -57,10 +74,17 @@ class SoundManager:
         """Ensure sound files exist, create placeholders if needed"""
         # For now, we'll just log if sounds are missing
         # In a real implementation, you'd include actual .wav files
+        self.rescan_sounds()
         for sound_name, sound_path in self.sounds.items():
-            if not sound_path.exists():
+            if sound_name not in self._available:
                 logger.warning(f"Sound file missing: {sound_path}")
 
+    def rescan_sounds(self):
+        """Re-check which sound files exist (e.g. after adding files)"""
+        self._available = {
+            name: path for name, path in self.sounds.items() if path.exists()
+        }
+
     def play(self, sound_name: str, async_play: bool = True):
         """
         Play a sound.
@@ -72,26 +96,45 @@ class SoundManager:
         if not self.enabled or not SOUND_AVAILABLE:
             return
 
-        if sound_name not in self.sounds:
-            logger.warning(f"Unknown sound: {sound_name}")
-            return
-
-        sound_path = self.sounds[sound_name]
-        if not sound_path.exists():
-            logger.warning(f"Sound file not found: {sound_path}")
+        sound_path = self._available.get(sound_name)
+        if sound_path is None:
+            if sound_name not in self.sounds:
+                logger.warning(f"Unknown sound: {sound_name}")
             return
 
         if async_play:
-            # Play in background thread to not block
-            thread = threading.Thread(
-                target=self._play_sound,
-                args=(sound_path,),
-                daemon=True
-            )
-            thread.start()
+            self._enqueue(sound_path)
         else:
             self._play_sound(sound_path)
 
+    def _enqueue(self, sound_path: Path):
+        """Hand a sound to the player thread without blocking"""
+        if self._player is None:
+            self._start_player()
+
+        q = self._play_queue
+        with q.mutex:
+            # Same alert already waiting: playing it twice adds nothing
+            if q.queue and q.queue[-1] == sound_path:
+                return
+        try:
+            q.put_nowait(sound_path)
+        except queue.Full:
+            logger.debug(f"Sound queue full, dropping {sound_path.name}")
+
+    def _start_player(self):
+        """Start the playback worker thread"""
+        with self._player_lock:
+            if self._player is None:
+                self._player = threading.Thread(
+                    target=self._player_loop, name="SoundPlayer", daemon=True)
+                self._player.start()
+
+    def _player_loop(self):
+        """Play queued sounds one after another (worker thread)"""
+        while True:
+            self._play_sound(self._play_queue.get())
+
     def _play_sound(self, sound_path: Path):
         """
         Internal method to play a sound file.
@@ -100,7 +143,7 @@ class SoundManager:
             sound_path: Path to sound file
         """
         try:
-            playsound(str(sound_path))
+            _load_playsound()(str(sound_path))
             logger.debug(f"Played sound: {sound_path.name}")
         except Exception as e:
             logger.error(f"Error playing sound {sound_path}: {e}")
@@ -7,26 +7,34 @@ import sys
 from contextlib import contextmanager
 
 
+# Shared devnull descriptor, opened once and kept for the process
+# lifetime (os.open descriptors are non-inheritable by default)
+_DEVNULL_FD = None
+
+
+def _devnull_fd() -> int:
+    global _DEVNULL_FD
+    if _DEVNULL_FD is None:
+        _DEVNULL_FD = os.open(os.devnull, os.O_WRONLY)
+    return _DEVNULL_FD
+
+
 @contextmanager
 def suppress_stderr():
     """
     Context manager to suppress stderr output.
     Redirects stderr to os.devnull.
     """
-    # Open a pair of null files
-    null_fds = [os.open(os.devnull, os.O_RDWR) for x in range(2)]
-    
+    devnull = _devnull_fd()
+
     # Save the actual stderr (2) file descriptor
     save = os.dup(2)
-    
+
     try:
-        # Assign the null pointers to stderr
-        os.dup2(null_fds[1], 2)
+        # Point stderr at devnull
+        os.dup2(devnull, 2)
         yield
     finally:
         # Restore stderr
         os.dup2(save, 2)
-        # Close the null files
-        os.close(null_fds[0])
-        os.close(null_fds[1])
         os.close(save)
@@ -1,166 +1,238 @@
 """
 Quick System Health Check
 """
+import multiprocessing
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-print("\n" + "="*70)
-print("  COGNITIVE FATIGUE TRACKER - SYSTEM HEALTH CHECK")
-print("="*70 + "\n")
-
-results = {"passed": [], "failed": [], "warnings": []}
-
-# Test 1: Core Imports
-print("TEST 1: Core Module Imports")
-print("-"*70)
-try:
-    from src.storage.config_manager import ConfigManager
-    from src.storage.data_manager import DataManager
-    from src.analysis.fatigue_analyzer import FatigueAnalyzer  
-    from src.ml.ml_predictor import MLPredictor
-    from src.ml.psychometric_loader import PsychometricLoader
-    print("[PASS] All core modules imported successfully")
-    results["passed"].append("Core Imports")
-except Exception as e:
-    print(f"[FAIL] Import error: {e}")
-    results["failed"].append(("Core Imports", str(e)))
-
-# Test 2: ML Model Status
-print("\nTEST 2: ML Model Status")
-print("-"*70)
-try:
-    from src.ml.ml_predictor import MLPredictor
-    predictor = MLPredictor()
-    print(f"Model Initialized: {predictor._is_initialized}")
-    print(f"Training Samples: {predictor._training_samples_count}")
-    print("[PASS] ML model loaded successfully")
-    results["passed"].append("ML Model")
-except Exception as e:
-    print(f"[FAIL] ML error: {e}")
-    results["failed"].append(("ML Model", str(e)))
-
-# Test 3: Psychometric Integration
-print("\nTEST 3: Psychometric Dataset Support")
-print("-"*70)
-try:
-    from src.ml.psychometric_loader import PsychometricLoader
-    loader = PsychometricLoader()
-    dataset = loader.load_dataset('data/psychometric_datasets/sample_nasatlx_workload.csv')
-    print(f"Dataset: {dataset.organization} - {dataset.assessment_type}")
-    print(f"Samples: {len(dataset.data)}")
-    print("[PASS] Psychometric integration working")
-    results["passed"].append("Psychometric Integration")  
-except Exception as e:
-    print(f"[FAIL] Psychometric error: {e}")
-    results["failed"].append(("Psychometric Integration", str(e)))
-
-# Test 4: Configuration
-print("\nTEST 4: Configuration Management")
-print("-"*70)
-try:
-    from src.storage.config_manager import ConfigManager
-    config = ConfigManager()
-    work_int = config.get('work_interval_minutes', 50)
-    print(f"Work Interval: {work_int} minutes")
-    print("[PASS] Configuration loaded")
-    results["passed"].append("Configuration")
-except Exception as e:
-    print(f"[FAIL] Config error: {e}")
-    results["failed"].append(("Configuration", str(e)))
-
-# Test 5: Fatigue Calculation
-print("\nTEST 5: Fatigue Score Calculation")
-print("-"*70)
-try:
-    from src.analysis.fatigue_analyzer import FatigueAnalyzer
-    analyzer = FatigueAnalyzer(use_ml=True)
-    analyzer.start_session()
-    score = analyzer.calculate_score(
-        work_duration_minutes=30.0,
-        activity_rate=15.0,
-        time_since_break_minutes=25.0,
-        is_on_break=False,
-        blink_rate=12.0
-    )
-    print(f"Fatigue Score: {score.score:.1f}")
-    print(f"Fatigue Level: {score.get_level()}")
-    print(f"Method: {score.factors.get('prediction_method', 'unknown')}")
-    print("[PASS] Fatigue calculation working")
-    results["passed"].append("Fatigue Calculation")
-except Exception as e:
-    print(f"[FAIL] Fatigue calc error: {e}")
-    results["failed"].append(("Fatigue Calculation", str(e)))
-
-# Test 6: File Structure
-print("\nTEST 6: Critical Files & Directories")
-print("-"*70)
-critical = [
-    "src/ml/", "src/analysis/", "src/monitoring/", "src/storage/", "src/ui/",
-    "data/psychometric_datasets/", "models/", "README.md", "main.py"
+# Each test returns (name, status, output lines, detail); status is one of
+# PASS / FAIL / WARN. Import-heavy tests run in parallel worker processes,
+# so total time is set by the slowest import rather than the sum.
+PASS, FAIL, WARN = "pass", "fail", "warn"
+
+
+def check_core_imports():
+    try:
+        from src.storage.config_manager import ConfigManager
+        from src.storage.data_manager import DataManager
+        from src.analysis.fatigue_analyzer import FatigueAnalyzer
+        from src.ml.ml_predictor import MLPredictor
+        from src.ml.psychometric_loader import PsychometricLoader
+        return ("Core Imports", PASS,
+                ["[PASS] All core modules imported successfully"], None)
+    except Exception as e:
+        return ("Core Imports", FAIL, [f"[FAIL] Import error: {e}"], str(e))
+
+
+def check_ml_model():
+    try:
+        from src.ml.ml_predictor import MLPredictor
+        predictor = MLPredictor()
+        return ("ML Model", PASS, [
+            f"Model Initialized: {predictor._is_initialized}",
+            f"Training Samples: {predictor._training_samples_count}",
+            "[PASS] ML model loaded successfully"
+        ], None)
+    except Exception as e:
+        return ("ML Model", FAIL, [f"[FAIL] ML error: {e}"], str(e))
+
+
+def check_psychometric():
+    try:
+        from src.ml.psychometric_loader import PsychometricLoader
+        loader = PsychometricLoader()
+        dataset = loader.load_dataset('data/psychometric_datasets/sample_nasatlx_workload.csv')
+        return ("Psychometric Integration", PASS, [
+            f"Dataset: {dataset.organization} - {dataset.assessment_type}",
+            f"Samples: {len(dataset.data)}",
+            "[PASS] Psychometric integration working"
+        ], None)
+    except Exception as e:
+        return ("Psychometric Integration", FAIL,
+                [f"[FAIL] Psychometric error: {e}"], str(e))
+
+
+def check_configuration():
+    try:
+        from src.storage.config_manager import ConfigManager
+        config = ConfigManager()
+        work_int = config.get('work_interval_minutes', 50)
+        return ("Configuration", PASS, [
+            f"Work Interval: {work_int} minutes",
+            "[PASS] Configuration loaded"
+        ], None)
+    except Exception as e:
+        return ("Configuration", FAIL, [f"[FAIL] Config error: {e}"], str(e))
+
+
+def check_fatigue_calculation():
+    try:
+        from src.analysis.fatigue_analyzer import FatigueAnalyzer
+        analyzer = FatigueAnalyzer(use_ml=True)
+        analyzer.start_session()
+        score = analyzer.calculate_score(
+            work_duration_minutes=30.0,
+            activity_rate=15.0,
+            time_since_break_minutes=25.0,
+            is_on_break=False,
+            blink_rate=12.0
+        )
+        return ("Fatigue Calculation", PASS, [
+            f"Fatigue Score: {score.score:.1f}",
+            f"Fatigue Level: {score.get_level()}",
+            f"Method: {score.factors.get('prediction_method', 'unknown')}",
+            "[PASS] Fatigue calculation working"
+        ], None)
+    except Exception as e:
+        return ("Fatigue Calculation", FAIL,
+                [f"[FAIL] Fatigue calc error: {e}"], str(e))
+
+
+def check_file_structure():
+    critical = [
+        "src/ml/", "src/analysis/", "src/monitoring/", "src/storage/", "src/ui/",
+        "data/psychometric_datasets/", "models/", "README.md", "main.py"
+    ]
+    # One directory listing per parent instead of a stat per entry
+    listings = {}
+    missing = []
+    for path in critical:
+        want_dir = path.endswith('/')
+        parent, name = os.path.split(path.rstrip('/'))
+        entries = listings.get(parent)
+        if entries is None:
+            try:
+                with os.scandir(parent or '.') as it:
+                    entries = {e.name: e for e in it}
+            except OSError:
+                entries = {}
+            listings[parent] = entries
+        entry = entries.get(name)
+        exists = entry is not None and (
+            entry.is_dir() if want_dir else entry.is_file())
+        if not exists:
+            missing.append(path)
+
+    if missing:
+        return ("File Structure", WARN,
+                [f"[WARN] Missing: {', '.join(missing)}"],
+                f"Missing files: {missing}")
+    return ("File Structure", PASS,
+            ["[PASS] All critical files present"], None)
+
+
+def check_documentation():
+    docs = ["README.md", "ML_MODULE_README.md", "PSYCHOMETRIC_DATASETS.md"]
+    missing_docs = [d for d in docs if not Path(d).exists()]
+    if missing_docs:
+        return ("Documentation", WARN,
+                [f"[WARN] Missing docs: {', '.join(missing_docs)}"],
+                f"Missing docs: {missing_docs}")
+    return ("Documentation", PASS,
+            ["[PASS] All key documentation present"], None)
+
+
+# (title, check, run in a worker process)
+TESTS = [
+    ("TEST 1: Core Module Imports", check_core_imports, True),
+    ("TEST 2: ML Model Status", check_ml_model, True),
+    ("TEST 3: Psychometric Dataset Support", check_psychometric, True),
+    ("TEST 4: Configuration Management", check_configuration, True),
+    ("TEST 5: Fatigue Score Calculation", check_fatigue_calculation, True),
+    ("TEST 6: Critical Files & Directories", check_file_structure, False),
+    ("TEST 7: Documentation", check_documentation, False),
 ]
-missing = []
-for path in critical:
-    p = Path(path)
-    exists = p.is_dir() if path.endswith('/') else p.is_file()
-    if not exists:
-        missing.append(path)
-        
-if missing:
-    print(f"[WARN] Missing: {', '.join(missing)}")
-    results["warnings"].append(f"Missing files: {missing}")
-else:
-    print("[PASS] All critical files present")
-    results["passed"].append("File Structure")
-
-# Test 7: Documentation
-print("\nTEST 7: Documentation")
-print("-"*70)
-docs = ["README.md", "ML_MODULE_README.md", "PSYCHOMETRIC_DATASETS.md"]
-missing_docs = [d for d in docs if not Path(d).exists()]
-if missing_docs:
-    print(f"[WARN] Missing docs: {', '.join(missing_docs)}")
-    results["warnings"].append(f"Missing docs: {missing_docs}")
-else:
-    print("[PASS] All key documentation present")
-    results["passed"].append("Documentation")
-
-# SUMMARY
-print("\n" + "="*70)
-print("  SUMMARY")
-print("="*70)
-
-passed_count = len(results["passed"])
-failed_count = len(results["failed"])
-warning_count = len(results["warnings"])
-
-print(f"\nPassed Tests: {passed_count}")
-for test in results["passed"]:
-    print(f"  [PASS] {test}")
-
-if results["failed"]:
-    print(f"\nFailed Tests: {failed_count}")
-    for test, error in results["failed"]:
-        print(f"  [FAIL] {test}")
-        print(f"         {error}")
-
-if results["warnings"]:
-    print(f"\nWarnings: {warning_count}")
-    for warning in results["warnings"]:
-        print(f"  [WARN] {warning}")
-
-print("\n" + "="*70)
-
-if failed_count == 0:
-    print("STATUS: SYSTEM READY FOR PHASE 2")
-    print("="*70 + "\n")
-    sys.exit(0)
-elif failed_count <= 2:
-    print("STATUS: MINOR ISSUES - REVIEW RECOMMENDED")
-    print("="*70 + "\n")
-    sys.exit(1)
-else:
-    print("STATUS: CRITICAL ISSUES - FIX REQUIRED")
-    print("="*70 + "\n")
-    sys.exit(2)
+
+
+def run_tests():
+    """Run all checks, import-heavy ones in parallel; results in test order"""
+    parallel = [check for _, check, isolated in TESTS if isolated]
+    workers = min(len(parallel), os.cpu_count() or 1)
+    ctx = multiprocessing.get_context('spawn')
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+        futures = {check: pool.submit(check)
+                   for _, check, isolated in TESTS if isolated}
+        # Cheap filesystem checks run here while the workers import
+        local = {check: check()
+                 for _, check, isolated in TESTS if not isolated}
+
+        outcomes = []
+        for title, check, isolated in TESTS:
+            if isolated:
+                try:
+                    outcome = futures[check].result()
+                except Exception as e:
+                    outcome = (title, FAIL, [f"[FAIL] Worker error: {e}"], str(e))
+            else:
+                outcome = local[check]
+            outcomes.append((title, outcome))
+    return outcomes
+
+
+def main():
+    print("\n" + "="*70)
+    print("  COGNITIVE FATIGUE TRACKER - SYSTEM HEALTH CHECK")
+    print("="*70)
+
+    results = {"passed": [], "failed": [], "warnings": []}
+
+    for title, (name, status, lines, detail) in run_tests():
+        print(f"\n{title}")
+        print("-"*70)
+        for line in lines:
+            print(line)
+
+        if status == PASS:
+            results["passed"].append(name)
+        elif status == FAIL:
+            results["failed"].append((name, detail))
+        else:
+            results["warnings"].append(detail)
+
+    # SUMMARY
+    print("\n" + "="*70)
+    print("  SUMMARY")
+    print("="*70)
+
+    passed_count = len(results["passed"])
+    failed_count = len(results["failed"])
+    warning_count = len(results["warnings"])
+
+    print(f"\nPassed Tests: {passed_count}")
+    for test in results["passed"]:
+        print(f"  [PASS] {test}")
+
+    if results["failed"]:
+        print(f"\nFailed Tests: {failed_count}")
+        for test, error in results["failed"]:
+            print(f"  [FAIL] {test}")
+            print(f"         {error}")
+
+    if results["warnings"]:
+        print(f"\nWarnings: {warning_count}")
+        for warning in results["warnings"]:
+            print(f"  [WARN] {warning}")
+
+    print("\n" + "="*70)
+
+    if failed_count == 0:
+        print("STATUS: SYSTEM READY FOR PHASE 2")
+        print("="*70 + "\n")
+        sys.exit(0)
+    elif failed_count <= 2:
+        print("STATUS: MINOR ISSUES - REVIEW RECOMMENDED")
+        print("="*70 + "\n")
+        sys.exit(1)
+    else:
+        print("STATUS: CRITICAL ISSUES - FIX REQUIRED")
+        print("="*70 + "\n")
+        sys.exit(2)
+
+
+if __name__ == "__main__":
+    main()
@@ -56,15 +56,16 @@ def test_ml_predictor(fe):
     
     # Add training samples
     print("  Training with synthetic data...")
-    np.random.seed(42)
-    for i in range(30):
-        # Create synthetic features
-        synthetic_features = np.random.rand(28) * 50
-        # Create target based on some features (simulate pattern)
-        target = 30 + synthetic_features[0] * 0.5 + synthetic_features[8] * 0.3
-        target = np.clip(target, 0, 100)
-        
-        predictor.partial_fit(synthetic_features, target)
+    # Create all synthetic features up front
+    rng = np.random.default_rng(42)
+    synthetic_features = rng.random((30, 28)) * 50
+    # Create targets based on some features (simulate pattern)
+    targets = np.clip(
+        30 + synthetic_features[:, 0] * 0.5 + synthetic_features[:, 8] * 0.3,
+        0, 100)
+
+    for features_row, target in zip(synthetic_features, targets):
+        predictor.partial_fit(features_row, target)
     
     print(f"  ✓ Trained with 30 samples")
     
@@ -1,5 +1,6 @@
 """Test script for psychometric dataset integration"""
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Add src to path
@@ -11,6 +12,21 @@ from src.ml.ml_predictor import MLPredictor
 from src.analysis.fatigue_analyzer import FatigueAnalyzer
 import numpy as np
 
+NASA_TLX_CSV = 'data/psychometric_datasets/sample_nasatlx_workload.csv'
+CFQ_CSV = 'data/psychometric_datasets/sample_cfq_fatigue.csv'
+
+
+@lru_cache(maxsize=None)
+def load_dataset(path):
+    """Parse each sample CSV once and share it across the tests"""
+    return PsychometricLoader().load_dataset(path)
+
+
+@lru_cache(maxsize=None)
+def nasa_preprocessed():
+    """(features, targets) for the NASA-TLX sample, computed once"""
+    return DatasetPreprocessor().preprocess_nasa_tlx(load_dataset(NASA_TLX_CSV))
+
 
 def test_loader():
     """Test psychometric data loading"""
@@ -23,7 +39,7 @@ def test_loader():
     # Test NASA-TLX
     print("\n📊 Loading NASA-TLX dataset...")
     try:
-        nasa_dataset = loader.load_dataset('data/psychometric_datasets/sample_nasatlx_workload.csv')
+        nasa_dataset = load_dataset(NASA_TLX_CSV)
         print(f"✅ Loaded: {nasa_dataset}")
         print(f"   Organization: {nasa_dataset.organization}")
         print(f"   Assessment: {nasa_dataset.assessment_type}")
@@ -44,7 +60,7 @@ def test_loader():
     # Test CFQ
     print("\n📊 Loading CFQ dataset...")
     try:
-        cfq_dataset = loader.load_dataset('data/psychometric_datasets/sample_cfq_fatigue.csv')
+        cfq_dataset = load_dataset(CFQ_CSV)
         print(f"✅ Loaded: {cfq_dataset}")
         print(f"   Organization: {cfq_dataset.organization}")
         print(f"   Assessment: {cfq_dataset.assessment_type}")
@@ -68,14 +84,12 @@ def test_preprocessing():
     print("TEST 2: Feature Preprocessing")
     print("="*60)
     
-    loader = PsychometricLoader()
     preprocessor = DatasetPreprocessor()
     
     # Preprocess NASA-TLX
     print("\n🔧 Preprocessing NASA-TLX dataset...")
     try:
-        nasa_dataset = loader.load_dataset('data/psychometric_datasets/sample_nasatlx_workload.csv')
-        features, targets = preprocessor.preprocess_nasa_tlx(nasa_dataset)
+        features, targets = nasa_preprocessed()
         
         print(f"✅ Preprocessed: {features.shape[0]} samples, {features.shape[1]} features")
         print(f"   Feature range: {features.min():.2f} - {features.max():.2f}")
@@ -89,8 +103,7 @@ def test_preprocessing():
     # Preprocess CFQ
     print("\n🔧 Preprocessing CFQ dataset...")
     try:
-        cfq_dataset = loader.load_dataset('data/psychometric_datasets/sample_cfq_fatigue.csv')
-        features, targets = preprocessor.preprocess_cfq(cfq_dataset)
+        features, targets = preprocessor.preprocess_cfq(load_dataset(CFQ_CSV))
         
         print(f"✅ Preprocessed: {features.shape[0]} samples, {features.shape[1]} features")
         print(f"   Feature range: {features.min():.2f} - {features.max():.2f}")
@@ -112,9 +125,7 @@ def test_training():
     print("\n🧠 Training ML model with NASA-TLX data...")
     try:
         predictor = MLPredictor()
-        stats = predictor.train_from_psychometric_dataset(
-            'data/psychometric_datasets/sample_nasatlx_workload.csv'
-        )
+        stats = predictor.train_from_psychometric_dataset(NASA_TLX_CSV)
         
         print(f"✅ Training complete!")
         print(f"   Organization: {stats['organization']}")
@@ -125,10 +136,7 @@ def test_training():
         
         # Test prediction
         print("\n🔮 Testing prediction...")
-        loader = PsychometricLoader()
-        preprocessor = DatasetPreprocessor()
-        dataset = loader.load_dataset('data/psychometric_datasets/sample_nasatlx_workload.csv')
-        features, targets = preprocessor.preprocess_nasa_tlx(dataset)
+        features, targets = nasa_preprocessed()
         
         pred, conf = predictor.predict(features[0])
         actual = targets[0]
@@ -158,9 +166,7 @@ def test_fatigue_analyzer_integration():
     try:
         analyzer = FatigueAnalyzer(use_ml=True)
         
-        stats = analyzer.train_from_psychometric_file(
-            'data/psychometric_datasets/sample_nasatlx_workload.csv'
-        )
+        stats = analyzer.train_from_psychometric_file(NASA_TLX_CSV)
         
         if 'error' in stats:
             print(f"❌ Failed: {stats['error']}")
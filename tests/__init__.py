@@ -1,11 +1,4 @@
 """Tests package initialization"""
-import unittest
-
-# Test discovery
-def load_tests(loader, tests, pattern):
-    """Load all tests"""
-    return loader.discover('tests', pattern='test_*.py')
-
-
-if __name__ == '__main__':
-    unittest.main()
+# Tests are collected by pytest (see pytest.ini). Parallel runs with
+# pytest-xdist are opt-in (pytest -n auto --dist loadfile); run_tests.py
+# still offers the plain unittest runner.
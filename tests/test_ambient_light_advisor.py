@@ -0,0 +1,45 @@
+"""Unit tests for the ambient light advisor"""
+import unittest
+
+from src.utils.ambient_light_advisor import AmbientLightAdvisor
+
+
+class TestAmbientLightAdvisor(unittest.TestCase):
+    """Test hour-of-day lookups"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.advisor = AmbientLightAdvisor()
+        self.recs = AmbientLightAdvisor.RECOMMENDATIONS
+
+    def test_period_boundaries(self):
+        """Test each hour maps to the period whose range contains it"""
+        for hour in range(24):
+            if 6 <= hour < 12:
+                expected = 'morning'
+            elif 12 <= hour < 17:
+                expected = 'afternoon'
+            elif 17 <= hour < 21:
+                expected = 'evening'
+            else:
+                expected = 'night'
+            snap = self.advisor.snapshot(hour)
+            self.assertIs(snap['period'], self.recs[expected])
+            self.assertIs(
+                self.advisor.get_recommendation_for_time(hour),
+                self.recs[expected])
+            self.assertEqual(snap['glare_risk'], expected == 'afternoon')
+            self.assertEqual(snap['night_mode'], expected == 'night')
+
+    def test_float_and_out_of_range_hours(self):
+        """Test fractional hours are truncated and hours wrap at 24"""
+        self.assertIs(
+            self.advisor.get_recommendation_for_time(11.9),
+            self.recs['morning'])
+        self.assertIs(
+            self.advisor.get_recommendation_for_time(25),
+            self.recs['night'])
+
+
+if __name__ == '__main__':
+    unittest.main()
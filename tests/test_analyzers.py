@@ -10,10 +10,15 @@ from src.analysis.statistics_analyzer import StatisticsAnalyzer
 
 class TestFatigueAnalyzer(unittest.TestCase):
     """Test FatigueAnalyzer"""
-    
+
+    @classmethod
+    def setUpClass(cls):
+        """Build the analyzer once for the class"""
+        cls.analyzer = FatigueAnalyzer(use_ml=False)
+
     def setUp(self):
-        """Set up test fixtures"""
-        self.analyzer = FatigueAnalyzer(use_ml=False)
+        """Start each test from a clean analyzer state"""
+        self.analyzer.reset()
     
     def test_analyzer_initialization(self):
         """Test analyzer initializes correctly"""
@@ -36,6 +41,22 @@ class TestFatigueAnalyzer(unittest.TestCase):
         self.assertGreaterEqual(score.score, 0)
         self.assertLessEqual(score.score, 100)
     
+    def test_batch_matches_scalar(self):
+        """Test batch scores agree with calculate_score"""
+        self.analyzer.start_session()
+        self.analyzer.calculate_score(work_duration_minutes=10, activity_rate=20.0)
+
+        samples = [(30, 15.0, 30, 15.0), (90, 35.0, 50, 8.0), (120, 10.0, 0, 5.0)]
+        batch = self.analyzer.calculate_scores_batch(*zip(*samples))
+        for (work, activity, since_break, blink), expected in zip(samples, batch):
+            score = self.analyzer.calculate_score(
+                work_duration_minutes=work,
+                activity_rate=activity,
+                time_since_break_minutes=since_break,
+                blink_rate=blink
+            )
+            self.assertAlmostEqual(score.score, expected, places=6)
+    
     def test_session_management(self):
         """Test session start/end"""
         self.analyzer.start_session()
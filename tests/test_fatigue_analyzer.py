@@ -0,0 +1,60 @@
+"""Unit tests for fatigue scoring"""
+import itertools
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from src.analysis.fatigue_analyzer import FatigueAnalyzer
+
+
+class TestScorePathParity(unittest.TestCase):
+    """Test the scalar and batch scoring paths agree"""
+
+    WORK = (0.0, 3.0, 30.0, 119.0, 240.0, 500.0)
+    ACTIVITY = (0.0, 5.0, 16.0, 20.0, 30.0, 70.0)
+    SINCE_BREAK = (0.0, 30.0, 90.0)
+    BLINK = (0.0, 5.0, 11.9, 12.0, 20.0)
+    BASELINES = (20.0, 37.5)
+
+    def setUp(self):
+        """Set up an analyzer with a fixed time-of-day factor"""
+        self.analyzer = FatigueAnalyzer(use_ml=False)
+        patcher = patch(
+            'src.analysis.fatigue_analyzer.get_time_of_day_factor',
+            return_value=1.2)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_batch_matches_scalar(self):
+        """Test every input combination scores the same on both paths"""
+        combos = list(itertools.product(
+            self.WORK, self.ACTIVITY, self.SINCE_BREAK, self.BLINK))
+        work, activity, since_break, blink = map(np.array, zip(*combos))
+
+        for baseline in self.BASELINES:
+            self.analyzer._initial_activity_rate = baseline
+            batch = self.analyzer.calculate_scores_batch(
+                work, activity, since_break, blink)
+
+            for i, (w, a, s, b) in enumerate(combos):
+                _, expected = self.analyzer._compute_score(
+                    w, a, s, False, b, baseline)
+                if w < self.analyzer.GRACE_PERIOD_MINUTES:
+                    expected = min(expected, 25.0)
+                with self.subTest(baseline=baseline, inputs=(w, a, s, b)):
+                    self.assertAlmostEqual(batch[i], expected, places=9)
+
+        self.assertEqual(len(combos) * len(self.BASELINES), 1080)
+
+    def test_scalar_returns_floats(self):
+        """Test the scalar path returns plain numbers, not NumPy scalars"""
+        factors, score = self.analyzer._compute_score(
+            30.0, 15.0, 30.0, False, 8.0, 20.0)
+        self.assertNotIsInstance(score, np.generic)
+        for value in factors.values():
+            self.assertNotIsInstance(value, np.generic)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+"""Unit tests for helper utilities"""
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from src.utils.helpers import (
+    RollingMean, calculate_work_intensity, format_datetime, format_duration,
+    format_time, time_since, time_since_monotonic
+)
+from src.utils import helpers
+
+
+class TestRollingMean(unittest.TestCase):
+    """Test RollingMean"""
+
+    def test_empty_window(self):
+        """Test the average is 0.0 before any value is pushed"""
+        self.assertEqual(RollingMean(3).value, 0.0)
+
+    def test_partial_window(self):
+        """Test the average covers only the values pushed so far"""
+        mean = RollingMean(3)
+        self.assertEqual(mean.push(2.0), 2.0)
+        self.assertEqual(mean.push(4.0), 3.0)
+        self.assertEqual(mean.value, 3.0)
+
+    def test_window_eviction(self):
+        """Test the oldest value leaves the sum once the window is full"""
+        mean = RollingMean(3)
+        for v in (1.0, 2.0, 3.0):
+            mean.push(v)
+        self.assertEqual(mean.push(10.0), 5.0)  # (2 + 3 + 10) / 3
+        self.assertEqual(mean.push(10.0), 23.0 / 3)
+        self.assertEqual(list(mean.buf), [3.0, 10.0, 10.0])
+
+    def test_matches_recomputed_mean(self):
+        """Test the running sum agrees with re-summing the window"""
+        values = [0.5 * i for i in range(50)]
+        mean = RollingMean(5)
+        for i, v in enumerate(values):
+            window = values[max(0, i - 4):i + 1]
+            self.assertAlmostEqual(mean.push(v), sum(window) / len(window))
+
+
+class TestWorkIntensity(unittest.TestCase):
+    """Test calculate_work_intensity thresholds"""
+
+    @staticmethod
+    def _if_chain(activity_per_minute):
+        """The original threshold chain the lookup table replaced"""
+        if activity_per_minute < 5:
+            return "Low"
+        elif activity_per_minute < 15:
+            return "Medium"
+        elif activity_per_minute < 30:
+            return "High"
+        return "Very High"
+
+    def test_thresholds_match_if_chain(self):
+        """Test values on and around each threshold"""
+        for rate in (0, 4.999, 5, 5.001, 14.999, 15, 15.001,
+                     29.999, 30, 30.001, 1000):
+            with self.subTest(rate=rate):
+                self.assertEqual(
+                    calculate_work_intensity(rate * 10, 10),
+                    self._if_chain(rate))
+
+    def test_exact_boundaries(self):
+        """Test each threshold starts the next level"""
+        self.assertEqual(calculate_work_intensity(4, 1), "Low")
+        self.assertEqual(calculate_work_intensity(5, 1), "Medium")
+        self.assertEqual(calculate_work_intensity(15, 1), "High")
+        self.assertEqual(calculate_work_intensity(30, 1), "Very High")
+
+    def test_non_positive_duration(self):
+        """Test zero or negative durations report Low"""
+        self.assertEqual(calculate_work_intensity(100, 0), "Low")
+        self.assertEqual(calculate_work_intensity(100, -5), "Low")
+
+
+class TestTimeSince(unittest.TestCase):
+    """Test time_since and time_since_monotonic"""
+
+    def test_datetime(self):
+        """Test elapsed time from a past datetime"""
+        now = datetime.now()
+        self.assertEqual(time_since(now), "just now")
+        self.assertEqual(
+            time_since(now - timedelta(minutes=1, seconds=5)), "1 minute ago")
+        self.assertEqual(
+            time_since(now - timedelta(hours=5, minutes=1)), "5 hours ago")
+        self.assertEqual(time_since(now - timedelta(days=3)), "3 days ago")
+
+    def test_monotonic(self):
+        """Test elapsed time from a time.monotonic() timestamp"""
+        now = time.monotonic()
+        self.assertEqual(time_since_monotonic(now), "just now")
+        self.assertEqual(time_since_monotonic(now - 125), "2 minutes ago")
+        self.assertEqual(time_since_monotonic(now - 3700), "1 hour ago")
+        self.assertEqual(
+            time_since_monotonic(now - 2 * 86400 - 10), "2 days ago")
+
+
+class TestFormatters(unittest.TestCase):
+    """Test the memoized formatters"""
+
+    def test_format_duration(self):
+        """Test seconds, minutes and hours output"""
+        self.assertEqual(format_duration(0), "0s")
+        self.assertEqual(format_duration(59.9), "59s")
+        self.assertEqual(format_duration(60), "1m")
+        self.assertEqual(format_duration(3600), "1h")
+        self.assertEqual(format_duration(5000), "1h 23m")
+
+    def test_format_time_matches_strftime(self):
+        """Test format_time agrees with strftime and reuses its cache"""
+        dt = datetime(2024, 3, 9, 7, 5, 3, 123456)
+        self.assertEqual(format_time(dt), dt.strftime("%H:%M:%S"))
+
+        before = helpers._format_time_sec.cache_info().hits
+        format_time(dt.replace(microsecond=999999))
+        self.assertEqual(
+            helpers._format_time_sec.cache_info().hits, before + 1)
+
+    def test_format_datetime_matches_strftime(self):
+        """Test format_datetime ignores microseconds and tzinfo"""
+        dt = datetime(2024, 12, 31, 23, 59, 58, 500000)
+        expected = dt.strftime("%Y-%m-%d %H:%M:%S")
+        self.assertEqual(format_datetime(dt), expected)
+        self.assertEqual(
+            format_datetime(dt.replace(tzinfo=timezone.utc)), expected)
+
+        before = helpers._format_datetime_sec.cache_info().hits
+        format_datetime(dt.replace(microsecond=1))
+        self.assertEqual(
+            helpers._format_datetime_sec.cache_info().hits, before + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -26,7 +26,24 @@ class TestSession(unittest.TestCase):
         self.session.end_session()
         stats = self.session.get_stats()
         self.assertGreater(stats['total_duration_minutes'], 0)
-    
+
+    def test_stats_cache_invalidation(self):
+        """Test ended-session stats are cached and refreshed on break/end"""
+        self.session.end_session()
+        stats = self.session.get_stats()
+        self.assertEqual(self.session.get_stats(), stats)
+
+        # Callers get their own copy
+        stats['keyboard_count'] = 99
+        self.assertEqual(self.session.get_stats()['keyboard_count'], 0)
+
+        self.session.add_break(self.session.start_time, self.session.end_time)
+        self.assertEqual(self.session.get_stats()['break_count'], 1)
+
+        self.session.keyboard_count += 1
+        self.session.end_session()
+        self.assertEqual(self.session.get_stats()['keyboard_count'], 1)
+
     def test_break_tracking(self):
         """Test break tracking"""
         initial_count = self.session.break_count
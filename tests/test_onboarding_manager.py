@@ -0,0 +1,47 @@
+"""Unit tests for the onboarding manager"""
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.ui.onboarding_manager import OnboardingManager
+
+
+class TestOnboardingManager(unittest.TestCase):
+    """Test OnboardingManager persistence"""
+
+    def setUp(self):
+        """Set up a temporary status file"""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.status_file = Path(self._tmp.name) / "onboarding.json"
+
+    def tearDown(self):
+        """Remove the temporary directory"""
+        self._tmp.cleanup()
+
+    def test_step_advances_saved(self):
+        """Test each step advance is written to the status file"""
+        manager = OnboardingManager(self.status_file)
+        manager.next_step()
+        manager.next_step()
+        self.assertEqual(
+            OnboardingManager(self.status_file).status['current_step'], 2)
+
+    def test_complete_uses_single_status_file(self):
+        """Test completion is stored in the status file alone"""
+        manager = OnboardingManager(self.status_file)
+        self.assertTrue(manager.should_show_onboarding())
+        manager.complete_onboarding()
+
+        self.assertEqual(
+            [p.name for p in Path(self._tmp.name).iterdir()],
+            ["onboarding.json"])
+        self.assertFalse(
+            OnboardingManager(self.status_file).should_show_onboarding())
+
+        manager.reset_onboarding()
+        self.assertTrue(
+            OnboardingManager(self.status_file).should_show_onboarding())
+
+
+if __name__ == '__main__':
+    unittest.main()
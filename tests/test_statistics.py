@@ -0,0 +1,56 @@
+"""Unit tests for the statistics dashboard manager"""
+import threading
+import unittest
+from unittest.mock import Mock
+
+from src.analysis.statistics import StatisticsManager
+
+
+class TestTickCache(unittest.TestCase):
+    """Test StatisticsManager.tick_cache"""
+
+    def setUp(self):
+        """Set up a manager over a mocked DataManager"""
+        self.data_manager = Mock()
+        self.data_manager.get_recent_sessions.return_value = []
+        self.stats = StatisticsManager(self.data_manager)
+
+    def test_reads_memoized_inside_block(self):
+        """Test repeated reads hit storage once per block"""
+        with self.stats.tick_cache() as stats:
+            stats._recent_sessions(7)
+            stats._recent_sessions(7)
+        self.assertEqual(self.data_manager.get_recent_sessions.call_count, 1)
+
+        self.stats._recent_sessions(7)
+        self.assertEqual(self.data_manager.get_recent_sessions.call_count, 2)
+
+    def test_nested_block_keeps_outer_cache(self):
+        """Test leaving a nested block does not end the outer one"""
+        with self.stats.tick_cache():
+            with self.stats.tick_cache():
+                self.stats._recent_sessions(7)
+            self.stats._recent_sessions(7)
+        self.assertEqual(self.data_manager.get_recent_sessions.call_count, 1)
+
+    def test_cache_is_per_thread(self):
+        """Test another thread neither sees nor clears this thread's cache"""
+        with self.stats.tick_cache():
+            self.stats._recent_sessions(7)
+
+            def other_thread():
+                self.stats._recent_sessions(7)
+                with self.stats.tick_cache():
+                    pass
+
+            worker = threading.Thread(target=other_thread)
+            worker.start()
+            worker.join()
+
+            self.stats._recent_sessions(7)
+        # One read here, one uncached read on the other thread
+        self.assertEqual(self.data_manager.get_recent_sessions.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
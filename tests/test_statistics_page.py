@@ -0,0 +1,44 @@
+"""Tests for the statistics page"""
+import importlib.util
+import unittest
+from unittest.mock import Mock
+
+UI_AVAILABLE = all(
+    importlib.util.find_spec(m) is not None
+    for m in ('customtkinter', 'matplotlib', 'numpy'))
+
+
+@unittest.skipUnless(UI_AVAILABLE, "customtkinter/matplotlib not installed")
+class TestStatisticsPageRefresh(unittest.TestCase):
+    """Test deferred refreshes of StatisticsPage"""
+
+    def setUp(self):
+        """Create a root window, skipping when there is no display"""
+        import customtkinter as ctk
+        import tkinter as tk
+        from src.ui.statistics_page import StatisticsPage
+
+        try:
+            self.root = ctk.CTk()
+        except tk.TclError as e:
+            self.skipTest(f"no display: {e}")
+        self.addCleanup(self.root.destroy)
+
+        self.page = StatisticsPage(self.root, Mock())
+        self.addCleanup(self.page._executor.shutdown, wait=False)
+
+    def test_deferred_refresh_runs_when_mapped(self):
+        """Test a refresh requested while hidden fires once the page is shown"""
+        # Not yet packed: the initial refresh is deferred
+        self.root.update()
+        self.assertTrue(self.page._dirty)
+
+        self.page._schedule_refresh = Mock()
+        self.page.pack()
+        self.root.update()
+
+        self.page._schedule_refresh.assert_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+"""Unit tests for the theme manager"""
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.ui.theme_manager import ThemeManager
+
+
+class TestThemeManager(unittest.TestCase):
+    """Test ThemeManager theme lookup"""
+
+    def setUp(self):
+        """Set up a themes file with a custom theme and a preset override"""
+        self._tmp = tempfile.TemporaryDirectory()
+        themes_file = Path(self._tmp.name) / "themes.json"
+        self.override = {'name': 'My Dark'}
+        self.custom = {'name': 'Mine'}
+        themes_file.write_text(json.dumps(
+            {'default_dark': self.override, 'mine': self.custom}))
+        self.manager = ThemeManager(themes_file)
+
+    def tearDown(self):
+        """Write any pending save, then remove the temporary directory"""
+        self.manager._flush_themes()
+        self._tmp.cleanup()
+
+    def test_custom_themes_override_presets(self):
+        """Test get_all_themes lets custom themes replace presets"""
+        themes = self.manager.get_all_themes()
+        self.assertEqual(themes['default_dark'], self.override)
+        self.assertEqual(themes['mine'], self.custom)
+        self.assertIn('default_light', themes)
+
+    def test_get_all_themes_returns_copy(self):
+        """Test mutating the result does not change the manager's themes"""
+        self.manager.get_all_themes().pop('mine')
+        self.assertIn('mine', self.manager.get_all_themes())
+
+    def test_cache_refreshed_on_change(self):
+        """Test created and deleted themes show up in get_all_themes"""
+        self.manager.get_all_themes()
+        self.manager.create_custom_theme('new', {'name': 'New'})
+        self.assertIn('new', self.manager.get_all_themes())
+        self.manager.delete_custom_theme('new')
+        self.assertNotIn('new', self.manager.get_all_themes())
+
+
+if __name__ == '__main__':
+    unittest.main()